@@ -1,7 +1,7 @@
 """API endpoints for file downloads from storage."""
 
-from typing import List
-from zipfile import ZipFile
+import json
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
 
 from fastapi import Depends, HTTPException, Query
 from fastapi.responses import FileResponse, StreamingResponse
@@ -11,7 +11,9 @@ from airweave import crud
 from airweave.api import deps
 from airweave.api.context import ApiContext
 from airweave.api.router import TrailingSlashRouter
-from airweave.platform.storage import storage_manager
+from airweave.core.config import settings
+from airweave.platform.storage import StreamingZipWriter, storage_manager
+from airweave.platform.sync.async_helpers import run_in_thread_pool
 
 router = TrailingSlashRouter()
 
@@ -152,6 +154,63 @@ async def get_file_content(
         raise HTTPException(status_code=500, detail="Internal server error") from e
 
 
+def _zip_entry_name(entity_id: str, used_names: Set[str]) -> str:
+    """Name of a file in the batch ZIP: the entity ID suffix, made unique."""
+    file_suffix = entity_id.split(":")[-1] if ":" in entity_id else entity_id
+    name = f"{file_suffix}.md"
+    counter = 1
+    while name in used_names:
+        counter += 1
+        name = f"{file_suffix}_{counter}.md"
+    used_names.add(name)
+    return name
+
+
+async def _stream_batch_zip(
+    ctx: ApiContext,
+    requested: int,
+    first_file: Tuple[str, str],
+    files: AsyncIterator[Tuple[str, Optional[str], Optional[str]]],
+    failures: Dict[str, str],
+) -> AsyncIterator[bytes]:
+    """Write the files to a ZIP as they arrive, ending with a manifest.json entry."""
+    writer = StreamingZipWriter()
+    names: Dict[str, str] = {}
+    used_names: Set[str] = set()
+
+    async def add(entity_id: str, content: str) -> bytes:
+        name = _zip_entry_name(entity_id, used_names)
+        names[entity_id] = name
+        # Compression is CPU work, keep it off the event loop
+        return await run_in_thread_pool(writer.add, name, content)
+
+    try:
+        yield await add(*first_file)
+        async for entity_id, content, error in files:
+            if content is None:
+                failures[entity_id] = error
+                continue
+            yield await add(entity_id, content)
+
+        manifest = {
+            "requested": requested,
+            "succeeded": len(names),
+            "failed": len(failures),
+            "files": names,
+            "failures": [
+                {"entity_id": entity_id, "error": error} for entity_id, error in failures.items()
+            ],
+        }
+        yield writer.add("manifest.json", json.dumps(manifest, indent=2)) + writer.close()
+
+        ctx.logger.info(
+            f"Batch download completed: {len(names)}/{requested} files",
+            extra={"requested": requested, "successful": len(names), "failed": len(failures)},
+        )
+    finally:
+        await files.aclose()
+
+
 @router.post("/batch-download", response_class=StreamingResponse)
 async def download_files_batch(
     *,
@@ -161,6 +220,10 @@ async def download_files_batch(
 ) -> StreamingResponse:
     """Download multiple files as a ZIP archive.
 
+    Files are fetched concurrently (FILE_BATCH_DOWNLOAD_CONCURRENCY) and written to the
+    response as they arrive. The archive ends with a manifest.json listing the file name of
+    each entity ID and the entity IDs that could not be retrieved, with the reason.
+
     Args:
         entity_ids: List of entity IDs to download
         ctx: The current authentication context
@@ -178,63 +241,43 @@ async def download_files_batch(
     if not entity_ids:
         raise HTTPException(status_code=400, detail="No entity IDs provided")
 
-    if len(entity_ids) > 100:
-        raise HTTPException(status_code=400, detail="Maximum 100 files can be downloaded at once")
-
-    try:
-        # Download all files
-        results = await storage_manager.download_ctti_files_batch(
-            ctx.logger, entity_ids, continue_on_error=True
-        )
-
-        # Filter successful downloads
-        successful_downloads = {
-            entity_id: content for entity_id, (content, _) in results.items() if content is not None
-        }
-
-        if not successful_downloads:
-            raise HTTPException(
-                status_code=404, detail="No valid files found for the provided entity IDs"
-            )
-
-        # Create ZIP file in memory
-        import io
-
-        zip_buffer = io.BytesIO()
-
-        with ZipFile(zip_buffer, "w") as zip_file:
-            for entity_id, content in successful_downloads.items():
-                # Extract ID suffix for filename
-                file_suffix = entity_id.split(":")[-1] if ":" in entity_id else entity_id
-                zip_file.writestr(f"{file_suffix}.md", content)
-
-        # Reset buffer position
-        zip_buffer.seek(0)
-
-        # Log summary
-        ctx.logger.info(
-            f"Batch download completed: {len(successful_downloads)}/{len(entity_ids)} files",
-            extra={
-                "requested": len(entity_ids),
-                "successful": len(successful_downloads),
-                "failed": len(entity_ids) - len(successful_downloads),
-            },
+    entity_ids = list(dict.fromkeys(entity_ids))
+    max_files = settings.FILE_BATCH_DOWNLOAD_MAX_FILES
+    if len(entity_ids) > max_files:
+        raise HTTPException(
+            status_code=400, detail=f"Maximum {max_files} files can be downloaded at once"
         )
 
-        return StreamingResponse(
-            io.BytesIO(zip_buffer.read()),
-            media_type="application/zip",
-            headers={
-                "Content-Disposition": (
-                    f'attachment; filename="files_{len(successful_downloads)}.zip"'
-                )
-            },
-        )
+    files = storage_manager.iter_ctti_file_contents(
+        ctx.logger, entity_ids, max_concurrency=settings.FILE_BATCH_DOWNLOAD_CONCURRENCY
+    )
 
+    # Wait for the first file before starting the response, so that a batch without any
+    # retrievable file still gets a 404
+    failures: Dict[str, str] = {}
+    first_file = None
+    try:
+        async for entity_id, content, error in files:
+            if content is not None:
+                first_file = (entity_id, content)
+                break
+            failures[entity_id] = error
     except Exception as e:
+        await files.aclose()
         ctx.logger.error(f"Error in batch download: {e}")
         raise HTTPException(status_code=500, detail="Internal server error") from e
 
+    if first_file is None:
+        raise HTTPException(
+            status_code=404, detail="No valid files found for the provided entity IDs"
+        )
+
+    return StreamingResponse(
+        _stream_batch_zip(ctx, len(entity_ids), first_file, files, failures),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="files_{len(entity_ids)}.zip"'},
+    )
+
 
 @router.get("/", response_model=dict)
 async def check_files_exist(
@@ -35,6 +35,8 @@ class Settings(BaseSettings):
         RUN_ALEMBIC_MIGRATIONS (bool): Whether to run the alembic migrations.
         RUN_DB_SYNC (bool): Whether to run the system sync to process sources,
             destinations, and entity types.
+        FORCE_DB_SYNC (bool): Whether to run the system sync even if the registry
+            fingerprint stored in the database matches the current one.
         REDIS_HOST (str): The Redis server hostname.
         REDIS_PORT (int): The Redis server port.
         REDIS_PASSWORD (Optional[str]): The Redis password (if authentication is enabled).
@@ -50,11 +52,50 @@ class Settings(BaseSettings):
         TEMPORAL_NAMESPACE (str): The namespace of the Temporal server.
         TEMPORAL_TASK_QUEUE (str): The task queue for the Temporal server.
         TEMPORAL_ENABLED (bool): Whether Temporal is enabled.
-        SYNC_MAX_WORKERS (int): The maximum number of workers for sync tasks.
+        SYNC_MAX_WORKERS (int): The number of workers for sync tasks (where tuning starts).
         SYNC_THREAD_POOL_SIZE (int): The size of the thread pool for sync tasks.
         WEB_FETCHER_MAX_CONCURRENT (int): Max concurrent web scraping requests
         OPENAI_MAX_CONCURRENT (int): Max concurrent OpenAI API requests
+        OPENAI_EMBED_COALESCE_MS (float): How long embedding requests wait to be combined
+        OPENAI_EMBED_MAX_TEXTS_PER_REQUEST (int): Max texts per combined embedding request
         CTTI_MAX_CONCURRENT (int): Max concurrent CTTI (ClinicalTrials.gov) requests
+        BM25_POOL_SIZE (int): Worker processes for BM25 sparse encoding (0 uses threads)
+        TEXT2VEC_MAX_CONCURRENT (int): Max concurrent text2vec inference requests
+        TRANSFORM_BACKEND (str): Where conversion and chunking run ("thread" or "process")
+        TRANSFORM_PROCESS_POOL_SIZE (int): Worker processes for the process backend (0 = CPUs)
+        PDF_OCR_MAX_CONCURRENT_BATCHES (int): Page batches of one large PDF OCR'd concurrently
+        CONVERSION_CACHE_ENABLED (bool): Reuse conversion results of unchanged file content
+        CONVERSION_CACHE_MAX_BYTES (int): Size cap of the conversion cache on local disk storage
+        CONVERSION_CACHE_MEMORY_BYTES (int): Size of the in-process conversion cache tier
+        EMBEDDING_CACHE_BACKEND (str): Shared embedding cache tier ("memory", "redis",
+            "postgres" or "none" to disable caching)
+        EMBEDDING_CACHE_MEMORY_BYTES (int): Size of the in-process embedding cache tier
+        EMBEDDING_CACHE_DTYPE (str): Precision of cached vectors ("float32" or "float16")
+        EMBEDDING_CACHE_TTL_SECONDS (int): Expiry of cached vectors in Redis and Postgres
+        ENTITY_HASH_ALGORITHM (str): Digest of entity content hashes: "sha256", "blake2b",
+            "xxh3", "blake3" or "legacy"
+        FILE_BATCH_DOWNLOAD_MAX_FILES (int): Max files per batch download request
+        FILE_BATCH_DOWNLOAD_CONCURRENCY (int): Files fetched from storage concurrently per
+            batch download
+        SYNC_ADAPTIVE_TUNING (bool): Tune batch size and worker count at runtime from latencies
+        SYNC_MIN_BATCH_SIZE (int): Lower bound of the adaptive micro-batch size
+        SYNC_MAX_BATCH_SIZE (int): Upper bound of the adaptive micro-batch size
+        SYNC_MIN_WORKERS (int): Lower bound of the adaptive worker count
+        SYNC_ADAPTIVE_MAX_WORKERS (int): Upper bound of the adaptive worker count (which
+            starts at SYNC_MAX_WORKERS)
+        SYNC_TARGET_BATCH_SECONDS (float): Processing time per micro-batch the tuning aims for
+        SYNC_PIPELINE_QUEUE_SIZE (int): Batches queued in front of each batch pipeline stage
+        SYNC_PIPELINE_LOOKUP_CONCURRENCY (int): Batches hashed and looked up in the DB at once
+        SYNC_PIPELINE_TRANSFORM_CONCURRENCY (int): Batches being transformed (chunked) at once
+        SYNC_PIPELINE_EMBED_CONCURRENCY (int): Batches being embedded at once
+        SYNC_PIPELINE_DB_WRITE_CONCURRENCY (int): Batches written to the database at once
+        SYNC_PIPELINE_VECTOR_WRITE_CONCURRENCY (int): Batches written to destinations at once
+        SYNC_BULK_UPDATE_CHUNK_SIZE (int): Rows per UPDATE statement when bulk updating entity
+            hashes
+        SEARCH_OPERATION_TIMEOUT_SECONDS (float): Default time limit of a search operation
+            (0 disables)
+        SEARCH_COMPLETION_TIMEOUT_SECONDS (float): Time limit of completion generation,
+            streamed or not (0 disables)
         STRIPE_DEVELOPER_MONTHLY: str = ""
         STRIPE_PRO_MONTHLY: str = ""
         STRIPE_TEAM_MONTHLY: str = ""
@@ -107,6 +148,7 @@ class Settings(BaseSettings):
 
     RUN_ALEMBIC_MIGRATIONS: bool = True
     RUN_DB_SYNC: bool = True
+    FORCE_DB_SYNC: bool = False
 
     # Redis configuration
     REDIS_HOST: str = "localhost"
@@ -164,7 +206,43 @@ class Settings(BaseSettings):
     SYNC_THREAD_POOL_SIZE: int = 100
     WEB_FETCHER_MAX_CONCURRENT: int = 10  # Max concurrent web scraping requests
     OPENAI_MAX_CONCURRENT: int = 20  # Max concurrent OpenAI API requests
+    OPENAI_EMBED_COALESCE_MS: float = 5.0  # Linger to combine concurrent embedding calls
+    OPENAI_EMBED_MAX_TEXTS_PER_REQUEST: int = 512  # API limit is 2048
     CTTI_MAX_CONCURRENT: int = 3  # Max concurrent CTTI (ClinicalTrials.gov) requests
+    BM25_POOL_SIZE: int = 2  # Worker processes for BM25 sparse encoding (0 uses threads)
+    TEXT2VEC_MAX_CONCURRENT: int = 16  # Max concurrent text2vec inference requests
+    TRANSFORM_BACKEND: str = "thread"  # "thread" or "process" for conversion and chunking
+    TRANSFORM_PROCESS_POOL_SIZE: int = 0  # Worker processes for the process backend (0 = CPUs)
+    PDF_OCR_MAX_CONCURRENT_BATCHES: int = 4  # Page batches of one large PDF OCR'd concurrently
+    CONVERSION_CACHE_ENABLED: bool = True  # Reuse conversion results of unchanged file content
+    CONVERSION_CACHE_MAX_BYTES: int = 10 * 1024**3  # Size cap on local disk storage
+    CONVERSION_CACHE_MEMORY_BYTES: int = 64 * 1024**2  # In-process tier in front of storage
+    EMBEDDING_CACHE_BACKEND: str = "memory"  # "memory", "redis", "postgres" or "none"
+    EMBEDDING_CACHE_MEMORY_BYTES: int = 128 * 1024**2  # In-process tier in front of the backend
+    EMBEDDING_CACHE_DTYPE: str = "float32"  # "float16" halves storage at a small precision cost
+    EMBEDDING_CACHE_TTL_SECONDS: int = 30 * 24 * 3600
+    ENTITY_HASH_ALGORITHM: str = "sha256"
+    FILE_BATCH_DOWNLOAD_MAX_FILES: int = 1000
+    FILE_BATCH_DOWNLOAD_CONCURRENCY: int = 8
+    SYNC_ADAPTIVE_TUNING: bool = True  # Tune batch size and workers from observed latencies
+    SYNC_MIN_BATCH_SIZE: int = 8
+    SYNC_MAX_BATCH_SIZE: int = 512
+    SYNC_MIN_WORKERS: int = 4
+    SYNC_ADAPTIVE_MAX_WORKERS: int = 200  # Tuning starts at SYNC_MAX_WORKERS and may grow to this
+    SYNC_TARGET_BATCH_SECONDS: float = 5.0
+    # Stages of the batch pipeline (see platform/sync/batch_pipeline.py)
+    SYNC_PIPELINE_QUEUE_SIZE: int = 4
+    SYNC_PIPELINE_LOOKUP_CONCURRENCY: int = 8
+    SYNC_PIPELINE_TRANSFORM_CONCURRENCY: int = 32
+    SYNC_PIPELINE_EMBED_CONCURRENCY: int = 16
+    SYNC_PIPELINE_DB_WRITE_CONCURRENCY: int = 8
+    SYNC_PIPELINE_VECTOR_WRITE_CONCURRENCY: int = 8
+    SYNC_BULK_UPDATE_CHUNK_SIZE: int = 5000  # Rows per bulk entity hash UPDATE statement
+
+    # Search configuration
+    SEARCH_OPERATION_TIMEOUT_SECONDS: float = 120.0  # Per search operation (0 disables)
+    # Completion generation, streamed or not, may take far longer than the other operations
+    SEARCH_COMPLETION_TIMEOUT_SECONDS: float = 600.0  # 0 disables
 
     # Custom deployment URLs - these are used to override the default URLs to allow
     # for custom domains in custom deployments
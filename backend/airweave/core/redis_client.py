@@ -17,6 +17,7 @@ class RedisClient:
         """Initialize Redis clients with separate pools."""
         self._client: Optional[redis.Redis] = None
         self._pubsub_client: Optional[redis.Redis] = None
+        self._binary_client: Optional[redis.Redis] = None
 
     @property
     def client(self) -> redis.Redis:
@@ -32,6 +33,13 @@ class RedisClient:
             self._pubsub_client = self._create_client(max_connections=100)
         return self._pubsub_client
 
+    @property
+    def binary_client(self) -> redis.Redis:
+        """Get or create a Redis client that returns raw bytes (e.g. packed vectors)."""
+        if self._binary_client is None:
+            self._binary_client = self._create_client(max_connections=50, decode_responses=False)
+        return self._binary_client
+
     def _get_socket_keepalive_options(self) -> dict:
         """Get socket keepalive options based on the OS.
 
@@ -56,7 +64,9 @@ class RedisClient:
                 # Fallback for systems without these constants
                 return {}
 
-    def _create_client(self, max_connections: int = 50) -> redis.Redis:
+    def _create_client(
+        self, max_connections: int = 50, decode_responses: bool = True
+    ) -> redis.Redis:
         """Create a Redis client with specified connection pool size."""
         # Create connection pool with proper configuration
         pool = redis.ConnectionPool(
@@ -64,7 +74,7 @@ class RedisClient:
             port=settings.REDIS_PORT,
             db=settings.REDIS_DB,
             password=settings.REDIS_PASSWORD if settings.REDIS_PASSWORD else None,
-            decode_responses=True,
+            decode_responses=decode_responses,
             max_connections=max_connections,
             retry_on_timeout=True,
             socket_keepalive=True,
@@ -108,6 +118,8 @@ class RedisClient:
             await self._client.close()
         if self._pubsub_client:
             await self._pubsub_client.close()
+        if self._binary_client:
+            await self._binary_client.close()
 
 
 # Create a global instance
@@ -1,21 +1,22 @@
 """CRUD operations for entities."""
 
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import func, select, update
+from sqlalchemy import Row, String, column, func, select, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from airweave.api.context import ApiContext
+from airweave.core.config import settings
 from airweave.core.exceptions import NotFoundException
 from airweave.crud._base_organization import CRUDBaseOrganization
 from airweave.db.unit_of_work import UnitOfWork
 from airweave.models.entity import Entity
 from airweave.schemas.entity import EntityCreate, EntityUpdate
 
-
 class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
     """CRUD operations for entities."""
 
@@ -77,6 +78,7 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
                 "sync_job_id": stmt.excluded.sync_job_id,
                 "entity_definition_id": stmt.excluded.entity_definition_id,
                 "hash": stmt.excluded.hash,
+                "version_fingerprint": stmt.excluded.version_fingerprint,
                 "modified_at": stmt.excluded.modified_at,
             },
         ).returning(Entity)
@@ -202,6 +204,7 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
                 "sync_job_id": stmt.excluded.sync_job_id,
                 "entity_definition_id": stmt.excluded.entity_definition_id,
                 "hash": stmt.excluded.hash,
+                "version_fingerprint": stmt.excluded.version_fingerprint,
                 "modified_at": stmt.excluded.modified_at,
                 # Keep the original organization_id to prevent cross-org updates
                 # organization_id is not updated on conflict
@@ -223,21 +226,47 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
         self,
         db: AsyncSession,
         *,
-        rows: list[tuple[UUID, str]],
+        rows: list[tuple[UUID, str, Optional[str]]],
+        sync_job_id: Optional[UUID] = None,
+        chunk_size: Optional[int] = None,
     ) -> None:
-        """Bulk update the 'hash' field for many entities.
+        """Bulk update the 'hash' and 'version_fingerprint' fields for many entities.
+
+        Each chunk is a single ``UPDATE entity SET ... FROM (VALUES ...)`` statement
+        instead of one round-trip per row.
 
         Args:
             db: The async database session.
-            rows: list of tuples (entity_db_id, new_hash)
+            rows: list of tuples (entity_db_id, new_hash, new_version_fingerprint)
+            sync_job_id: Optional sync job ID to stamp on the updated rows
+            chunk_size: Max rows per statement (keeps bind parameters within driver limits);
+                defaults to SYNC_BULK_UPDATE_CHUNK_SIZE
         """
         if not rows:
             return
-        for entity_db_id, new_hash in rows:
+        chunk_size = chunk_size or settings.SYNC_BULK_UPDATE_CHUNK_SIZE
+
+        modified_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        set_values = {"modified_at": modified_at}
+        if sync_job_id is not None:
+            set_values["sync_job_id"] = sync_job_id
+
+        for start in range(0, len(rows), chunk_size):
+            new_hashes = values(
+                column("id", PG_UUID(as_uuid=True)),
+                column("hash", String),
+                column("version_fingerprint", String),
+                name="new_hashes",
+            ).data(rows[start : start + chunk_size])
             stmt = (
                 update(Entity)
-                .where(Entity.id == entity_db_id)
-                .values(hash=new_hash, modified_at=datetime.now(timezone.utc).replace(tzinfo=None))
+                .where(Entity.id == new_hashes.c.id)
+                .values(
+                    hash=new_hashes.c.hash,
+                    version_fingerprint=new_hashes.c.version_fingerprint,
+                    **set_values,
+                )
+                .execution_options(synchronize_session=False)
             )
             await db.execute(stmt)
 
@@ -309,5 +338,47 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
         result = await db.execute(stmt)
         return list(result.unique().scalars().all())
 
+    async def get_version_fingerprints_by_sync_id(
+        self,
+        db: AsyncSession,
+        sync_id: UUID,
+        page_size: int = 5000,
+    ) -> dict[str, str]:
+        """Get entity_id -> version_fingerprint for all entities of a sync that have one."""
+        stmt = (
+            select(Entity.entity_id, Entity.version_fingerprint)
+            .where(Entity.sync_id == sync_id, Entity.version_fingerprint.is_not(None))
+            .execution_options(yield_per=page_size)
+        )
+        result = await db.stream(stmt)
+        fingerprints: dict[str, str] = {}
+        async for page in result.partitions(page_size):
+            fingerprints.update((row.entity_id, row.version_fingerprint) for row in page)
+        return fingerprints
+
+    async def get_keys_page_by_sync_id(
+        self,
+        db: AsyncSession,
+        sync_id: UUID,
+        after_id: Optional[UUID] = None,
+        limit: int = 5000,
+    ) -> Sequence[Row]:
+        """Get one page of (id, entity_id, entity_definition_id) rows for a sync.
+
+        Pages are ordered by id and continue after ``after_id`` (keyset pagination), so
+        callers can delete rows of earlier pages between calls without skipping any, and
+        need not hold a connection open across pages.
+        """
+        stmt = (
+            select(Entity.id, Entity.entity_id, Entity.entity_definition_id)
+            .where(Entity.sync_id == sync_id)
+            .order_by(Entity.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            stmt = stmt.where(Entity.id > after_id)
+        result = await db.execute(stmt)
+        return result.all()
+
 
 entity = CRUDEntity()
@@ -8,6 +8,7 @@ from .connection import Connection
 from .connection_init_session import ConnectionInitSession
 from .dag import DagEdge, DagNode, SyncDag
 from .destination import Destination
+from .embedding_cache import EmbeddingCacheEntry
 from .embedding_model import EmbeddingModel
 from .entity import Entity
 from .entity_count import EntityCount
@@ -17,6 +18,7 @@ from .integration_credential import IntegrationCredential
 from .organization import Organization
 from .organization_billing import OrganizationBilling
 from .pg_field_catalog import PgFieldCatalogColumn, PgFieldCatalogTable
+from .platform_sync_state import PlatformSyncState
 from .redirect_session import RedirectSession
 from .search_query import SearchQuery
 from .source import Source
@@ -42,6 +44,7 @@ __all__ = [
     "DagEdge",
     "DagNode",
     "Destination",
+    "EmbeddingCacheEntry",
     "EmbeddingModel",
     "EntityDefinition",
     "EntityRelation",
@@ -50,6 +53,7 @@ __all__ = [
     "OrganizationBilling",
     "PgFieldCatalogColumn",
     "PgFieldCatalogTable",
+    "PlatformSyncState",
     "RedirectSession",
     "SearchQuery",
     "Source",
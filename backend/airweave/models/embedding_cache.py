@@ -0,0 +1,27 @@
+"""Embedding cache model."""
+
+from sqlalchemy import Index, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from airweave.models._base import Base
+
+
+class EmbeddingCacheEntry(Base):
+    """A cached dense embedding (see platform/embedding_models/_cache.py)."""
+
+    __tablename__ = "embedding_cache"
+
+    __table_args__ = (
+        # Expired rows are found by age (see PostgresEmbeddingCacheBackend.purge_expired)
+        Index("idx_embedding_cache_created_at", "created_at"),
+    )
+
+    cache_key: Mapped[str] = mapped_column(
+        String,
+        nullable=False,
+        unique=True,
+        comment="Model, dimensions and SHA-256 of the embedded text",
+    )
+    vector: Mapped[bytes] = mapped_column(
+        LargeBinary, nullable=False, comment="Little-endian float32 or float16 vector"
+    )
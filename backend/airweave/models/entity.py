@@ -34,6 +34,11 @@ class Entity(OrganizationBase):
         comment="Entity definition this entity belongs to",
     )
     hash: Mapped[str] = mapped_column(String, nullable=False)
+    version_fingerprint: Mapped[Optional[str]] = mapped_column(
+        String,
+        nullable=True,
+        comment="Source-provided version fingerprint used to skip unchanged downloads",
+    )
 
     # Add back references
     sync_job: Mapped["SyncJob"] = relationship(
@@ -0,0 +1,22 @@
+"""Platform sync state model."""
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from airweave.models._base import Base
+
+
+class PlatformSyncState(Base):
+    """Fingerprint of the platform components last synced to the database.
+
+    See platform/registry.py.
+    """
+
+    __tablename__ = "platform_sync_state"
+
+    name: Mapped[str] = mapped_column(
+        String, nullable=False, unique=True, comment="What was synced, e.g. platform_components"
+    )
+    fingerprint: Mapped[str] = mapped_column(
+        String, nullable=False, comment="Content fingerprint of the synced registry manifest"
+    )
@@ -5,6 +5,7 @@ import importlib
 import inspect
 import os
 import re
+from pathlib import Path
 from typing import Callable, Dict, Type, Union
 from uuid import UUID
 
@@ -12,11 +13,24 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing_extensions import get_type_hints
 
 from airweave import crud, schemas
+from airweave.core.config import settings
 from airweave.core.logging import logger
 from airweave.models.entity_definition import EntityType
 from airweave.platform.auth_providers._base import BaseAuthProvider
 from airweave.platform.destinations._base import BaseDestination
 from airweave.platform.embedding_models._base import BaseEmbeddingModel
+from airweave.platform.entities._base import ensure_file_entity_models
+from airweave.platform.registry import (
+    MANIFEST_PATH,
+    RUNTIME_MANIFEST_PATH,
+    RegistryManifest,
+    TransformerDefinition,
+    compute_source_fingerprint,
+    get_synced_fingerprint,
+    load_manifest,
+    set_synced_fingerprint,
+    write_manifest,
+)
 from airweave.platform.sources._base import BaseSource
 
 sync_logger = logger.with_prefix("Platform sync: ").with_context(component="platform_sync")
@@ -317,15 +331,17 @@ def _get_entity_schema_with_direct_fields_only(cls: Type) -> dict:
     return filtered_schema
 
 
-async def _sync_embedding_models(db: AsyncSession, models: list[Type[BaseEmbeddingModel]]) -> None:
-    """Sync embedding models with the database.
+def _embedding_model_definitions(
+    models: list[Type[BaseEmbeddingModel]],
+) -> list[schemas.EmbeddingModelCreate]:
+    """Build the definitions of embedding models.
 
     Args:
-        db (AsyncSession): Database session
         models (list[Type[BaseEmbeddingModel]]): List of embedding model classes
-    """
-    sync_logger.info("Syncing embedding models to database.")
 
+    Returns:
+        list[schemas.EmbeddingModelCreate]: Embedding model definitions
+    """
     model_definitions = []
     for model_class in models:
         model_def = schemas.EmbeddingModelCreate(
@@ -339,24 +355,18 @@ async def _sync_embedding_models(db: AsyncSession, models: list[Type[BaseEmbeddi
             auth_config_class=getattr(model_class, "_auth_config_class", None),
         )
         model_definitions.append(model_def)
-
-    await crud.embedding_model.sync(db, model_definitions)
-    sync_logger.info(f"Synced {len(model_definitions)} embedding models to database.")
+    return model_definitions
 
 
-async def _sync_entity_definitions(db: AsyncSession) -> Dict[str, dict]:
-    """Sync entity definitions with the database based on chunk classes.
-
-    Args:
-        db (AsyncSession): Database session
+def _entity_definitions() -> list[schemas.EntityDefinitionCreate]:
+    """Build the definitions of all entities based on chunk classes.
 
     Returns:
-        Dict[str, dict]: Mapping of module names to their entity details:
-            - entity_ids: list[str] - UUIDs of entity definitions for this module
-            - entity_classes: list[str] - Full class names of the entities in this module
-    """
-    sync_logger.info("Syncing entity definitions to database.")
+        list[schemas.EntityDefinitionCreate]: Entity definitions
 
+    Raises:
+        ValueError: If two entities share a name or an entity field lacks a description
+    """
     # Get all Python files in the entities directory that aren't base or init files
     entity_files = [
         f
@@ -368,16 +378,9 @@ async def _sync_entity_definitions(db: AsyncSession) -> Dict[str, dict]:
 
     entity_definitions = []
     entity_registry = {}  # Track all entities system-wide
-    module_registry = {}  # Track entities by module
 
     for entity_file in entity_files:
         module_name = entity_file[:-3]  # Remove .py extension
-        # Initialize module entry if not exists
-        if module_name not in module_registry:
-            module_registry[module_name] = {
-                "entity_classes": [],
-                "entity_names": [],
-            }
 
         # Import the module to get its chunk classes
         full_module_name = f"airweave.platform.entities.{module_name}"
@@ -408,12 +411,6 @@ async def _sync_entity_definitions(db: AsyncSession) -> Dict[str, dict]:
                     "module": module_name,
                 }
 
-                # Add to module registry
-                module_registry[module_name]["entity_classes"].append(
-                    f"{cls.__module__}.{cls.__name__}"
-                )
-                module_registry[module_name]["entity_names"].append(name)
-
                 # Create entity definition with filtered schema
                 entity_def = schemas.EntityDefinitionCreate(
                     name=name,
@@ -427,39 +424,45 @@ async def _sync_entity_definitions(db: AsyncSession) -> Dict[str, dict]:
                 )
                 entity_definitions.append(entity_def)
 
-    # Sync entities
+    return entity_definitions
+
+
+async def _sync_entity_definitions(
+    db: AsyncSession, entity_definitions: list[schemas.EntityDefinitionCreate]
+) -> Dict[str, str]:
+    """Sync entity definitions with the database.
+
+    Args:
+        db (AsyncSession): Database session
+        entity_definitions (list[schemas.EntityDefinitionCreate]): Entity definitions
+
+    Returns:
+        Dict[str, str]: Mapping of entity names to the IDs of their definitions
+    """
+    sync_logger.info("Syncing entity definitions to database.")
+
     await crud.entity_definition.sync(db, entity_definitions, unique_field="name")
 
     # Get all entities to build the mapping
     all_entities = await crud.entity_definition.get_all(db)
 
-    # Create a mapping of entity names to their IDs
-    entity_id_map = {e.name: str(e.id) for e in all_entities}
-
-    # Add entity IDs to the module registry
-    for module_name, module_info in module_registry.items():
-        entity_ids = [
-            entity_id_map[name] for name in module_info["entity_names"] if name in entity_id_map
-        ]
-        module_registry[module_name]["entity_ids"] = entity_ids
-
     sync_logger.info(f"Synced {len(entity_definitions)} entity definitions to database.")
-    return module_registry
+    return {e.name: str(e.id) for e in all_entities}
 
 
-async def _sync_sources(
-    db: AsyncSession, sources: list[Type[BaseSource]], module_entity_map: Dict[str, dict]
-) -> None:
-    """Sync sources with the database.
+def _source_definitions(sources: list[Type[BaseSource]]) -> list[schemas.SourceCreate]:
+    """Build the definitions of sources.
+
+    Output entity definition IDs are left empty; they are assigned on sync.
 
     Args:
     -----
-        db (AsyncSession): Database session
         sources (list[Type[BaseSource]]): List of source classes
-        module_entity_map (Dict[str, dict]): Mapping of module names to entity definitions
-    """
-    sync_logger.info("Syncing sources to database.")
 
+    Returns:
+    --------
+        list[schemas.SourceCreate]: Source definitions
+    """
     source_definitions = []
     for source_class in sources:
         # Get the source's short name (e.g., "slack" for SlackSource)
@@ -473,13 +476,6 @@ async def _sync_sources(
             sync_logger.error(f"Template validation failed for {source_module_name}")
             raise
 
-        # Get entity IDs for this module
-        output_entity_ids = []
-        if source_module_name in module_entity_map:
-            output_entity_ids = [
-                UUID(id) for id in module_entity_map[source_module_name].get("entity_ids", [])
-            ]
-
         # Convert oauth_type enum to string if present
         oauth_type = getattr(source_class, "_oauth_type", None)
         if oauth_type:
@@ -495,25 +491,25 @@ async def _sync_sources(
             config_class=source_class._config_class,
             short_name=source_class._short_name,
             class_name=source_class.__name__,
-            output_entity_definition_ids=output_entity_ids,
+            output_entity_definition_ids=[],
             labels=getattr(source_class, "_labels", []),
             supports_continuous=getattr(source_class, "_supports_continuous", False),
         )
         source_definitions.append(source_def)
-
-    await crud.source.sync(db, source_definitions)
-    sync_logger.info(f"Synced {len(source_definitions)} sources to database.")
+    return source_definitions
 
 
-async def _sync_destinations(db: AsyncSession, destinations: list[Type[BaseDestination]]) -> None:
-    """Sync destinations with the database.
+def _destination_definitions(
+    destinations: list[Type[BaseDestination]],
+) -> list[schemas.DestinationCreate]:
+    """Build the definitions of destinations.
 
     Args:
-        db (AsyncSession): Database session
         destinations (list[Type[BaseDestination]]): List of destination classes
-    """
-    sync_logger.info("Syncing destinations to database.")
 
+    Returns:
+        list[schemas.DestinationCreate]: Destination definitions
+    """
     destination_definitions = []
     for dest_class in destinations:
         dest_def = schemas.DestinationCreate(
@@ -525,22 +521,20 @@ async def _sync_destinations(db: AsyncSession, destinations: list[Type[BaseDesti
             labels=getattr(dest_class, "_labels", []),
         )
         destination_definitions.append(dest_def)
+    return destination_definitions
 
-    await crud.destination.sync(db, destination_definitions)
-    sync_logger.info(f"Synced {len(destination_definitions)} destinations to database.")
 
-
-async def _sync_auth_providers(
-    db: AsyncSession, auth_providers: list[Type[BaseAuthProvider]]
-) -> None:
-    """Sync auth providers with the database.
+def _auth_provider_definitions(
+    auth_providers: list[Type[BaseAuthProvider]],
+) -> list[schemas.AuthProviderCreate]:
+    """Build the definitions of auth providers.
 
     Args:
-        db (AsyncSession): Database session
         auth_providers (list[Type[BaseAuthProvider]]): List of auth provider classes
-    """
-    sync_logger.info("Syncing auth providers to database.")
 
+    Returns:
+        list[schemas.AuthProviderCreate]: Auth provider definitions
+    """
     auth_provider_definitions = []
     for auth_provider_class in auth_providers:
         auth_provider_def = schemas.AuthProviderCreate(
@@ -552,9 +546,7 @@ async def _sync_auth_providers(
             config_class=getattr(auth_provider_class, "_config_class", None),
         )
         auth_provider_definitions.append(auth_provider_def)
-
-    await crud.auth_provider.sync(db, auth_provider_definitions)
-    sync_logger.info(f"Synced {len(auth_provider_definitions)} auth providers to database.")
+    return auth_provider_definitions
 
 
 def _get_type_names(type_hint) -> list[str]:
@@ -586,53 +578,17 @@ def _get_type_names(type_hint) -> list[str]:
     return [type_hint.__name__]
 
 
-def _build_entity_mappings(module_entity_map: Dict[str, dict]) -> tuple[dict, dict]:
-    """Build mappings from class names and entity names to entity IDs.
-
-    Args:
-        module_entity_map: Mapping of module names to their entity details
-
-    Returns:
-        tuple: (entity_class_to_id_map, entity_name_to_id_map)
-    """
-    # Create a reverse mapping from class name to entity ID
-    entity_class_to_id_map = {}
-    # Create a mapping from entity name to entity ID
-    entity_name_to_id_map = {}
-
-    for module_info in module_entity_map.values():
-        for i, name in enumerate(module_info.get("entity_names", [])):
-            if i < len(module_info.get("entity_ids", [])):
-                if name not in entity_name_to_id_map:
-                    entity_name_to_id_map[name] = []
-                entity_name_to_id_map[name].append(module_info["entity_ids"][i])
-
-        for i, class_name in enumerate(module_info.get("entity_classes", [])):
-            entity_name = module_info["entity_names"][i]
-            # Find the entity ID for this class
-            for entity_id in module_info.get("entity_ids", []):
-                if (
-                    entity_name
-                    == module_info["entity_names"][module_info["entity_classes"].index(class_name)]
-                ):
-                    if class_name not in entity_class_to_id_map:
-                        entity_class_to_id_map[class_name] = []
-                    entity_class_to_id_map[class_name].append(entity_id)
-
-    return entity_class_to_id_map, entity_name_to_id_map
-
-
 def _create_transformer_definition(
-    transformer_func: Callable, entity_name_to_id_map: dict
-) -> schemas.TransformerCreate:
+    transformer_func: Callable, entity_names: set[str]
+) -> TransformerDefinition:
     """Create a transformer definition from a transformer function.
 
     Args:
         transformer_func: The transformer function
-        entity_name_to_id_map: Mapping from entity names to entity IDs
+        entity_names: Names of all registered entities
 
     Returns:
-        schemas.TransformerCreate: The transformer definition
+        TransformerDefinition: The transformer definition, with its entity types by name
     """
     # Get type hints for input/output
     type_hints = get_type_hints(transformer_func)
@@ -653,9 +609,9 @@ def _create_transformer_definition(
         "WebEntity",
     ]
     # For input types
-    input_entity_ids = []
-    if input_type_name in entity_name_to_id_map:
-        input_entity_ids = [UUID(id) for id in entity_name_to_id_map[input_type_name]]
+    input_entity_names = []
+    if input_type_name in entity_names:
+        input_entity_names = [input_type_name]
     elif input_type_name in base_types:
         # For base types, we don't require entity IDs since they're not directly registered
         # as entity definitions (they're abstract base classes)
@@ -672,10 +628,10 @@ def _create_transformer_definition(
     output_types = _get_type_names(return_type)
 
     # For output types
-    output_entity_ids = []
+    output_entity_names = []
     for type_name in output_types:
-        if type_name in entity_name_to_id_map:
-            output_entity_ids.extend([UUID(id) for id in entity_name_to_id_map[type_name]])
+        if type_name in entity_names:
+            output_entity_names.append(type_name)
         elif type_name in base_types:
             # For base types, don't add entity IDs but don't error either
             sync_logger.info(
@@ -686,37 +642,153 @@ def _create_transformer_definition(
                 f"Transformer {transformer_func._name} has unknown output type {type_name}"
             )
 
-    return schemas.TransformerCreate(
-        name=transformer_func._name,
-        description=transformer_func.__doc__,
-        method_name=transformer_func.__name__,
-        module_name=transformer_func.__module__,
-        config_schema=getattr(transformer_func, "_config_schema", {}),
-        input_entity_definition_ids=input_entity_ids,
-        output_entity_definition_ids=output_entity_ids,
+    return TransformerDefinition(
+        definition=schemas.TransformerCreate(
+            name=transformer_func._name,
+            description=transformer_func.__doc__,
+            method_name=transformer_func.__name__,
+            module_name=transformer_func.__module__,
+            config_schema=getattr(transformer_func, "_config_schema", {}),
+            input_entity_definition_ids=[],
+            output_entity_definition_ids=[],
+        ),
+        input_entity_names=input_entity_names,
+        output_entity_names=output_entity_names,
+    )
+
+
+def build_registry_manifest(platform_dir: str) -> RegistryManifest:
+    """Scan the platform directory and build the manifest of all components.
+
+    This imports every component module.
+
+    Args:
+        platform_dir (str): Directory containing platform components
+
+    Returns:
+        RegistryManifest: The manifest, with both fingerprints set
+    """
+    source_fingerprint = compute_source_fingerprint(Path(platform_dir))
+
+    # Ensure all FileEntity subclasses have their parent and chunk models created
+    ensure_file_entity_models()
+    components = _get_decorated_classes(platform_dir)
+    c = components
+
+    # Log component counts to help diagnose issues
+    sync_logger.info(
+        f"Found {len(c['sources'])} sources, {len(c['destinations'])} destinations, "
+        f"{len(c['embedding_models'])} embedding models, {len(c['auth_providers'])} "
+        f"auth providers, {len(c['transformers'])} transformers."
+    )
+
+    entity_definitions = _entity_definitions()
+    entity_names = {definition.name for definition in entity_definitions}
+
+    # Sort everything so the fingerprint does not depend on file system order
+    manifest = RegistryManifest(
+        source_fingerprint=source_fingerprint,
+        entity_definitions=sorted(entity_definitions, key=lambda d: d.name),
+        embedding_models=sorted(
+            _embedding_model_definitions(c["embedding_models"]), key=lambda d: d.short_name
+        ),
+        sources=sorted(_source_definitions(c["sources"]), key=lambda d: d.short_name),
+        destinations=sorted(
+            _destination_definitions(c["destinations"]), key=lambda d: d.short_name
+        ),
+        auth_providers=sorted(
+            _auth_provider_definitions(c["auth_providers"]), key=lambda d: d.short_name
+        ),
+        transformers=sorted(
+            [_create_transformer_definition(func, entity_names) for func in c["transformers"]],
+            key=lambda t: (t.definition.module_name, t.definition.method_name),
+        ),
     )
+    manifest.fingerprint = manifest.compute_fingerprint()
+    return manifest
 
 
-async def _sync_transformers(
-    db: AsyncSession, transformers: list[Callable], module_entity_map: Dict[str, dict]
-) -> None:
-    """Sync transformers with the database.
+def get_registry_manifest(platform_dir: str) -> RegistryManifest:
+    """Get the manifest of the platform components.
+
+    The build-time manifest in the package, or else the runtime copy of an earlier scan, is
+    used if it matches the source tree. Otherwise the components are scanned and the runtime
+    copy is written for the next start, if possible.
+
+    Args:
+        platform_dir (str): Directory containing platform components
+
+    Returns:
+        RegistryManifest: The manifest
+    """
+    source_fingerprint = compute_source_fingerprint(Path(platform_dir))
+    for path in (Path(platform_dir) / MANIFEST_PATH.name, RUNTIME_MANIFEST_PATH):
+        manifest = load_manifest(source_fingerprint, path)
+        if manifest is not None:
+            sync_logger.info(f"Using generated registry manifest {path}.")
+            return manifest
+
+    manifest = build_registry_manifest(platform_dir)
+    write_manifest(manifest, RUNTIME_MANIFEST_PATH)
+    return manifest
+
+
+async def _sync_manifest(db: AsyncSession, manifest: RegistryManifest) -> None:
+    """Sync the definitions of a manifest with the database.
 
     Args:
         db (AsyncSession): Database session
-        transformers (list[Callable]): List of transformer functions
-        module_entity_map (Dict[str, dict]): Mapping of module names to their entity details
+        manifest (RegistryManifest): The manifest
     """
-    sync_logger.info("Syncing transformers to database.")
+    # First sync entities to get their IDs
+    entity_name_to_id = await _sync_entity_definitions(db, manifest.entity_definitions)
+    module_entity_ids: Dict[str, list[UUID]] = {}
+    for definition in manifest.entity_definitions:
+        if definition.name in entity_name_to_id:
+            module_entity_ids.setdefault(definition.module_name, []).append(
+                UUID(entity_name_to_id[definition.name])
+            )
 
-    # Build entity mappings
-    _, entity_name_to_id_map = _build_entity_mappings(module_entity_map)
+    sync_logger.info("Syncing embedding models to database.")
+    await crud.embedding_model.sync(db, manifest.embedding_models)
+    sync_logger.info(f"Synced {len(manifest.embedding_models)} embedding models to database.")
 
-    # Create transformer definitions
-    transformer_definitions = [
-        _create_transformer_definition(func, entity_name_to_id_map) for func in transformers
+    sync_logger.info("Syncing sources to database.")
+    source_definitions = [
+        source.model_copy(
+            update={"output_entity_definition_ids": module_entity_ids.get(source.short_name, [])}
+        )
+        for source in manifest.sources
     ]
+    await crud.source.sync(db, source_definitions)
+    sync_logger.info(f"Synced {len(source_definitions)} sources to database.")
+
+    sync_logger.info("Syncing destinations to database.")
+    await crud.destination.sync(db, manifest.destinations)
+    sync_logger.info(f"Synced {len(manifest.destinations)} destinations to database.")
+
+    sync_logger.info("Syncing auth providers to database.")
+    await crud.auth_provider.sync(db, manifest.auth_providers)
+    sync_logger.info(f"Synced {len(manifest.auth_providers)} auth providers to database.")
 
+    sync_logger.info("Syncing transformers to database.")
+    transformer_definitions = [
+        transformer.definition.model_copy(
+            update={
+                "input_entity_definition_ids": [
+                    entity_name_to_id[name]
+                    for name in transformer.input_entity_names
+                    if name in entity_name_to_id
+                ],
+                "output_entity_definition_ids": [
+                    entity_name_to_id[name]
+                    for name in transformer.output_entity_names
+                    if name in entity_name_to_id
+                ],
+            }
+        )
+        for transformer in manifest.transformers
+    ]
     await crud.transformer.sync(db, transformer_definitions, unique_field="method_name")
     sync_logger.info(f"Synced {len(transformer_definitions)} transformers to database.")
 
@@ -724,6 +796,9 @@ async def _sync_transformers(
 async def sync_platform_components(platform_dir: str, db: AsyncSession) -> None:
     """Sync all platform components with the database.
 
+    Skipped if the database already holds the components of the current manifest (unless
+    FORCE_DB_SYNC is set).
+
     Args:
         platform_dir (str): Directory containing platform components
         db (AsyncSession): Database session
@@ -735,24 +810,18 @@ async def sync_platform_components(platform_dir: str, db: AsyncSession) -> None:
     sync_logger.info("Starting platform components sync...")
 
     try:
-        components = _get_decorated_classes(platform_dir)
-        c = components
+        manifest = get_registry_manifest(platform_dir)
 
-        # Log component counts to help diagnose issues
-        sync_logger.info(
-            f"Found {len(c['sources'])} sources, {len(c['destinations'])} destinations, "
-            f"{len(c['embedding_models'])} embedding models, {len(c['auth_providers'])} "
-            f"auth providers, {len(c['transformers'])} transformers."
-        )
-
-        # First sync entities to get their IDs
-        module_entity_map = await _sync_entity_definitions(db)
+        synced_fingerprint = await get_synced_fingerprint(db)
+        if synced_fingerprint == manifest.fingerprint and not settings.FORCE_DB_SYNC:
+            sync_logger.info(
+                f"Platform components are up to date (fingerprint {manifest.fingerprint[:12]}), "
+                "skipping sync."
+            )
+            return
 
-        await _sync_embedding_models(db, components["embedding_models"])
-        await _sync_sources(db, components["sources"], module_entity_map)
-        await _sync_destinations(db, components["destinations"])
-        await _sync_auth_providers(db, components["auth_providers"])
-        await _sync_transformers(db, components["transformers"], module_entity_map)
+        await _sync_manifest(db, manifest)
+        await set_synced_fingerprint(db, manifest.fingerprint)
 
         sync_logger.info("Platform components sync completed successfully.")
     except ImportError as e:
@@ -325,12 +325,6 @@ class QdrantDestination(VectorDBDestination):
         if not entity.airweave_system_metadata.db_entity_id:
             raise ValueError(f"Entity {entity.entity_id} has no db_entity_id in system metadata")
 
-        # Remove vectors from payload (store them only in vector fields)
-        if "airweave_system_metadata" in data_object and isinstance(
-            data_object["airweave_system_metadata"], dict
-        ):
-            data_object["airweave_system_metadata"].pop("vectors", None)
-
         # Add tenant metadata for filtering
         data_object["airweave_collection_id"] = str(self.collection_id)
 
@@ -352,7 +346,11 @@ class QdrantDestination(VectorDBDestination):
             points=[
                 rest.PointStruct(
                     id=point_id,
-                    vector={DEFAULT_VECTOR_NAME: entity.airweave_system_metadata.vectors[0]}
+                    vector={
+                        DEFAULT_VECTOR_NAME: self._dense_vector(
+                            entity.airweave_system_metadata.vectors[0]
+                        )
+                    }
                     | sparse_part,
                     payload=data_object,
                 )
@@ -361,6 +359,15 @@ class QdrantDestination(VectorDBDestination):
         )
 
     # --------- NEW: helpers to keep bulk_insert simple (fixes C901) -------------------
+    @staticmethod
+    def _dense_vector(vector) -> list[float]:
+        """Convert a dense vector to the list of floats the REST models expect.
+
+        The sync pipeline keeps vectors as float32 NumPy rows; this is the only place they
+        become Python floats, one upsert batch at a time.
+        """
+        return vector.tolist() if hasattr(vector, "tolist") else vector
+
     def _build_point_struct(self, entity: ChunkEntity) -> rest.PointStruct:
         """Convert a ChunkEntity to a Qdrant PointStruct with tenant metadata."""
         entity_data = entity.to_storage_dict()
@@ -370,12 +377,6 @@ class QdrantDestination(VectorDBDestination):
         if not entity.airweave_system_metadata.vectors:
             raise ValueError(f"Entity {entity.entity_id} has no vector in system metadata")
 
-        # Remove vectors from payload
-        if "airweave_system_metadata" in entity_data and isinstance(
-            entity_data["airweave_system_metadata"], dict
-        ):
-            entity_data["airweave_system_metadata"].pop("vectors", None)
-
         # Add tenant metadata for filtering
         entity_data["airweave_collection_id"] = str(self.collection_id)
 
@@ -392,7 +393,10 @@ class QdrantDestination(VectorDBDestination):
 
         return rest.PointStruct(
             id=point_id,
-            vector={DEFAULT_VECTOR_NAME: entity.airweave_system_metadata.vectors[0]} | sparse_part,
+            vector={
+                DEFAULT_VECTOR_NAME: self._dense_vector(entity.airweave_system_metadata.vectors[0])
+            }
+            | sparse_part,
             payload=entity_data,
         )
 
@@ -4,6 +4,8 @@ import logging
 from abc import abstractmethod
 from typing import List, Optional
 
+import numpy as np
+
 from airweave.core.logging import logger as default_logger
 
 
@@ -74,3 +76,30 @@ class BaseEmbeddingModel:
             List of embedding vectors
         """
         pass
+
+    async def embed_many_array(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        encoding_format: str = "float",
+        entity_context: Optional[str] = None,
+    ) -> np.ndarray:
+        """Embed multiple text strings into a float32 matrix with one row per text.
+
+        Used by the sync pipeline, which keeps vectors as compact float32 rows until they
+        are written to a destination. Models that can produce arrays directly override
+        this; the default converts the result of embed_many.
+
+        Args:
+            texts: List of texts to embed
+            model: Optional specific model to use (defaults to self.model_name)
+            encoding_format: Format of the embedding (default: float)
+            entity_context: Optional context string for entity identification in logs
+
+        Returns:
+            Matrix of shape (len(texts), vector dimensions)
+        """
+        if not texts:
+            return np.zeros((0, self.vector_dimensions), dtype=np.float32)
+        embeddings = await self.embed_many(texts, model=model, encoding_format=encoding_format)
+        return np.asarray(embeddings, dtype=np.float32).reshape(len(texts), -1)
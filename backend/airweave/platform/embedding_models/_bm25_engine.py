@@ -0,0 +1,196 @@
+"""Process-wide BM25 sparse encoding engine.
+
+fastembed's BM25 tokenization and stemming run in pure Python and hold the GIL, so
+encoding on the event loop stalls every other coroutine during large hybrid-index syncs.
+The engine loads the model lazily (once per worker process), coalesces concurrent callers
+into batches and encodes them in a small process pool. Sync and search share one engine.
+"""
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Set, Tuple
+
+from fastembed import SparseEmbedding, SparseTextEmbedding
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.platform.sync.async_helpers import run_in_thread_pool
+
+BM25_MODEL_NAME = "Qdrant/bm25"
+
+# Model of the current process: the main process in thread mode, else each pool worker
+_process_model: Optional[SparseTextEmbedding] = None
+_process_model_lock = threading.Lock()
+
+
+def _get_process_model() -> SparseTextEmbedding:
+    """Load the BM25 model once per process."""
+    global _process_model
+
+    with _process_model_lock:
+        if _process_model is None:
+            _process_model = SparseTextEmbedding(BM25_MODEL_NAME)
+    return _process_model
+
+
+def _warm_worker() -> None:
+    """Process pool initializer: load the tokenizer and model before the first batch."""
+    _get_process_model()
+
+
+def _encode_batch(texts: List[str]) -> List[SparseEmbedding]:
+    """Encode a batch of texts. Runs inside a pool worker (or a thread as fallback)."""
+    return list(_get_process_model().embed(texts))
+
+
+class BM25Engine:
+    """Batches BM25 encode requests from concurrent callers onto a process pool."""
+
+    def __init__(
+        self,
+        pool_size: int,
+        batch_size: int = 256,
+        coalesce_window: float = 0.002,
+    ):
+        """Initialize the engine. No model or worker is started until first use.
+
+        Args:
+            pool_size: Number of worker processes (0 encodes in the shared thread pool)
+            batch_size: Max texts per encode call sent to a worker
+            coalesce_window: Seconds to wait for more callers before dispatching a batch
+        """
+        self.pool_size = pool_size
+        self.batch_size = batch_size
+        self.coalesce_window = coalesce_window
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._process_pool_disabled = pool_size <= 0
+
+        self._pending: List[Tuple[List[str], asyncio.Future]] = []
+        self._pending_count = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def embed_many(self, texts: List[str]) -> List[SparseEmbedding]:
+        """Encode texts, sharing worker calls with other concurrent callers.
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            One SparseEmbedding per input text, in input order
+        """
+        if not texts:
+            return []
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((list(texts), future))
+        self._pending_count += len(texts)
+
+        if self._pending_count >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.coalesce_window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Dispatch everything that is pending as one encode job."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending, self._pending_count = self._pending, [], 0
+        if not pending:
+            return
+
+        task = asyncio.create_task(self._encode_requests(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _encode_requests(self, pending: List[Tuple[List[str], asyncio.Future]]) -> None:
+        """Encode the texts of all pending requests and hand each caller its slice."""
+        texts = [text for request_texts, _ in pending for text in request_texts]
+        chunks = [texts[i : i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+
+        try:
+            results = await asyncio.gather(*[self._encode(chunk) for chunk in chunks])
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        embeddings = [embedding for chunk_result in results for embedding in chunk_result]
+        offset = 0
+        for request_texts, future in pending:
+            count = len(request_texts)
+            # Callers may have been cancelled while the batch was encoding
+            if not future.done():
+                future.set_result(embeddings[offset : offset + count])
+            offset += count
+
+    async def _encode(self, texts: List[str]) -> List[SparseEmbedding]:
+        """Encode one chunk in the process pool, falling back to the thread pool."""
+        executor = self._get_executor()
+        if executor is None:
+            return await run_in_thread_pool(_encode_batch, texts)
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, _encode_batch, texts)
+        except BrokenProcessPool:
+            logger.warning("BM25 process pool broke; falling back to the thread pool")
+            self._disable_process_pool()
+            return await run_in_thread_pool(_encode_batch, texts)
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """Lazily start the process pool (spawned, so no event loop state is forked)."""
+        if self._process_pool_disabled:
+            return None
+
+        with self._executor_lock:
+            if self._executor is None:
+                try:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.pool_size,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_warm_worker,
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not start BM25 process pool, using threads: {e}")
+                    self._process_pool_disabled = True
+                    return None
+        return self._executor
+
+    def _disable_process_pool(self) -> None:
+        """Stop using the process pool for the rest of this process' lifetime."""
+        with self._executor_lock:
+            self._process_pool_disabled = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        """Shut down the worker processes."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# One engine for the whole process
+_bm25_engine: Optional[BM25Engine] = None
+
+
+def get_bm25_engine() -> BM25Engine:
+    """Get or create the process-wide BM25 engine."""
+    global _bm25_engine
+
+    if _bm25_engine is None:
+        _bm25_engine = BM25Engine(pool_size=settings.BM25_POOL_SIZE)
+    return _bm25_engine
@@ -0,0 +1,377 @@
+"""Cache of dense embeddings keyed by model, dimensions and text hash.
+
+When a file changes a little, it is re-chunked and most chunks come out byte-identical to
+the previous run; the same holds for a document synced into two collections. Embedding
+those chunks again costs API spend and sync time for vectors we already computed. The
+cache maps (model, dimensions, SHA-256 of the embeddable text) to the vector.
+
+An in-process LRU tier is always in front. Behind it, EMBEDDING_CACHE_BACKEND selects a
+shared tier: "redis" or "postgres" (the embedding_cache table), both expiring entries after
+EMBEDDING_CACHE_TTL_SECONDS, or "memory" for none. Vectors are stored as little-endian
+float32 or float16 bytes (EMBEDDING_CACHE_DTYPE); the width is recovered from the byte
+length, so changing the setting does not invalidate stored entries. A failing shared tier
+is logged and treated as a miss.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from airweave.core.config import settings
+from airweave.core.datetime_utils import utc_now_naive
+from airweave.core.logging import logger
+
+# Embeds the texts that were not cached: texts -> one vector (matrix row) per text
+EmbedTexts = Callable[[List[str]], Awaitable[Sequence[np.ndarray]]]
+
+REDIS_KEY_PREFIX = "embedding_cache:"
+
+# Rows per statement; asyncpg allows at most 32767 bind parameters per query
+POSTGRES_BATCH_SIZE = 5000
+# Expired rows are deleted at most this often per process, this many rows per statement
+POSTGRES_PURGE_INTERVAL_SECONDS = 3600
+POSTGRES_PURGE_BATCH_SIZE = 10000
+
+_DTYPE_FORMATS = {"float32": "<f4", "float16": "<f2"}
+
+
+def encode_vector(vector: Sequence[float], dtype: str = "float32") -> bytes:
+    """Pack a vector into little-endian float32 or float16 bytes."""
+    return np.asarray(vector, dtype=_DTYPE_FORMATS[dtype]).tobytes()
+
+
+def decode_vector(data: bytes, dimensions: int) -> Optional[np.ndarray]:
+    """Unpack a vector stored by encode_vector into float32, or None if the size is off.
+
+    float32 entries are returned as a read-only view of ``data``, without a copy.
+    """
+    if len(data) == 4 * dimensions:
+        return np.frombuffer(data, dtype="<f4")
+    if len(data) == 2 * dimensions:
+        return np.frombuffer(data, dtype="<f2").astype(np.float32)
+    return None
+
+
+class EmbeddingCacheBackend:
+    """Shared tier of the embedding cache."""
+
+    name = "none"
+
+    async def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        """Return the stored vectors of the keys that are present."""
+        return {}
+
+    async def set_many(self, entries: Dict[str, bytes]) -> None:
+        """Store vectors. Existing keys may be left as they are."""
+
+
+class RedisEmbeddingCacheBackend(EmbeddingCacheBackend):
+    """Stores vectors in Redis, expiring them after EMBEDDING_CACHE_TTL_SECONDS."""
+
+    name = "redis"
+
+    def __init__(self, ttl_seconds: int):
+        """Initialize the backend.
+
+        Args:
+            ttl_seconds: Expiry of stored vectors
+        """
+        self.ttl_seconds = ttl_seconds
+
+    async def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        """Fetch the keys with one MGET."""
+        from airweave.core.redis_client import redis_client
+
+        values = await redis_client.binary_client.mget([REDIS_KEY_PREFIX + k for k in keys])
+        return {key: value for key, value in zip(keys, values, strict=True) if value}
+
+    async def set_many(self, entries: Dict[str, bytes]) -> None:
+        """Store the entries in one pipelined round-trip."""
+        from airweave.core.redis_client import redis_client
+
+        async with redis_client.binary_client.pipeline(transaction=False) as pipe:
+            for key, value in entries.items():
+                pipe.set(REDIS_KEY_PREFIX + key, value, ex=self.ttl_seconds)
+            await pipe.execute()
+
+
+class PostgresEmbeddingCacheBackend(EmbeddingCacheBackend):
+    """Stores vectors in the embedding_cache table.
+
+    Rows older than EMBEDDING_CACHE_TTL_SECONDS are treated as misses and deleted by
+    purge_expired, which set_many runs at most once per POSTGRES_PURGE_INTERVAL_SECONDS.
+    """
+
+    name = "postgres"
+
+    def __init__(self, ttl_seconds: int):
+        """Initialize the backend.
+
+        Args:
+            ttl_seconds: Age after which stored vectors expire
+        """
+        self.ttl_seconds = ttl_seconds
+        self._last_purge = time.monotonic()
+
+    def _cutoff(self) -> datetime:
+        """Creation time before which stored vectors are expired."""
+        return utc_now_naive() - timedelta(seconds=self.ttl_seconds)
+
+    async def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        """Fetch the unexpired keys, POSTGRES_BATCH_SIZE keys per query."""
+        from sqlalchemy import select
+
+        from airweave.db.session import get_db_context
+        from airweave.models import EmbeddingCacheEntry
+
+        found: Dict[str, bytes] = {}
+        cutoff = self._cutoff()
+        async with get_db_context() as db:
+            for start in range(0, len(keys), POSTGRES_BATCH_SIZE):
+                batch = keys[start : start + POSTGRES_BATCH_SIZE]
+                result = await db.execute(
+                    select(EmbeddingCacheEntry.cache_key, EmbeddingCacheEntry.vector).where(
+                        EmbeddingCacheEntry.cache_key.in_(batch),
+                        EmbeddingCacheEntry.created_at >= cutoff,
+                    )
+                )
+                found.update({row.cache_key: row.vector for row in result})
+        return found
+
+    async def set_many(self, entries: Dict[str, bytes]) -> None:
+        """Insert the entries, skipping keys another worker stored first.
+
+        Rows are inserted POSTGRES_BATCH_SIZE at a time (each row binds five parameters),
+        in one transaction.
+        """
+        from sqlalchemy.dialects.postgresql import insert
+
+        from airweave.db.session import get_db_context
+        from airweave.models import EmbeddingCacheEntry
+
+        rows = [{"cache_key": key, "vector": value} for key, value in entries.items()]
+        async with get_db_context() as db:
+            for start in range(0, len(rows), POSTGRES_BATCH_SIZE):
+                await db.execute(
+                    insert(EmbeddingCacheEntry)
+                    .values(rows[start : start + POSTGRES_BATCH_SIZE])
+                    .on_conflict_do_nothing(index_elements=["cache_key"])
+                )
+            await db.commit()
+
+        if time.monotonic() - self._last_purge >= POSTGRES_PURGE_INTERVAL_SECONDS:
+            self._last_purge = time.monotonic()
+            try:
+                await self.purge_expired()
+            except Exception as e:
+                logger.warning(f"Failed to purge expired embedding cache rows: {e}")
+
+    async def purge_expired(self) -> int:
+        """Delete expired rows, POSTGRES_PURGE_BATCH_SIZE per statement.
+
+        Returns:
+            The number of deleted rows
+        """
+        from sqlalchemy import delete, select
+
+        from airweave.db.session import get_db_context
+        from airweave.models import EmbeddingCacheEntry
+
+        cutoff = self._cutoff()
+        deleted = 0
+        while True:
+            expired_ids = (
+                select(EmbeddingCacheEntry.id)
+                .where(EmbeddingCacheEntry.created_at < cutoff)
+                .limit(POSTGRES_PURGE_BATCH_SIZE)
+                .scalar_subquery()
+            )
+            async with get_db_context() as db:
+                result = await db.execute(
+                    delete(EmbeddingCacheEntry).where(EmbeddingCacheEntry.id.in_(expired_ids))
+                )
+                await db.commit()
+            deleted += result.rowcount
+            if result.rowcount < POSTGRES_PURGE_BATCH_SIZE:
+                break
+
+        if deleted:
+            logger.info(f"Purged {deleted} expired embedding cache rows")
+        return deleted
+
+
+def _create_backend(name: str) -> EmbeddingCacheBackend:
+    if name == "redis":
+        return RedisEmbeddingCacheBackend(ttl_seconds=settings.EMBEDDING_CACHE_TTL_SECONDS)
+    if name == "postgres":
+        return PostgresEmbeddingCacheBackend(ttl_seconds=settings.EMBEDDING_CACHE_TTL_SECONDS)
+    if name not in ("memory", "none"):
+        logger.warning(f"Unknown EMBEDDING_CACHE_BACKEND '{name}', using the in-process cache")
+    return EmbeddingCacheBackend()
+
+
+class EmbeddingCache:
+    """Two-tier (memory, shared backend) cache of dense embeddings."""
+
+    def __init__(
+        self,
+        backend: EmbeddingCacheBackend,
+        memory_bytes: int,
+        dtype: str = "float32",
+        enabled: bool = True,
+    ):
+        """Initialize the cache.
+
+        Args:
+            backend: The shared tier behind the in-process one
+            memory_bytes: Size cap of the in-process tier
+            dtype: "float32" or "float16", the precision vectors are stored with
+            enabled: If False, every text is embedded
+        """
+        self.backend = backend
+        self.memory_bytes = memory_bytes
+        self.dtype = dtype if dtype in _DTYPE_FORMATS else "float32"
+        self.enabled = enabled
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_size = 0
+
+        self._metrics: Dict[str, int] = {
+            "memory_hits": 0,
+            "backend_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "errors": 0,
+        }
+
+    @staticmethod
+    def key(model: str, dimensions: int, text: str) -> str:
+        """Cache key of a text embedded with a model."""
+        digest = hashlib.sha256(text.encode("utf-8", errors="surrogatepass")).hexdigest()
+        return f"{model}:{dimensions}:{digest}"
+
+    async def embed_many(
+        self, model: str, dimensions: int, texts: List[str], embed: EmbedTexts
+    ) -> List[np.ndarray]:
+        """Return one float32 vector per text, embedding only texts that are not cached.
+
+        Args:
+            model: Name of the embedding model
+            dimensions: Vector dimensions of the model
+            texts: Texts to embed
+            embed: Embeds the texts that were not found in the cache
+
+        Returns:
+            One vector per text, in input order
+        """
+        if not self.enabled or not texts:
+            return list(await embed(texts))
+
+        keys = [self.key(model, dimensions, text) if text.strip() else None for text in texts]
+        vectors = await self._lookup([k for k in keys if k is not None], dimensions)
+
+        # Embed what is left; identical texts within the call are embedded once
+        seen = set(vectors)
+        miss_positions: List[int] = []
+        for position, key in enumerate(keys):
+            if key is None or key not in seen:
+                miss_positions.append(position)
+                if key is not None:
+                    seen.add(key)
+
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        if miss_positions:
+            embedded = await embed([texts[position] for position in miss_positions])
+            new_entries: Dict[str, bytes] = {}
+            for position, vector in zip(miss_positions, embedded, strict=True):
+                results[position] = vector
+                key = keys[position]
+                if key is not None:
+                    vectors[key] = vector
+                    new_entries[key] = encode_vector(vector, self.dtype)
+            await self._store(new_entries)
+
+        return [
+            vector if vector is not None else vectors[key]
+            for vector, key in zip(results, keys, strict=True)
+        ]
+
+    async def _lookup(self, keys: List[str], dimensions: int) -> Dict[str, np.ndarray]:
+        """Return the cached vectors of the keys found in either tier."""
+        vectors: Dict[str, np.ndarray] = {}
+
+        remote_keys = []
+        for key in dict.fromkeys(keys):
+            data = self._memory.get(key)
+            vector = decode_vector(data, dimensions) if data is not None else None
+            if vector is None:
+                remote_keys.append(key)
+                continue
+            self._memory.move_to_end(key)
+            vectors[key] = vector
+            self._metrics["memory_hits"] += 1
+
+        if remote_keys:
+            for key, data in (await self._backend_get(remote_keys)).items():
+                vector = decode_vector(data, dimensions)
+                if vector is not None:
+                    vectors[key] = vector
+                    self._remember(key, data)
+                    self._metrics["backend_hits"] += 1
+        return vectors
+
+    async def _store(self, entries: Dict[str, bytes]) -> None:
+        """Record freshly embedded vectors in both tiers."""
+        self._metrics["misses"] += len(entries)
+        if not entries:
+            return
+        for key, data in entries.items():
+            self._remember(key, data)
+        await self._backend_set(entries)
+
+    async def _backend_get(self, keys: List[str]) -> Dict[str, bytes]:
+        try:
+            return await self.backend.get_many(keys)
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed ({self.backend.name}): {e}")
+            self._metrics["errors"] += 1
+            return {}
+
+    async def _backend_set(self, entries: Dict[str, bytes]) -> None:
+        try:
+            await self.backend.set_many(entries)
+        except Exception as e:
+            logger.warning(f"Failed to store embeddings in cache ({self.backend.name}): {e}")
+            self._metrics["errors"] += 1
+            return
+        self._metrics["stores"] += len(entries)
+
+    def _remember(self, key: str, data: bytes) -> None:
+        """Add an entry to the in-process LRU tier."""
+        if len(data) > self.memory_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_size -= len(previous)
+        self._memory[key] = data
+        self._memory_size += len(data)
+        while self._memory_size > self.memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+
+    def metrics_snapshot(self) -> Dict[str, int]:
+        """Return the current hit/miss counters."""
+        return dict(self._metrics)
+
+
+# Global instance
+embedding_cache = EmbeddingCache(
+    backend=_create_backend(settings.EMBEDDING_CACHE_BACKEND),
+    memory_bytes=settings.EMBEDDING_CACHE_MEMORY_BYTES,
+    dtype=settings.EMBEDDING_CACHE_DTYPE,
+    enabled=settings.EMBEDDING_CACHE_BACKEND != "none",
+)
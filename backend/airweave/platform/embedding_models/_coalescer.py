@@ -0,0 +1,217 @@
+"""Cross-caller coalescing of embedding requests.
+
+Every sync batch embeds its own chunks, so many small batches (incremental syncs, slow
+sources) turn into many small API requests far below the provider's per-request limits,
+and request overhead eats into the rate limit. The coalescer collects the texts of
+concurrent ``embed_many`` callers for a few milliseconds, packs them into requests up to
+a text and token limit, and hands each caller its own vectors back, in order.
+
+A caller that is cancelled withdraws its texts that were not sent yet; requests already
+in flight for it still complete for the other callers sharing them.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set
+
+from airweave.core.logging import logger
+
+# Sends one request: (texts, total token count) -> one vector (e.g. matrix row) per text
+SendRequest = Callable[[List[str], int], Awaitable[Sequence[Any]]]
+
+
+@dataclass
+class _Caller:
+    """One embed() call waiting for its vectors."""
+
+    send: SendRequest
+    future: asyncio.Future
+    vectors: List[Optional[Any]]
+    remaining: int
+
+
+@dataclass
+class _PendingText:
+    caller: _Caller
+    index: int
+    text: str
+    tokens: int
+
+
+class EmbeddingCoalescer:
+    """Packs texts of concurrent callers into shared, token-aware embedding requests."""
+
+    def __init__(self, max_texts: int, max_tokens: int, linger_seconds: float):
+        """Initialize the coalescer.
+
+        Args:
+            max_texts: Max texts per request
+            max_tokens: Max total tokens per request
+            linger_seconds: How long to wait for more texts before sending a partial request
+        """
+        self.max_texts = max(1, max_texts)
+        self.max_tokens = max_tokens
+        self.linger_seconds = linger_seconds
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[_PendingText] = []
+        self._pending_tokens = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Keep references so in-flight requests are not garbage collected
+        self._requests: Set[asyncio.Task] = set()
+
+        self._metrics: Dict[str, int] = {
+            "callers": 0,
+            "texts": 0,
+            "requests": 0,
+            "shared_requests": 0,  # Requests carrying texts of more than one caller
+        }
+
+    async def embed(
+        self, texts: List[str], token_counts: List[int], send: SendRequest
+    ) -> List[Any]:
+        """Embed texts as part of shared requests.
+
+        Args:
+            texts: Non-empty texts to embed
+            token_counts: Token count of each text
+            send: Sends one request; called with texts of possibly several callers
+
+        Returns:
+            One vector per text, in input order
+        """
+        if not texts:
+            return []
+
+        self._bind_loop()
+        caller = _Caller(
+            send=send,
+            future=self._loop.create_future(),
+            vectors=[None] * len(texts),
+            remaining=len(texts),
+        )
+        self._metrics["callers"] += 1
+        self._metrics["texts"] += len(texts)
+
+        for index, (text, tokens) in enumerate(zip(texts, token_counts, strict=True)):
+            self._pending.append(_PendingText(caller, index, text, tokens))
+            self._pending_tokens += tokens
+            # Send full requests right away
+            if len(self._pending) >= self.max_texts or self._pending_tokens >= self.max_tokens:
+                self._flush()
+
+        if self._pending and self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(self.linger_seconds, self._flush)
+
+        try:
+            return await caller.future
+        except asyncio.CancelledError:
+            self._withdraw(caller)
+            raise
+
+    def _bind_loop(self) -> None:
+        """Reset loop-bound state when used from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._pending = []
+            self._pending_tokens = 0
+            self._flush_handle = None
+
+    def _withdraw(self, caller: _Caller) -> None:
+        """Drop a cancelled caller's texts that were not sent yet."""
+        self._pending = [p for p in self._pending if p.caller is not caller]
+        self._pending_tokens = sum(p.tokens for p in self._pending)
+
+    def _flush(self) -> None:
+        """Pack all pending texts into requests and send them."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, []
+        self._pending_tokens = 0
+
+        request: List[_PendingText] = []
+        request_tokens = 0
+        for item in pending:
+            if item.caller.future.done():
+                continue
+            if request and (
+                len(request) >= self.max_texts or request_tokens + item.tokens > self.max_tokens
+            ):
+                self._send(request, request_tokens)
+                request, request_tokens = [], 0
+            request.append(item)
+            request_tokens += item.tokens
+        if request:
+            self._send(request, request_tokens)
+
+    def _send(self, request: List[_PendingText], tokens: int) -> None:
+        self._metrics["requests"] += 1
+        if len({id(item.caller) for item in request}) > 1:
+            self._metrics["shared_requests"] += 1
+        task = asyncio.ensure_future(self._run_request(request, tokens))
+        self._requests.add(task)
+        task.add_done_callback(self._requests.discard)
+
+    async def _run_request(self, request: List[_PendingText], tokens: int) -> None:
+        """Send one request and distribute its vectors to the callers."""
+        try:
+            vectors = await request[0].caller.send([item.text for item in request], tokens)
+        except Exception as e:
+            callers = {id(item.caller): item.caller for item in request}
+            if len(callers) == 1:
+                for item in request:
+                    if not item.caller.future.done():
+                        item.caller.future.set_exception(e)
+                return
+            # Retry each caller's share on its own, so one bad input only fails its caller
+            await asyncio.gather(
+                *[
+                    self._run_request(
+                        [item for item in request if item.caller is caller],
+                        sum(item.tokens for item in request if item.caller is caller),
+                    )
+                    for caller in callers.values()
+                ]
+            )
+            return
+
+        try:
+            for item, vector in zip(request, vectors, strict=True):
+                caller = item.caller
+                if caller.future.done():
+                    continue
+                caller.vectors[item.index] = vector
+                caller.remaining -= 1
+                if caller.remaining == 0:
+                    caller.future.set_result(caller.vectors)
+        except Exception as e:
+            # e.g. a response with the wrong number of vectors; nobody may wait forever
+            for item in request:
+                if not item.caller.future.done():
+                    item.caller.future.set_exception(e)
+
+    def metrics_snapshot(self) -> Dict[str, int]:
+        """Return callers, texts and requests counted so far."""
+        return dict(self._metrics)
+
+
+# One coalescer per (API key, model, encoding) for the whole process
+_coalescers: Dict[tuple, EmbeddingCoalescer] = {}
+
+
+def get_embedding_coalescer(
+    key: tuple, max_texts: int, max_tokens: int, linger_seconds: float
+) -> EmbeddingCoalescer:
+    """Get or create the process-wide coalescer for a key."""
+    coalescer = _coalescers.get(key)
+    if coalescer is None:
+        coalescer = EmbeddingCoalescer(max_texts, max_tokens, linger_seconds)
+        _coalescers[key] = coalescer
+        logger.debug(
+            f"Created embedding coalescer ({max_texts} texts, {max_tokens} tokens, "
+            f"{linger_seconds * 1000:.0f}ms linger)"
+        )
+    return coalescer
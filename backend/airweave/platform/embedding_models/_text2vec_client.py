@@ -0,0 +1,182 @@
+"""Process-wide HTTP client for the text2vec-transformers inference service.
+
+The inference container only exposes a single-text ``/vectors`` endpoint. Opening a new
+``httpx.AsyncClient`` per call paid a TCP handshake for every chunk, so this module keeps
+one pooled keep-alive client, bounds the number of in-flight requests across every caller
+in the process, retries transient failures with exponential backoff, and lets concurrent
+callers that ask for the same text share a single inference request.
+"""
+
+import asyncio
+import random
+import weakref
+from typing import Dict, List, Union
+
+import httpx
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+
+# Responses worth retrying: rate limiting and transient server-side failures
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional ``h2`` package; fall back to HTTP/1.1 keep-alive."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class _LoopState:
+    """Connections and asyncio primitives bound to one event loop."""
+
+    def __init__(self, client: httpx.AsyncClient, max_concurrency: int):
+        """Initialize the state around a client created on the loop."""
+        self.client = client
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        # Requests currently queued or in flight, keyed by text
+        self.inflight: Dict[str, asyncio.Future] = {}
+
+
+class Text2VecClient:
+    """Pooled, bounded and retrying client shared by all LocalText2Vec instances."""
+
+    def __init__(
+        self,
+        base_url: str,
+        max_concurrency: int,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        timeout: float = 60.0,
+    ):
+        """Initialize the client. Connections are opened lazily on first use.
+
+        Args:
+            base_url: URL of the inference service
+            max_concurrency: Max in-flight requests (and pooled connections) per process
+            max_retries: Retries for transport errors and retryable status codes
+            backoff_base: Base delay in seconds for exponential backoff
+            timeout: Per-request timeout in seconds
+        """
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.timeout = timeout
+
+        # httpx connections and asyncio primitives belong to the loop they were created on,
+        # so each loop gets its own; a loop's state goes away with the loop
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _bind_loop(self) -> _LoopState:
+        """Get the running loop's state, creating it on first use from that loop."""
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is not None and not state.client.is_closed:
+            return state
+
+        # Connections of loops that have since closed can no longer be used or closed
+        for stale_loop in [other for other in self._states.keys() if other.is_closed()]:
+            del self._states[stale_loop]
+
+        client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=_http2_available(),
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(self.timeout, connect=10.0),
+        )
+        state = self._states[loop] = _LoopState(client, self.max_concurrency)
+        return state
+
+    async def embed_many(self, texts: List[str]) -> List[Union[List[float], BaseException]]:
+        """Embed texts concurrently over the shared connection pool.
+
+        Args:
+            texts: Non-empty texts to embed
+
+        Returns:
+            One entry per input text, in input order: the vector, or the exception that
+            made the request fail after all retries
+        """
+        if not texts:
+            return []
+
+        state = self._bind_loop()
+        futures = [self._get_or_start(state, text) for text in texts]
+        # Shield the shared futures so one caller's cancellation does not fail the others
+        return await asyncio.gather(
+            *[asyncio.shield(future) for future in futures], return_exceptions=True
+        )
+
+    async def embed(self, text: str) -> List[float]:
+        """Embed a single text, raising if the request fails after all retries."""
+        (result,) = await self.embed_many([text])
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    def _get_or_start(self, state: _LoopState, text: str) -> asyncio.Future:
+        """Join the in-flight request for this text or start a new one."""
+        future = state.inflight.get(text)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch(state, text))
+            state.inflight[text] = future
+            future.add_done_callback(lambda _, key=text: state.inflight.pop(key, None))
+        return future
+
+    async def _fetch(self, state: _LoopState, text: str) -> List[float]:
+        """POST one text to the inference service with retry and backoff."""
+        attempt = 0
+        while True:
+            try:
+                async with state.semaphore:
+                    response = await state.client.post("/vectors", json={"text": text})
+                if response.status_code in RETRY_STATUS_CODES and attempt < self.max_retries:
+                    raise httpx.HTTPStatusError(
+                        f"Retryable status {response.status_code}",
+                        request=response.request,
+                        response=response,
+                    )
+                response.raise_for_status()
+                return response.json()["vector"]
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                retryable = isinstance(e, httpx.TransportError) or (
+                    e.response.status_code in RETRY_STATUS_CODES
+                )
+                if not retryable or attempt >= self.max_retries:
+                    raise
+                delay = self.backoff_base * (2**attempt) * (1 + random.random())
+                attempt += 1
+                logger.debug(
+                    f"Text2Vec request failed ({type(e).__name__}), "
+                    f"retry {attempt}/{self.max_retries} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+
+    async def close(self) -> None:
+        """Close the running loop's pooled connections."""
+        state = self._states.pop(asyncio.get_running_loop(), None)
+        if state is not None:
+            await state.client.aclose()
+
+
+# One client per inference URL for the whole process
+_text2vec_clients: Dict[str, Text2VecClient] = {}
+
+
+def get_text2vec_client(base_url: str) -> Text2VecClient:
+    """Get or create the process-wide client for an inference URL."""
+    client = _text2vec_clients.get(base_url)
+    if client is None:
+        client = Text2VecClient(base_url, max_concurrency=settings.TEXT2VEC_MAX_CONCURRENT)
+        _text2vec_clients[base_url] = client
+    return client
@@ -2,12 +2,13 @@
 
 from typing import List, Optional
 
-from fastembed import SparseEmbedding, SparseTextEmbedding
+from fastembed import SparseEmbedding
 
 from airweave.core.logging import ContextualLogger
 from airweave.platform.decorators import embedding_model
 
 from ._base import BaseEmbeddingModel
+from ._bm25_engine import get_bm25_engine
 
 
 @embedding_model(
@@ -18,10 +19,13 @@ from ._base import BaseEmbeddingModel
     model_version="1.0",
 )
 class BM25Text2Vec(BaseEmbeddingModel):
-    """Local text2vec model configuration for embedding."""
+    """Local BM25 model for sparse embedding.
+
+    Instances are cheap: encoding is delegated to the process-wide BM25 engine, which
+    loads the model once and runs it off the event loop.
+    """
 
     # Configuration parameters as class attributes
-    _model: SparseTextEmbedding
     model_name: str = "local-bm25-text2vec"
 
     def __init__(
@@ -32,7 +36,6 @@ class BM25Text2Vec(BaseEmbeddingModel):
         """Initialize the local text2vec model."""
         # Always call parent __init__ (esp. with Pydantic models!)
         super().__init__(**data)
-        self._model = SparseTextEmbedding("Qdrant/bm25")
         if logger:
             self.logger = logger  # Override with contextual logger if provided
 
@@ -54,8 +57,7 @@ class BM25Text2Vec(BaseEmbeddingModel):
         Returns:
             SparseEmbedding object
         """
-        # The embed method returns a generator, we need to get the first (and only) result
-        embeddings = list(self._model.embed([text]))
+        embeddings = await get_bm25_engine().embed_many([text])
         return embeddings[0] if embeddings else None
 
     async def embed_many(
@@ -79,5 +81,4 @@ class BM25Text2Vec(BaseEmbeddingModel):
         if not texts:
             return []
 
-        # Convert generator to list of SparseEmbedding objects
-        return list(self._model.embed(texts))
+        return await get_bm25_engine().embed_many(texts)
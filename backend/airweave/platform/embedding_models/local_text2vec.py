@@ -2,7 +2,6 @@
 
 from typing import List, Optional
 
-import httpx
 from pydantic import Field
 
 from airweave.core.config import settings
@@ -10,6 +9,7 @@ from airweave.core.logging import ContextualLogger
 from airweave.platform.decorators import embedding_model
 
 from ._base import BaseEmbeddingModel
+from ._text2vec_client import get_text2vec_client
 
 
 @embedding_model(
@@ -71,10 +71,7 @@ class LocalText2Vec(BaseEmbeddingModel):
             # Return zero vector for empty text
             return [0.0] * self.vector_dimensions
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(f"{self.inference_url}/vectors", json={"text": text})
-            response.raise_for_status()
-            return response.json()["vector"]
+        return await get_text2vec_client(self.inference_url).embed(text)
 
     async def embed_many(
         self,
@@ -103,26 +100,19 @@ class LocalText2Vec(BaseEmbeddingModel):
         if dimensions:
             raise ValueError("Dimensions override not supported for local text2vec")
 
-        # Create result list with same order as input
-        result = []
-
-        # Process each text individually since batch endpoint isn't available
-        async with httpx.AsyncClient() as client:
-            for text in texts:
-                if text.strip():
-                    try:
-                        response = await client.post(
-                            f"{self.inference_url}/vectors/", json={"text": text}
-                        )
-                        response.raise_for_status()
-                        result.append(response.json()["vector"])
-                    except Exception as e:
-                        if hasattr(self, "logger") and self.logger:
-                            self.logger.error(f"Error embedding text: {e}")
-                        # Return zero vector for failed embedding
-                        result.append([0.0] * self.vector_dimensions)
-                else:
-                    # Return zero vector for empty text
-                    result.append([0.0] * self.vector_dimensions)
-
-        return result
+        # Zero vectors for empty texts; the rest go through the shared pooled client
+        result: List[Optional[List[float]]] = [None] * len(texts)
+        indices = [i for i, text in enumerate(texts) if text.strip()]
+        vectors = await get_text2vec_client(self.inference_url).embed_many(
+            [texts[i] for i in indices]
+        )
+
+        for i, vector in zip(indices, vectors, strict=True):
+            if isinstance(vector, BaseException):
+                if hasattr(self, "logger") and self.logger:
+                    self.logger.error(f"Error embedding text: {vector}")
+                # Return zero vector for failed embedding
+                continue
+            result[i] = vector
+
+        return [vector or [0.0] * self.vector_dimensions for vector in result]
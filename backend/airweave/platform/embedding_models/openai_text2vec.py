@@ -1,17 +1,21 @@
 """Simplified OpenAI text2vec model for embedding using official OpenAI client."""
 
 import asyncio
+import base64
+import hashlib
 from typing import List, Optional
 
+import numpy as np
 from aiolimiter import AsyncLimiter
 from openai import AsyncOpenAI
-from tiktoken import get_encoding
 
 from airweave.core.config import settings
 from airweave.core.logging import ContextualLogger
 from airweave.platform.decorators import embedding_model
+from airweave.platform.transformers.utils import count_tokens, count_tokens_batch_async
 
 from ._base import BaseEmbeddingModel
+from ._coalescer import get_embedding_coalescer
 
 # Global semaphore for OpenAI API rate limiting
 _openai_semaphore: Optional[asyncio.Semaphore] = None
@@ -19,6 +23,26 @@ _openai_semaphore: Optional[asyncio.Semaphore] = None
 # One limiter for the whole process – 5M TPM, 0.5M TP10s gives big smoothing buffer
 _tpm_limiter: AsyncLimiter | None = None
 
+# OpenAI limits: 8191 tokens per text, 2048 texts and 300k tokens per request
+MAX_TOKENS_PER_REQUEST = 280000  # ~93% of 300k limit for safety margin
+
+
+def _decode_embeddings(data) -> np.ndarray:
+    """Decode the embeddings of a response into one float32 matrix (one row per input).
+
+    Embeddings are requested base64 encoded, which is the raw little-endian float32 vector:
+    a quarter of the JSON float payload, and no Python float per dimension.
+    """
+    vectors = [
+        np.frombuffer(base64.b64decode(item.embedding), dtype="<f4")
+        if isinstance(item.embedding, str)
+        else np.asarray(item.embedding, dtype=np.float32)
+        for item in data
+    ]
+    if not vectors:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.stack(vectors)
+
 
 @embedding_model(
     "OpenAI Text2Vec Simple",
@@ -50,6 +74,8 @@ class OpenAIText2Vec(BaseEmbeddingModel):
         super().__init__()  # Initialize base class
         self.logger = logger  # Override with contextual logger
         self.model_name = model_name or self.model_name
+        # Requests are only combined across callers using the same API key
+        self._api_key_fingerprint = hashlib.sha256((api_key or "").encode()).hexdigest()[:16]
 
         global _openai_semaphore, _tpm_limiter
 
@@ -68,15 +94,26 @@ class OpenAIText2Vec(BaseEmbeddingModel):
         )
 
     @staticmethod
-    def _count_tokens(txt: str) -> int:  # ~1 µs – negligible
-        enc = get_encoding("cl100k_base")
-        return len(enc.encode(txt))
+    def _count_tokens(txt: str) -> int:
+        return count_tokens(txt)
+
+    async def _rate_limited_embed(
+        self,
+        batch: list[str],
+        model: str,
+        encoding_format: str,
+        token_count: Optional[int] = None,
+    ):
+        """Single OpenAI call, guarded by concurrency AND token bucket.
 
-    async def _rate_limited_embed(self, batch: list[str], model: str, encoding_format: str):
-        """Single OpenAI call, guarded by concurrency AND token bucket."""
+        Callers that already measured the batch pass ``token_count`` so texts are not
+        tokenized twice.
+        """
         global _tpm_limiter, _openai_semaphore
 
-        needed = sum(self._count_tokens(t) for t in batch)
+        needed = token_count
+        if needed is None:
+            needed = sum(await count_tokens_batch_async(batch))
         # Acquire the required token budget before proceeding; this blocks until enough
         # capacity is available. aiolimiter returns immediately once the budget can be
         # taken – no explicit release is required because the limiter refunds capacity
@@ -123,10 +160,11 @@ class OpenAIText2Vec(BaseEmbeddingModel):
         cpu_start = loop.time()
         try:
             # Wait for the API call to complete with await
-            response = await self._rate_limited_embed([text], used_model, encoding_format)
+            response = await self._rate_limited_embed(
+                [text], used_model, self._wire_format(encoding_format)
+            )
 
-            embedding = response.data[0].embedding
-            return embedding
+            return _decode_embeddings(response.data)[0].tolist()
 
         except Exception as e:
             cpu_elapsed = loop.time() - cpu_start
@@ -148,27 +186,47 @@ class OpenAIText2Vec(BaseEmbeddingModel):
         """Embed multiple text strings using OpenAI official client."""
         if dimensions:
             raise ValueError("Dimensions override not supported for OpenAI embedding")
+        if not texts:
+            return []
 
+        embeddings = await self.embed_many_array(
+            texts, model=model, encoding_format=encoding_format, entity_context=entity_context
+        )
+        return embeddings.tolist()
+
+    async def embed_many_array(
+        self,
+        texts: List[str],
+        model: Optional[str] = None,
+        encoding_format: str = "float",
+        entity_context: Optional[str] = None,
+    ) -> np.ndarray:
+        """Embed multiple text strings into a float32 matrix with one row per text."""
         context_prefix = f"{entity_context} " if entity_context else ""
 
         if not texts:
-            return []
+            return np.zeros((0, self.vector_dimensions), dtype=np.float32)
 
         # Filter empty texts and track indices
         filtered_result = self._filter_empty_texts(texts, context_prefix)
         filtered_texts, empty_indices = filtered_result
 
         if not filtered_texts:
-            return [[0.0] * self.vector_dimensions] * len(texts)
+            return np.zeros((len(texts), self.vector_dimensions), dtype=np.float32)
 
         used_model = model or self.embedding_model
         embeddings = await self._process_embeddings_in_batches(
-            filtered_texts, used_model, encoding_format, context_prefix
+            filtered_texts, used_model, self._wire_format(encoding_format), context_prefix
         )
 
         # Reinsert empty vectors at the correct positions
         return self._reinsert_empty_vectors(embeddings, empty_indices, len(texts))
 
+    @staticmethod
+    def _wire_format(encoding_format: str) -> str:
+        """Request float vectors base64 encoded; they are decoded into float32 arrays."""
+        return "base64" if encoding_format == "float" else encoding_format
+
     def _filter_empty_texts(self, texts: List[str], context_prefix: str) -> tuple[List[str], set]:
         """Filter out empty texts and return filtered list and empty indices."""
         filtered_texts = []
@@ -186,74 +244,45 @@ class OpenAIText2Vec(BaseEmbeddingModel):
 
     async def _process_embeddings_in_batches(
         self, texts: List[str], model: str, encoding_format: str, context_prefix: str
-    ) -> List[List[float]]:
-        """Process embeddings in optimized batches."""
-        # Process in batches to avoid API limits
-        # OpenAI limits: 8191 tokens per text, 2048 texts per batch, 300k total tokens per request
-        MAX_BATCH_SIZE = 100  # Well under the 2048 limit, allows good parallelism
-        MAX_TOKENS_PER_BATCH = 280000  # ~93% of 300k limit for safety margin
-        MAX_CONCURRENT_BATCHES = 5  # Limit concurrent API calls
-
-        # Prepare batches first
-        batches = []
-        current_batch = []
-        current_batch_tokens = 0
-
-        for text in texts:
-            # Estimate tokens (rough: 1 token ≈ 4 chars for English text)
-            estimated_tokens = len(text) // 4
-
-            # Check if adding this text would exceed limits
-            should_create_new_batch = current_batch and (
-                len(current_batch) >= MAX_BATCH_SIZE
-                or current_batch_tokens + estimated_tokens > MAX_TOKENS_PER_BATCH
-            )
+    ) -> np.ndarray:
+        """Embed texts in requests shared with other concurrent callers in this process.
 
-            if should_create_new_batch:
-                # Save current batch
-                batches.append(current_batch)
-                # Start new batch
-                current_batch = [text]
-                current_batch_tokens = estimated_tokens
-            else:
-                # Add to current batch
-                current_batch.append(text)
-                current_batch_tokens += estimated_tokens
-
-        # Don't forget the last batch
-        if current_batch:
-            batches.append(current_batch)
-
-        # Process batches in parallel with concurrency limit
-        semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
-
-        async def process_batch_with_limit(batch, batch_idx):
-            async with semaphore:
-                return await self._process_single_batch(
-                    batch, model, encoding_format, context_prefix
-                )
-
-        # Create tasks for all batches
-        tasks = [process_batch_with_limit(batch, idx) for idx, batch in enumerate(batches)]
-
-        # Process all batches in parallel
-        batch_results = await asyncio.gather(*tasks)
+        The coalescer packs texts of all concurrent embed_many calls with the same key into
+        requests within the API limits, so many small sync batches do not turn into many
+        small requests.
+        """
+        # Tokenize once, off the event loop; the counts drive both packing and rate limiting
+        token_counts = await count_tokens_batch_async(texts)
+
+        coalescer = get_embedding_coalescer(
+            (self._api_key_fingerprint, model, encoding_format),
+            max_texts=settings.OPENAI_EMBED_MAX_TEXTS_PER_REQUEST,
+            max_tokens=MAX_TOKENS_PER_REQUEST,
+            linger_seconds=settings.OPENAI_EMBED_COALESCE_MS / 1000.0,
+        )
 
-        # Flatten results
-        embeddings = []
-        for batch_embeddings in batch_results:
-            embeddings.extend(batch_embeddings)
+        async def send(batch: List[str], batch_tokens: int) -> np.ndarray:
+            return await self._process_single_batch(
+                batch, model, encoding_format, context_prefix, token_count=batch_tokens
+            )
 
-        return embeddings
+        # Rows are views into the shared requests' matrices; copy them into one per caller
+        return np.stack(await coalescer.embed(texts, token_counts, send))
 
     async def _process_single_batch(
-        self, batch: List[str], model: str, encoding_format: str, context_prefix: str
-    ) -> List[List[float]]:
+        self,
+        batch: List[str],
+        model: str,
+        encoding_format: str,
+        context_prefix: str,
+        token_count: Optional[int] = None,
+    ) -> np.ndarray:
         """Process a single batch of texts."""
         try:
-            response = await self._rate_limited_embed(batch, model, encoding_format)
-            embeddings = [e.embedding for e in response.data]
-            return embeddings
+            response = await self._rate_limited_embed(
+                batch, model, encoding_format, token_count=token_count
+            )
+            return _decode_embeddings(response.data)
         except Exception as e:
             # Check if it's a token limit error
             if "maximum context length" in str(e) or "max_tokens_per_request" in str(e):
@@ -269,7 +298,7 @@ class OpenAIText2Vec(BaseEmbeddingModel):
 
     async def _handle_token_limit_error(
         self, batch: List[str], model: str, encoding_format: str, context_prefix: str
-    ) -> List[List[float]]:
+    ) -> np.ndarray:
         """Handle token limit errors by splitting batches."""
         # Split batch in half and retry
         if len(batch) > 1:
@@ -280,7 +309,7 @@ class OpenAIText2Vec(BaseEmbeddingModel):
             second_half = await self._process_single_batch(
                 batch[mid:], model, encoding_format, context_prefix
             )
-            return first_half + second_half
+            return np.concatenate([first_half, second_half])
         else:
             # Single text is too long - this shouldn't happen if chunkers work correctly
             self.logger.error(
@@ -316,19 +345,14 @@ class OpenAIText2Vec(BaseEmbeddingModel):
             )
 
     def _reinsert_empty_vectors(
-        self, embeddings: List[List[float]], empty_indices: set, total_length: int
-    ) -> List[List[float]]:
-        """Reinsert empty vectors at their original positions."""
-        result = []
-        embedding_idx = 0
-
-        for i in range(total_length):
-            if i in empty_indices:
-                result.append([0.0] * self.vector_dimensions)
-            else:
-                result.append(embeddings[embedding_idx])
-                embedding_idx += 1
+        self, embeddings: np.ndarray, empty_indices: set, total_length: int
+    ) -> np.ndarray:
+        """Reinsert empty (zero) vectors at their original positions."""
+        if not empty_indices:
+            return embeddings
 
+        result = np.zeros((total_length, embeddings.shape[1]), dtype=np.float32)
+        result[[i for i in range(total_length) if i not in empty_indices]] = embeddings
         return result
 
     async def close(self):
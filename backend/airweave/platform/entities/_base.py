@@ -7,9 +7,9 @@ import json
 import os
 import re
 import sys
-from collections.abc import Set
 from datetime import datetime
 from enum import Enum
+from types import ModuleType
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Tuple, Type
 from uuid import UUID
 
@@ -23,6 +23,8 @@ from pydantic import (
     model_validator,
 )
 
+from airweave.platform.entities._payload import build_storage_payload
+
 if TYPE_CHECKING:
     from fastembed import SparseEmbedding
 else:
@@ -80,8 +82,9 @@ class AirweaveSystemMetadata(BaseModel):
         "Used for Recency Boosting.",
     )
 
-    # Vectors and hash
-    vectors: Optional[List[List[float] | SparseEmbedding | None]] = Field(
+    # Vectors and hash. During a sync the dense vector is a float32 NumPy row; it is only
+    # turned into a list of floats at the destination boundary or when serialized.
+    vectors: Optional[List[List[float] | Any | SparseEmbedding | None]] = Field(
         None, description="Vector representations of the entity (neural and sparse)."
     )
     hash: Optional[str] = Field(None, description="Content hash for change detection.")
@@ -159,7 +162,7 @@ class AirweaveSystemMetadata(BaseModel):
     def _serialize_vectors(self, vectors):
         """Serialize vectors to JSON-safe structures.
 
-        - Dense vectors (List[float]) are returned as-is
+        - Dense vectors (List[float]) are returned as-is, NumPy arrays as lists
         - SparseEmbedding instances are converted to {"indices": [...], "values": [...]} with lists
         """
         if vectors is None:
@@ -179,6 +182,8 @@ class AirweaveSystemMetadata(BaseModel):
                     values = values.tolist()
 
                 serialized.append({"indices": indices, "values": values})
+            elif hasattr(item, "tolist"):
+                serialized.append(item.tolist())
             else:
                 # Dense vector or already-serializable structure
                 serialized.append(item)
@@ -344,35 +349,12 @@ class BaseEntity(BaseModel):
         # Delegate to system metadata for hash computation
         return self.airweave_system_metadata.compute_hash(entity_data)
 
-    # Helper function to recursively clean nested structures
-    @staticmethod
-    def _clean_nested_data(obj, exclude_set: Set[str]):
-        if isinstance(obj, dict):
-            # Remove excluded fields and recursively clean remaining values
-            cleaned = {}
-            for key, value in obj.items():
-                if key not in exclude_set:
-                    cleaned[key] = BaseEntity._clean_nested_data(value, exclude_set)
-            return cleaned
-        elif isinstance(obj, list):
-            # Recursively clean each item in the list
-            return [BaseEntity._clean_nested_data(item, exclude_set) for item in obj]
-        elif isinstance(obj, UUID):
-            # Convert UUID objects to strings
-            return str(obj)
-        elif isinstance(obj, datetime):
-            # Convert datetime to ISO format string
-            return obj.isoformat()
-        else:
-            # Return primitive types as-is
-            return obj
-
     def to_storage_dict(self, exclude_fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """Convert entity to a dictionary suitable for storage in vector databases.
 
         This method handles serialization of complex types (dicts, lists) to JSON strings,
-        except for specific fields that should remain as objects (like breadcrumbs).
-
+        except for specific fields that should remain as objects (like breadcrumbs). Vectors
+        are not included; destinations store them in their vector fields.
 
         Args:
             exclude_fields: Optional list of field names to exclude from serialization
@@ -380,36 +362,7 @@ class BaseEntity(BaseModel):
         Returns:
             Dict with all fields properly serialized for storage
         """
-        # Start with entity data only (no system metadata)
-        data = self.model_dump(exclude_none=True)
-
-        # Create set of fields to exclude for faster lookup
-        exclude_set = set(exclude_fields) if exclude_fields else set()
-        # Never include sensitive fields in payload
-        exclude_set.update({"vector", "hash", "db_entity_id"})
-
-        # Recursively clean the data
-        data = self._clean_nested_data(data, exclude_set)
-        # Fields that should remain as objects and not be JSON serialized
-        object_fields = {"breadcrumbs"}
-
-        # Serialize complex types to JSON strings, except for specified object fields
-        for key, value in data.items():
-            if key not in object_fields and isinstance(value, (dict, list)):
-                try:
-                    data[key] = json.dumps(value)
-                except (TypeError, ValueError) as e:
-                    # If serialization fails, log and convert to string representation
-                    import logging
-
-                    logging.warning(f"Failed to JSON serialize field '{key}': {e}")
-                    data[key] = str(value)
-
-        data["airweave_system_metadata"] = self._clean_nested_data(
-            self.airweave_system_metadata.model_dump(), []
-        )
-
-        return data
+        return build_storage_payload(self, exclude_fields or ())
 
 
 class ChunkEntity(BaseEntity):
@@ -739,6 +692,13 @@ class FileSystemMetadata(AirweaveSystemMetadata):
         None, description="Temporary local path if file is downloaded"
     )
     checksum: Optional[str] = Field(None, description="File checksum/hash if available")
+    remote_version: Optional[str] = Field(
+        None,
+        description=(
+            "Version reported by the source without downloading (e.g., md5Checksum, eTag, "
+            "content_hash); used to skip unchanged files"
+        ),
+    )
     total_size: Optional[int] = Field(None, description="Total size of the file in bytes")
 
     # Storage fields - set by storage manager
@@ -1012,6 +972,11 @@ class CodeFileEntity(ChunkEntity):
         default_factory=list, description="Breadcrumb navigation path"
     )
 
+    # Code files report a remote version (e.g. a blob SHA) like other files
+    airweave_system_metadata: Optional[FileSystemMetadata] = Field(
+        default=None, description="File-specific system metadata for tracking and synchronization."
+    )
+
 
 class WebEntity(BaseEntity):
     """Entity representing a web page to be crawled."""
@@ -1055,21 +1020,30 @@ def ensure_file_entity_models():
         if not module.__name__.startswith("airweave.platform"):
             continue
 
-        # Look for FileEntity subclasses in the module
-        for _, cls in list(module.__dict__.items()):
-            # Check if it's a class and a subclass of FileEntity (but not FileEntity itself)
-            if (
-                isinstance(cls, type)
-                and issubclass(cls, FileEntity)
-                and cls is not FileEntity
-                and cls not in _file_entity_models_created
-            ):
-                try:
-                    # Create parent and chunk models
-                    parent_model, chunk_model = cls.create_parent_chunk_models()
-                    print(
-                        "Runtime: Auto-generated parent and chunk models for "
-                        f"{cls.__name__} in {cls.__module__}"
-                    )
-                except Exception as e:
-                    print(f"Runtime: Error creating models for {cls.__name__}: {e}")
+        ensure_module_file_entity_models(module)
+
+
+def ensure_module_file_entity_models(module: ModuleType) -> None:
+    """Create the parent and chunk models of the FileEntity subclasses found in a module.
+
+    Used when entity modules are imported on demand (see ResourceLocator), so the generated
+    models can be looked up by name without importing every entity module first.
+    """
+    # Look for FileEntity subclasses in the module
+    for _, cls in list(module.__dict__.items()):
+        # Check if it's a class and a subclass of FileEntity (but not FileEntity itself)
+        if (
+            isinstance(cls, type)
+            and issubclass(cls, FileEntity)
+            and cls is not FileEntity
+            and cls not in _file_entity_models_created
+        ):
+            try:
+                # Create parent and chunk models
+                parent_model, chunk_model = cls.create_parent_chunk_models()
+                print(
+                    "Runtime: Auto-generated parent and chunk models for "
+                    f"{cls.__name__} in {cls.__module__}"
+                )
+            except Exception as e:
+                print(f"Runtime: Error creating models for {cls.__name__}: {e}")
@@ -0,0 +1,246 @@
+"""Storage payload serialization for vector destinations.
+
+Building a point's payload used to ``model_dump`` the entity, walk every value recursively
+and JSON-encode nested fields, for each chunk. Most entity fields are plain strings,
+numbers, booleans, timestamps or UUIDs whose handling follows from their annotation. So
+per entity class (and set of excluded fields) we compile a plan once that says, for each
+field, whether it is copied as-is, converted (datetime, UUID), or dumped through pydantic
+and JSON-encoded (dicts, lists, nested models, anything else). Only that last group goes
+through pydantic and the recursive cleanup, and JSON is encoded with orjson (a declared
+dependency; the standard library is only a fallback for broken installs).
+
+The output is the same as the previous generic path, except that JSON strings produced by
+orjson are compact and not ASCII-escaped. Vectors are never part of the payload.
+"""
+
+import json
+import logging
+import types
+import typing
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple, Type
+from uuid import UUID
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the standard library
+    orjson = None
+    logging.getLogger(__name__).warning(
+        "orjson is not installed, storage payloads are encoded with the json module"
+    )
+
+# How a field's value becomes a payload value
+_RAW = 0  # str, int, float, bool (and their subclasses, e.g. str enums): copied as-is
+_DATETIME = 1  # datetime: ISO format string
+_UUID = 2  # UUID: string
+_DYNAMIC = 3  # everything else: pydantic dump, cleanup, JSON encoding of dicts/lists
+
+# Fields never written to the payload, at any nesting level
+ALWAYS_EXCLUDED = frozenset({"vector", "hash", "db_entity_id"})
+
+# Fields kept as objects instead of being JSON-encoded
+OBJECT_FIELDS = frozenset({"breadcrumbs"})
+
+
+def clean_nested_data(obj: Any, exclude: Iterable[str]) -> Any:
+    """Drop excluded keys at any depth and turn UUIDs and datetimes into strings."""
+    if isinstance(obj, dict):
+        return {
+            key: clean_nested_data(value, exclude)
+            for key, value in obj.items()
+            if key not in exclude
+        }
+    if isinstance(obj, list):
+        return [clean_nested_data(item, exclude) for item in obj]
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return obj
+
+
+def dumps_json(value: Any) -> str:
+    """Encode a payload value as a JSON string, with orjson if available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # e.g. integers beyond 64 bit; the standard library may still manage
+            pass
+    return json.dumps(value)
+
+
+@dataclass(frozen=True)
+class PayloadPlan:
+    """Precompiled serialization of one model class."""
+
+    fields: Tuple[Tuple[str, int], ...]
+    # Fields (and computed fields) serialized through pydantic
+    dynamic: FrozenSet[str]
+    # Keys dropped inside the values of dynamic fields
+    nested_exclude: FrozenSet[str]
+    # How those keys look in JSON, to tell whether a value needs cleaning at all
+    nested_exclude_markers: Tuple[str, ...]
+
+
+_plans: Dict[Tuple[Type[BaseModel], FrozenSet[str], FrozenSet[str]], PayloadPlan] = {}
+
+
+def _field_kind(annotation: Any) -> int:
+    """Classify a field by its annotation (Optional[X] counts as X)."""
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union or origin is types.UnionType:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return _DYNAMIC
+        annotation = args[0]
+
+    if not isinstance(annotation, type):
+        return _DYNAMIC
+    if issubclass(annotation, (str, int, float)):  # bool is an int
+        return _RAW
+    if issubclass(annotation, datetime):
+        return _DATETIME
+    if issubclass(annotation, UUID):
+        return _UUID
+    return _DYNAMIC
+
+
+def split_fields(
+    model_class: Type[BaseModel], exclude: Iterable[str], include_computed: bool = True
+) -> Tuple[List[Tuple[str, int]], FrozenSet[str]]:
+    """Classify the fields of a model class.
+
+    Args:
+        model_class: The model class
+        exclude: Fields to leave out
+        include_computed: Also return computed fields (always dynamic)
+
+    Returns:
+        (name, kind) of each field in definition order, and the names of the dynamic ones,
+        which must be serialized through pydantic. All others can be read with getattr and
+        hold str, int, float, bool, enum, datetime or UUID values (or None).
+    """
+    # Fields with custom serializers keep going through pydantic
+    serialized_fields = set()
+    for decorator in model_class.__pydantic_decorators__.field_serializers.values():
+        serialized_fields.update(decorator.info.fields)
+
+    fields = []
+    for name, field_info in model_class.model_fields.items():
+        if name in exclude or field_info.exclude:
+            continue
+        kind = _DYNAMIC if name in serialized_fields else _field_kind(field_info.annotation)
+        fields.append((name, kind))
+    if include_computed:
+        fields.extend((name, _DYNAMIC) for name in model_class.model_computed_fields)
+    return fields, frozenset(name for name, kind in fields if kind == _DYNAMIC)
+
+
+def get_payload_plan(
+    model_class: Type[BaseModel], exclude: FrozenSet[str], nested_exclude: FrozenSet[str]
+) -> PayloadPlan:
+    """Get or compile the plan of a model class.
+
+    Args:
+        model_class: The model class
+        exclude: Fields left out of the payload
+        nested_exclude: Keys dropped at any depth inside field values
+    """
+    key = (model_class, exclude, nested_exclude)
+    plan = _plans.get(key)
+    if plan is not None:
+        return plan
+
+    fields, dynamic = split_fields(model_class, exclude)
+    plan = PayloadPlan(
+        fields=tuple(fields),
+        dynamic=dynamic,
+        nested_exclude=nested_exclude,
+        nested_exclude_markers=tuple(f'"{key}":' for key in nested_exclude),
+    )
+    _plans[key] = plan
+    return plan
+
+
+def serialize_model(
+    model: BaseModel, plan: PayloadPlan, exclude_none: bool, encode_json: bool
+) -> Dict[str, Any]:
+    """Serialize a model following its plan.
+
+    Args:
+        model: The model to serialize
+        plan: Plan of the model's class
+        exclude_none: Leave out None values
+        encode_json: JSON-encode dict and list values (except OBJECT_FIELDS)
+
+    Returns:
+        The payload dict
+    """
+    dumped = (
+        model.model_dump(include=set(plan.dynamic), exclude_none=exclude_none)
+        if plan.dynamic
+        else {}
+    )
+
+    data: Dict[str, Any] = {}
+    for name, kind in plan.fields:
+        if kind == _DYNAMIC:
+            if name not in dumped:
+                continue
+            value = dumped[name]
+            if encode_json and name not in OBJECT_FIELDS and isinstance(value, (dict, list)):
+                data[name] = _encode_field(name, value, plan)
+            else:
+                data[name] = clean_nested_data(value, plan.nested_exclude)
+            continue
+
+        value = getattr(model, name)
+        if value is None:
+            if exclude_none:
+                continue
+        elif kind == _DATETIME:
+            value = value.isoformat()
+        elif kind == _UUID:
+            value = str(value)
+        data[name] = value
+    return data
+
+
+def _encode_field(name: str, value: Any, plan: PayloadPlan) -> str:
+    """JSON-encode a dict or list field value, dropping excluded keys at any depth."""
+    if orjson is not None:
+        # orjson writes UUIDs and datetimes like clean_nested_data does, so the value only
+        # needs cleaning if an excluded key occurs in it (rare; a false alarm is harmless)
+        try:
+            encoded = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            encoded = None
+        if encoded is not None and not any(m in encoded for m in plan.nested_exclude_markers):
+            return encoded
+
+    value = clean_nested_data(value, plan.nested_exclude)
+    try:
+        return dumps_json(value)
+    except (TypeError, ValueError) as e:
+        # If serialization fails, log and convert to string representation
+        logging.warning(f"Failed to JSON serialize field '{name}': {e}")
+        return str(value)
+
+
+def build_storage_payload(entity: BaseModel, exclude_fields: Iterable[str] = ()) -> Dict[str, Any]:
+    """Build the destination payload of an entity (see BaseEntity.to_storage_dict)."""
+    exclude = ALWAYS_EXCLUDED.union(exclude_fields)
+    plan = get_payload_plan(type(entity), exclude | {"airweave_system_metadata"}, exclude)
+    data = serialize_model(entity, plan, exclude_none=True, encode_json=True)
+
+    # Vectors are stored in the destination's vector fields, not in the payload
+    metadata = entity.airweave_system_metadata
+    metadata_plan = get_payload_plan(type(metadata), frozenset({"vectors"}), frozenset())
+    data["airweave_system_metadata"] = serialize_model(
+        metadata, metadata_plan, exclude_none=False, encode_json=False
+    )
+    return data
@@ -13,6 +13,7 @@ class DocumentConverterResult:
         text_content: str = "",
         file_path: str = "",
         metadata: Optional[Dict[str, Any]] = None,
+        cacheable: bool = True,
     ):
         """Initialize the AsyncDocumentConverterResult.
 
@@ -21,16 +22,27 @@ class DocumentConverterResult:
             text_content: The extracted text content in markdown format
             file_path: The path to the original file
             metadata: Additional metadata extracted from the document
+            cacheable: False for degraded results (e.g. a fallback after an OCR failure)
+                that must not be served from the conversion cache later
         """
         self.title: Optional[str] = title
         self.text_content: str = text_content
         self.file_path: str = file_path
         self.metadata: Dict[str, Any] = metadata or {}
+        self.cacheable: bool = cacheable
 
 
 class DocumentConverter(ABC):
     """Abstract base class for all document converters."""
 
+    # Bump when a converter's output changes, so cached conversions are not reused
+    VERSION = "1"
+
+    @property
+    def cache_version(self) -> str:
+        """Version component of this converter's conversion cache keys."""
+        return self.VERSION
+
     @abstractmethod
     async def convert(self, local_path: str, **kwargs: Any) -> Union[None, DocumentConverterResult]:
         """Convert a document to markdown text.
@@ -0,0 +1,237 @@
+"""Content-addressed cache of document conversion results.
+
+Converting a file (OCR for PDFs and images in particular) is by far the most expensive step
+of processing it, and re-syncs convert the same unchanged files again. Results are cached
+under (content SHA-256, converter, converter version) in the sync storage backend (local disk
+or Azure, via StorageManager's client), with a small in-process LRU tier in front. Entries live
+under the conversion-cache/ prefix of the existing sync-data container, so no extra container
+has to be provisioned.
+
+On local disk the cache is kept under CONVERSION_CACHE_MAX_BYTES by evicting the least
+recently used entries. On Azure, eviction is left to a blob lifecycle rule on the
+conversion-cache/ prefix.
+"""
+
+import io
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.platform.file_handling.conversion._base import DocumentConverterResult
+from airweave.platform.sync.async_helpers import run_in_thread_pool
+
+CONVERSION_CACHE_CONTAINER = "sync-data"
+CONVERSION_CACHE_PREFIX = "conversion-cache"
+
+
+def _scan_cache_dir(cache_dir: Path) -> List[Tuple[float, int, Path]]:
+    """List (last used, size, path) of all cached entries on local disk."""
+    entries = []
+    for path in cache_dir.rglob("*.json"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    return entries
+
+
+def _evict_lru(cache_dir: Path, max_bytes: int) -> Tuple[int, int]:
+    """Delete least recently used entries until the cache fits. Returns (evicted, bytes left)."""
+    entries = sorted(_scan_cache_dir(cache_dir))
+    total = sum(size for _, size, _ in entries)
+    evicted = 0
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        total -= size
+        evicted += 1
+    return evicted, total
+
+
+class ConversionCache:
+    """Two-tier (memory, storage) cache of DocumentConverterResults."""
+
+    def __init__(self, max_bytes: int, memory_bytes: int):
+        """Initialize the cache. Storage is resolved lazily on first use.
+
+        Args:
+            max_bytes: Size cap of the cache on local disk storage
+            memory_bytes: Size cap of the in-process tier
+        """
+        self.max_bytes = max_bytes
+        self.memory_bytes = memory_bytes
+
+        self._memory: "OrderedDict[str, Tuple[Optional[str], str, Dict[str, Any]]]" = OrderedDict()
+        self._memory_size = 0
+
+        # Approximate size of the on-disk cache, None until first scanned
+        self._disk_size: Optional[int] = None
+        self._evicting = False
+
+        self._metrics: Dict[str, int] = {
+            "memory_hits": 0,
+            "storage_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "errors": 0,
+        }
+
+    @staticmethod
+    def key(content_hash: str, converter: str, version: str) -> str:
+        """Blob name of a cached conversion."""
+        return f"{converter}/{version}/{content_hash[:2]}/{content_hash}.json"
+
+    async def get(self, key: str) -> Optional[DocumentConverterResult]:
+        """Return the cached conversion result, or None on a miss."""
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            self._metrics["memory_hits"] += 1
+            return self._to_result(entry)
+
+        from airweave.platform.storage import storage_manager
+
+        try:
+            # A miss is the normal outcome of a lookup, not worth a warning
+            data = await storage_manager.client.download_file(
+                logger,
+                CONVERSION_CACHE_CONTAINER,
+                f"{CONVERSION_CACHE_PREFIX}/{key}",
+                missing_ok=True,
+            )
+        except Exception as e:
+            logger.debug(f"Conversion cache lookup failed for {key}: {e}")
+            self._metrics["errors"] += 1
+            data = None
+
+        if not data:
+            self._metrics["misses"] += 1
+            return None
+
+        payload = json.loads(data)
+        entry = (payload.get("title"), payload["text_content"], payload.get("metadata") or {})
+        self._remember(key, entry)
+        self._touch(key)
+        self._metrics["storage_hits"] += 1
+        return self._to_result(entry)
+
+    async def put(self, key: str, result: DocumentConverterResult) -> None:
+        """Store a conversion result in both tiers. Failures are logged and ignored."""
+        entry = (result.title, result.text_content, result.metadata)
+        self._remember(key, entry)
+
+        from airweave.platform.storage import storage_manager
+
+        data = json.dumps(
+            {"title": entry[0], "text_content": entry[1], "metadata": entry[2]}, default=str
+        ).encode("utf-8")
+        try:
+            await storage_manager.client.upload_file(
+                logger,
+                CONVERSION_CACHE_CONTAINER,
+                f"{CONVERSION_CACHE_PREFIX}/{key}",
+                io.BytesIO(data),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store conversion result in cache: {e}")
+            self._metrics["errors"] += 1
+            return
+
+        self._metrics["stores"] += 1
+        await self._enforce_disk_limit(len(data))
+
+    def _to_result(self, entry: Tuple[Optional[str], str, Dict[str, Any]]):
+        title, text_content, metadata = entry
+        return DocumentConverterResult(
+            title=title, text_content=text_content, metadata=dict(metadata)
+        )
+
+    def _remember(self, key: str, entry: Tuple[Optional[str], str, Dict[str, Any]]) -> None:
+        """Add an entry to the in-process LRU tier."""
+        size = len(entry[1])
+        if size > self.memory_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_size -= len(previous[1])
+        self._memory[key] = entry
+        self._memory_size += size
+        while self._memory_size > self.memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted[1])
+
+    def _local_cache_dir(self) -> Optional[Path]:
+        """Directory of the cache when storage is on local disk, else None."""
+        from airweave.platform.storage import storage_manager
+
+        if not storage_manager.client.is_local_disk:
+            return None
+        backend = storage_manager.client.backend
+        return backend.base_path / CONVERSION_CACHE_CONTAINER / CONVERSION_CACHE_PREFIX
+
+    def _touch(self, key: str) -> None:
+        """Record use of a local disk entry (its mtime drives LRU eviction)."""
+        cache_dir = self._local_cache_dir()
+        if cache_dir is None:
+            return
+        try:
+            os.utime(cache_dir / key.replace("/", os.sep))
+        except OSError:
+            pass
+
+    async def _enforce_disk_limit(self, added_bytes: int) -> None:
+        """Evict least recently used local disk entries once the size cap is exceeded."""
+        cache_dir = self._local_cache_dir()
+        if cache_dir is None:
+            return
+
+        if self._disk_size is not None:
+            self._disk_size += added_bytes
+            if self._disk_size <= self.max_bytes:
+                return
+        # One scan or eviction at a time; concurrent stores are counted by the next one
+        if self._evicting:
+            return
+
+        self._evicting = True
+        try:
+            if self._disk_size is None:
+                entries = await run_in_thread_pool(_scan_cache_dir, cache_dir)
+                self._disk_size = sum(size for _, size, _ in entries)
+                if self._disk_size <= self.max_bytes:
+                    return
+
+            start = time.monotonic()
+            # Evict down to 90% so eviction does not run on every store
+            evicted, self._disk_size = await run_in_thread_pool(
+                _evict_lru, cache_dir, int(self.max_bytes * 0.9)
+            )
+            self._metrics["evictions"] += evicted
+            logger.info(
+                f"Evicted {evicted} conversion cache entries in "
+                f"{time.monotonic() - start:.2f}s ({self._disk_size} bytes left)"
+            )
+        finally:
+            self._evicting = False
+
+    def metrics_snapshot(self) -> Dict[str, int]:
+        """Return the current hit/miss counters."""
+        return dict(self._metrics)
+
+
+# Global instance
+conversion_cache = ConversionCache(
+    max_bytes=settings.CONVERSION_CACHE_MAX_BYTES,
+    memory_bytes=settings.CONVERSION_CACHE_MEMORY_BYTES,
+)
@@ -56,6 +56,20 @@ class AsyncImageConverter(DocumentConverter):
         # Log available capabilities
         self._log_available_capabilities()
 
+    @property
+    def cache_version(self) -> str:
+        """Output depends on which of OCR, exiftool and LLM description are available."""
+        capabilities = [
+            name
+            for name, available in (
+                ("ocr", self.mistral_client),
+                ("exif", self.exiftool_available),
+                ("llm", self.openai_client),
+            )
+            if available
+        ]
+        return "-".join([self.VERSION, *capabilities])
+
     def _log_available_capabilities(self):
         """Log which conversion capabilities are available."""
         capabilities = []
@@ -114,7 +128,10 @@ class AsyncImageConverter(DocumentConverter):
             logger.warning(f"No content extracted from image {local_path}")
             return None
 
-        return DocumentConverterResult(title=None, text_content=md_content.strip())
+        # Without OCR text (failed, or over the size limit) retry OCR on the next sync
+        return DocumentConverterResult(
+            title=None, text_content=md_content.strip(), cacheable=not self.mistral_client
+        )
 
     def _has_minimum_viable_capabilities(self) -> bool:
         """Check if we have enough capabilities for a meaningful conversion.
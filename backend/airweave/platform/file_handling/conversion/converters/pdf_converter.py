@@ -1,8 +1,9 @@
 """PDF to Markdown converter with Mistral OCR support."""
 
+import asyncio
 import os
 import tempfile
-from typing import Any, Optional, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
 
 from airweave.core.config import settings
 from airweave.core.logging import logger
@@ -11,6 +12,7 @@ from airweave.platform.file_handling.conversion._base import (
     DocumentConverterResult,
 )
 from airweave.platform.sync.async_helpers import run_in_thread_pool
+from airweave.platform.sync.transform_executor import get_transform_executor
 
 # Initialize Mistral client if API key is available
 mistral_client = None
@@ -22,6 +24,86 @@ if hasattr(settings, "MISTRAL_API_KEY") and settings.MISTRAL_API_KEY:
 # Maximum file size for Mistral OCR (50MB in bytes)
 MAX_MISTRAL_FILE_SIZE = 50 * 1024 * 1024
 
+# (start page index, end page index, batch file path, batch file size)
+_PageBatch = Tuple[int, int, str, int]
+
+
+def _pdf_title(reader) -> Optional[str]:
+    """Extract title from PDF metadata if available."""
+    if reader.metadata and getattr(reader.metadata, "title", None):
+        return str(reader.metadata.title)
+    return None
+
+
+def _split_pdf_into_batches(
+    pdf_path: str, temp_dir: str
+) -> Tuple[Optional[str], int, List[_PageBatch]]:
+    """Write the PDF's pages into batch files that each aim to stay under the OCR size limit.
+
+    Runs on the transform executor (a worker thread or process).
+
+    Returns:
+        Tuple of (title, number of pages, batches in page order)
+    """
+    import PyPDF2
+
+    with open(pdf_path, "rb") as file:
+        reader = PyPDF2.PdfReader(file)
+        title = _pdf_title(reader)
+
+        num_pages = len(reader.pages)
+        file_size = os.path.getsize(pdf_path)
+        avg_page_size = file_size / num_pages if num_pages > 0 else 0
+
+        # Calculate pages per batch to stay under 50MB limit (with 10% buffer)
+        pages_per_batch = max(1, int((MAX_MISTRAL_FILE_SIZE * 0.9) / avg_page_size))
+
+        logger.debug(f"PDF has {num_pages} pages, avg {avg_page_size / 1024 / 1024:.2f}MB per page")
+        logger.debug(f"Processing in batches of {pages_per_batch} pages")
+
+        batches = []
+        for batch_num, start_idx in enumerate(range(0, num_pages, pages_per_batch), start=1):
+            end_idx = min(start_idx + pages_per_batch, num_pages)
+            writer = PyPDF2.PdfWriter()
+            for i in range(start_idx, end_idx):
+                writer.add_page(reader.pages[i])
+
+            temp_batch_path = os.path.join(temp_dir, f"batch_{batch_num}.pdf")
+            with open(temp_batch_path, "wb") as batch_file:
+                writer.write(batch_file)
+            batches.append((start_idx, end_idx, temp_batch_path, os.path.getsize(temp_batch_path)))
+
+    return title, num_pages, batches
+
+
+def _split_pdf_pages(pdf_path: str, start_idx: int, end_idx: int, temp_dir: str) -> List[str]:
+    """Write pages [start_idx, end_idx) into one file each. Runs on the transform executor."""
+    import PyPDF2
+
+    page_paths = []
+    with open(pdf_path, "rb") as file:
+        reader = PyPDF2.PdfReader(file)
+        for i in range(start_idx, end_idx):
+            single_writer = PyPDF2.PdfWriter()
+            single_writer.add_page(reader.pages[i])
+            temp_page_path = os.path.join(temp_dir, f"page_{i + 1}.pdf")
+            with open(temp_page_path, "wb") as page_file:
+                single_writer.write(page_file)
+            page_paths.append(temp_page_path)
+    return page_paths
+
+
+def _extract_text_with_pypdf(local_path: str) -> Tuple[str, Optional[str]]:
+    """Extract the text of every page with PyPDF2. Runs on the transform executor."""
+    import PyPDF2
+
+    with open(local_path, "rb") as file:
+        reader = PyPDF2.PdfReader(file)
+        title = _pdf_title(reader)
+        page_texts = [page.extract_text() for page in reader.pages]
+
+    return "".join(text for text in page_texts if text).strip(), title
+
 
 class PdfConverter(DocumentConverter):
     """Converts PDF files to Markdown using Mistral OCR or falls back to PyPDF2."""
@@ -30,6 +112,11 @@ class PdfConverter(DocumentConverter):
         """Initialize the PDF converter with Mistral client if API key is available."""
         self.mistral_client = mistral_client
 
+    @property
+    def cache_version(self) -> str:
+        """OCR and PyPDF2 output differ, so they are cached separately."""
+        return f"{self.VERSION}-{'ocr' if self.mistral_client else 'pypdf'}"
+
     async def convert(self, local_path: str, **kwargs: Any) -> Union[None, DocumentConverterResult]:
         """Convert a PDF file to markdown using Mistral OCR when available.
 
@@ -47,8 +134,11 @@ class PdfConverter(DocumentConverter):
         # Try Mistral OCR first if available
         if self.mistral_client:
             try:
-                md_content, title = await self._convert_with_mistral(local_path)
-                return DocumentConverterResult(title=title, text_content=md_content)
+                md_content, title, failed_pages = await self._convert_with_mistral(local_path)
+                # Pages lost to OCR errors may succeed next time, don't cache the gaps
+                return DocumentConverterResult(
+                    title=title, text_content=md_content, cacheable=failed_pages == 0
+                )
             except Exception as e:
                 logger.error(f"Error converting PDF with Mistral OCR: {str(e)}")
                 logger.warning("Falling back to PyPDF2")
@@ -56,23 +146,28 @@ class PdfConverter(DocumentConverter):
         # Fall back to PyPDF2
         try:
             md_content, title = await self._convert_with_pypdf(local_path)
-            return DocumentConverterResult(title=title, text_content=md_content)
+            # Don't cache a PyPDF2 fallback under the OCR key
+            return DocumentConverterResult(
+                title=title, text_content=md_content, cacheable=not self.mistral_client
+            )
         except ImportError:
             return DocumentConverterResult(
-                title=None, text_content="PDF conversion requires Mistral API key or PyPDF2."
+                title=None,
+                text_content="PDF conversion requires Mistral API key or PyPDF2.",
+                cacheable=False,
             )
         except Exception as e:
             logger.error(f"Error converting PDF with PyPDF2: {str(e)}")
             return None
 
-    async def _convert_with_mistral(self, local_path: str) -> Tuple[str, Optional[str]]:
+    async def _convert_with_mistral(self, local_path: str) -> Tuple[str, Optional[str], int]:
         """Convert PDF using Mistral OCR.
 
         Args:
             local_path: Path to the PDF file
 
         Returns:
-            Tuple of (markdown_content, title)
+            Tuple of (markdown_content, title, number of pages that failed OCR)
 
         Raises:
             Exception: If Mistral OCR conversion fails
@@ -88,7 +183,8 @@ class PdfConverter(DocumentConverter):
             return await self._process_large_pdf(local_path)
 
         # Process normally for files under 50MB
-        return await self._process_single_pdf(local_path)
+        md_content, title = await self._process_single_pdf(local_path)
+        return md_content, title, 0
 
     async def _process_single_pdf(self, pdf_path: str) -> Tuple[str, Optional[str]]:
         """Process a single PDF file with Mistral OCR.
@@ -131,9 +227,7 @@ class PdfConverter(DocumentConverter):
         ocr_response = await run_in_thread_pool(_process_ocr)
 
         # Extract markdown content from each page
-        md_content = ""
-        for page in ocr_response.pages:
-            md_content += f"{page.markdown}"
+        md_content = "".join(page.markdown for page in ocr_response.pages)
 
         # Try to extract title from metadata if available
         title = None
@@ -143,126 +237,113 @@ class PdfConverter(DocumentConverter):
 
         return md_content.strip(), title
 
-    async def _process_large_pdf(self, pdf_path: str) -> Tuple[str, Optional[str]]:
+    async def _process_large_pdf(self, pdf_path: str) -> Tuple[str, Optional[str], int]:
         """Process a large PDF by splitting it into batches under 50MB and processing each batch.
 
+        Batches are OCR'd concurrently (up to PDF_OCR_MAX_CONCURRENT_BATCHES at a time) and
+        reassembled in page order. Pages that still fail individually are left out.
+
         Args:
             pdf_path: Path to the PDF file
 
         Returns:
-            Tuple of (markdown_content, title)
+            Tuple of (markdown_content, title, number of pages that failed OCR)
         """
-        import PyPDF2
-
-        title = None
-        combined_md = ""
         temp_dir = tempfile.mkdtemp()
+        semaphore = asyncio.Semaphore(max(1, settings.PDF_OCR_MAX_CONCURRENT_BATCHES))
 
         try:
-            # Open the PDF and get page count
-            with open(pdf_path, "rb") as file:
-                reader = PyPDF2.PdfReader(file)
-                title = self._extract_pdf_title(reader)
-
-                # Calculate batch size
-                num_pages, pages_per_batch = self._calculate_batch_size(pdf_path, reader)
-
-                # Process in batches
-                batch_num = 1
-                for start_idx in range(0, num_pages, pages_per_batch):
-                    end_idx = min(start_idx + pages_per_batch, num_pages)
-                    batch_md = await self._process_page_batch(
-                        reader, start_idx, end_idx, temp_dir, batch_num
+            # Splitting rewrites the whole document, keep it off the event loop
+            title, num_pages, batches = await get_transform_executor().run(
+                _split_pdf_into_batches, pdf_path, temp_dir
+            )
+
+            batch_results = await asyncio.gather(
+                *[
+                    self._process_page_batch(
+                        pdf_path, batch, temp_dir, batch_num, num_pages, semaphore
                     )
-                    combined_md += batch_md
-                    batch_num += 1
+                    for batch_num, batch in enumerate(batches, start=1)
+                ]
+            )
 
-            return combined_md.strip(), title
+            md_content = "".join(batch_md for batch_md, _ in batch_results).strip()
+            return md_content, title, sum(failed for _, failed in batch_results)
 
         finally:
             self._cleanup_temp_files(temp_dir)
 
-    def _extract_pdf_title(self, reader) -> Optional[str]:
-        """Extract title from PDF metadata if available."""
-        if reader.metadata and hasattr(reader.metadata, "title"):
-            return reader.metadata.title
-        return None
-
-    def _calculate_batch_size(self, pdf_path: str, reader) -> Tuple[int, int]:
-        """Calculate number of pages and pages per batch."""
-        num_pages = len(reader.pages)
-        file_size = os.path.getsize(pdf_path)
-        avg_page_size = file_size / num_pages if num_pages > 0 else 0
-
-        # Calculate pages per batch to stay under 50MB limit (with 10% buffer)
-        pages_per_batch = max(1, int((MAX_MISTRAL_FILE_SIZE * 0.9) / avg_page_size))
-
-        logger.debug(f"PDF has {num_pages} pages, avg {avg_page_size / 1024 / 1024:.2f}MB per page")
-        logger.debug(f"Processing in batches of {pages_per_batch} pages")
-
-        return num_pages, pages_per_batch
-
     async def _process_page_batch(
-        self, reader, start_idx: int, end_idx: int, temp_dir: str, batch_num: int
-    ) -> str:
-        """Process a batch of PDF pages."""
-        from PyPDF2 import PdfWriter
-
-        # Create batch PDF with multiple pages
-        writer = PdfWriter()
-        for i in range(start_idx, end_idx):
-            writer.add_page(reader.pages[i])
-
-        # Save the batch to a temporary file
-        temp_batch_path = os.path.join(temp_dir, f"batch_{batch_num}.pdf")
-        with open(temp_batch_path, "wb") as batch_file:
-            writer.write(batch_file)
+        self,
+        pdf_path: str,
+        batch: "_PageBatch",
+        temp_dir: str,
+        batch_num: int,
+        num_pages: int,
+        semaphore: asyncio.Semaphore,
+    ) -> Tuple[str, int]:
+        """Process a batch of PDF pages. Returns (markdown, number of failed pages)."""
+        start_idx, end_idx, temp_batch_path, batch_size = batch
 
         # Check if the batch file is still under the limit
-        batch_size = os.path.getsize(temp_batch_path)
         if batch_size > MAX_MISTRAL_FILE_SIZE:
             logger.warning(
                 f"Batch {batch_num} size ({batch_size / 1024 / 1024:.2f}MB) exceeds limit"
             )
-            # Process individual pages in this batch
-            return await self._process_individual_pages(reader, start_idx, end_idx, temp_dir)
         else:
             # Process the batch
             try:
-                batch_md, _ = await self._process_single_pdf(temp_batch_path)
+                async with semaphore:
+                    batch_md, _ = await self._process_single_pdf(temp_batch_path)
                 logger.debug(f"Processed batch {batch_num} (pages {start_idx + 1}-{end_idx})")
-                return batch_md + "\n\n"
+                return batch_md + "\n\n", 0
             except Exception as e:
                 logger.error(f"Error processing batch {batch_num}: {str(e)}")
                 # Fall back to processing pages individually
                 logger.debug(
                     f"Falling back to processing pages {start_idx + 1}-{end_idx} individually"
                 )
-                return await self._process_individual_pages(reader, start_idx, end_idx, temp_dir)
 
-    async def _process_individual_pages(
-        self, reader, start_idx: int, end_idx: int, temp_dir: str
-    ) -> str:
-        """Process individual pages when batch processing fails."""
-        from PyPDF2 import PdfWriter
+        # Process individual pages in this batch
+        return await self._process_individual_pages(
+            pdf_path, start_idx, end_idx, temp_dir, num_pages, semaphore
+        )
 
-        pages_md = ""
-        num_pages = len(reader.pages)
+    async def _process_individual_pages(
+        self,
+        pdf_path: str,
+        start_idx: int,
+        end_idx: int,
+        temp_dir: str,
+        num_pages: int,
+        semaphore: asyncio.Semaphore,
+    ) -> Tuple[str, int]:
+        """Process individual pages when batch processing fails.
+
+        Returns (markdown, number of failed pages).
+        """
+        page_paths = await get_transform_executor().run(
+            _split_pdf_pages, pdf_path, start_idx, end_idx, temp_dir
+        )
 
-        for i in range(start_idx, end_idx):
-            single_writer = PdfWriter()
-            single_writer.add_page(reader.pages[i])
-            temp_page_path = os.path.join(temp_dir, f"page_{i + 1}.pdf")
-            with open(temp_page_path, "wb") as page_file:
-                single_writer.write(page_file)
+        async def _process_page(page_idx: int, temp_page_path: str) -> Optional[str]:
             try:
-                page_md, _ = await self._process_single_pdf(temp_page_path)
-                pages_md += page_md + "\n\n"
-                logger.debug(f"Processed page {i + 1}/{num_pages}")
+                async with semaphore:
+                    page_md, _ = await self._process_single_pdf(temp_page_path)
+                logger.debug(f"Processed page {page_idx + 1}/{num_pages}")
+                return page_md + "\n\n"
             except Exception as e:
-                logger.error(f"Error processing page {i + 1}: {str(e)}")
-
-        return pages_md
+                logger.error(f"Error processing page {page_idx + 1}: {str(e)}")
+                return None
+
+        pages_md = await asyncio.gather(
+            *[
+                _process_page(page_idx, temp_page_path)
+                for page_idx, temp_page_path in enumerate(page_paths, start=start_idx)
+            ]
+        )
+        failed = sum(1 for page_md in pages_md if page_md is None)
+        return "".join(page_md for page_md in pages_md if page_md is not None), failed
 
     def _cleanup_temp_files(self, temp_dir: str) -> None:
         """Clean up temporary files."""
@@ -276,6 +357,8 @@ class PdfConverter(DocumentConverter):
     async def _convert_with_pypdf(self, local_path: str) -> Tuple[str, Optional[str]]:
         """Convert PDF using PyPDF2 as fallback.
 
+        Text extraction is CPU-bound, so it runs on the transform executor.
+
         Args:
             local_path: Path to the PDF file
 
@@ -285,22 +368,4 @@ class PdfConverter(DocumentConverter):
         Raises:
             ImportError: If PyPDF2 is not installed
         """
-        import PyPDF2
-
-        md_content = ""
-        title = None
-
-        with open(local_path, "rb") as file:
-            reader = PyPDF2.PdfReader(file)
-
-            # Try to extract title from metadata
-            if reader.metadata and hasattr(reader.metadata, "title"):
-                title = reader.metadata.title
-
-            # Extract text from each page
-            for _i, page in enumerate(reader.pages):
-                page_text = page.extract_text()
-                if page_text:
-                    md_content += f"{page_text}"
-
-        return md_content.strip(), title
+        return await get_transform_executor().run(_extract_text_with_pypdf, local_path)
@@ -3,15 +3,18 @@
 Handles selecting the appropriate converter for different file types.
 """
 
+import asyncio
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
+from airweave.core.config import settings
 from airweave.core.logging import logger
 from airweave.platform.file_handling.conversion._base import (
     DocumentConverter,
     DocumentConverterResult,
 )
+from airweave.platform.file_handling.conversion.cache import conversion_cache
 from airweave.platform.file_handling.conversion.converters.docx_converter import DocxConverter
 from airweave.platform.file_handling.conversion.converters.html_converter import HtmlConverter
 from airweave.platform.file_handling.conversion.converters.img_converter import AsyncImageConverter
@@ -19,6 +22,36 @@ from airweave.platform.file_handling.conversion.converters.pdf_converter import
 from airweave.platform.file_handling.conversion.converters.pptx_converter import PptxConverter
 from airweave.platform.file_handling.conversion.converters.txt_converter import TextConverter
 from airweave.platform.file_handling.conversion.converters.xlsx_converter import XlsxConverter
+from airweave.platform.file_handling.file_hasher import file_hasher
+from airweave.platform.sync.transform_executor import get_transform_executor
+
+# Converters that do their work locally in Python (as opposed to OCR API calls); only these
+# benefit from running in a worker process when the process transform backend is enabled
+CPU_BOUND_CONVERTER_TYPES = {"docx", "pptx", "xlsx", "html", "text"}
+
+# Event loop of a transform worker process, reused across conversions
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _convert_in_worker(
+    file_path: str, extension: str
+) -> Optional[Tuple[Optional[str], str, Dict[str, Any]]]:
+    """Convert a file inside a transform worker process.
+
+    Returns plain (title, text_content, metadata) so the result pickles cheaply.
+    """
+    global _worker_loop
+
+    converter = document_converter.get_converter(file_path)
+    if converter is None:
+        return None
+    if _worker_loop is None:
+        _worker_loop = asyncio.new_event_loop()
+
+    result = _worker_loop.run_until_complete(converter.convert(file_path, file_extension=extension))
+    if result is None:
+        return None
+    return result.title, result.text_content, result.metadata
 
 
 class DocumentConverterFactory:
@@ -103,11 +136,18 @@ class DocumentConverterFactory:
 
         return self._converters.get(converter_type)
 
-    async def convert(self, file_path: str, **kwargs: Any) -> Union[None, DocumentConverterResult]:
+    async def convert(
+        self, file_path: str, content_hash: Optional[str] = None, **kwargs: Any
+    ) -> Union[None, DocumentConverterResult]:
         """Convert a file to markdown using the appropriate converter.
 
+        Results are cached by file content (see conversion/cache.py), so unchanged files
+        are not converted again on re-syncs.
+
         Args:
             file_path: Path to the file to convert
+            content_hash: SHA-256 of the file content if already known (e.g. the entity
+                checksum); computed from the file otherwise
             **kwargs: Additional arguments to pass to the converter
 
         Returns:
@@ -141,13 +181,81 @@ class DocumentConverterFactory:
         if "llm_model" not in kwargs and self._llm_model:
             kwargs["llm_model"] = self._llm_model
 
+        return await self._convert_cached(converter, file_path, extension, content_hash, kwargs)
+
+    async def _convert_cached(
+        self,
+        converter: DocumentConverter,
+        file_path: str,
+        extension: str,
+        content_hash: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> Union[None, DocumentConverterResult]:
+        """Serve a conversion from the cache, or convert and cache the result."""
+        cache_key = await self._cache_key(file_path, extension, converter, content_hash, kwargs)
+        if cache_key:
+            cached = await conversion_cache.get(cache_key)
+            if cached is not None:
+                cached.file_path = file_path
+                return cached
+
         try:
-            result = await converter.convert(file_path, **kwargs)
-            return result
+            if self._runs_in_worker(extension, kwargs):
+                result = await self._convert_in_worker_process(file_path, kwargs["file_extension"])
+            else:
+                result = await converter.convert(file_path, **kwargs)
         except Exception as e:
             logger.error(f"Error converting file {file_path}: {str(e)}")
             return None
 
+        if cache_key and result and result.text_content and result.cacheable:
+            await conversion_cache.put(cache_key, result)
+        return result
+
+    async def _cache_key(
+        self,
+        file_path: str,
+        extension: str,
+        converter: DocumentConverter,
+        content_hash: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> Optional[str]:
+        """Conversion cache key, or None if this conversion must not use the cache.
+
+        Conversions with caller-provided options (e.g. an LLM client) are not cached.
+        """
+        if not settings.CONVERSION_CACHE_ENABLED or set(kwargs) - {"file_extension"}:
+            return None
+        if not content_hash:
+            content_hash = await file_hasher.hash_file(file_path)
+        return conversion_cache.key(
+            content_hash, self.SUPPORTED_EXTENSIONS[extension], converter.cache_version
+        )
+
+    async def _convert_in_worker_process(
+        self, file_path: str, extension: str
+    ) -> Union[None, DocumentConverterResult]:
+        """Run a conversion on the transform process pool."""
+        converted = await get_transform_executor().run(_convert_in_worker, file_path, extension)
+        if converted is None:
+            return None
+        title, text_content, metadata = converted
+        return DocumentConverterResult(
+            title=title, text_content=text_content, file_path=file_path, metadata=metadata
+        )
+
+    def _runs_in_worker(self, extension: str, kwargs: Dict[str, Any]) -> bool:
+        """Whether to offload a conversion to the transform process pool.
+
+        Only CPU-bound converters are offloaded, and only with the default arguments since
+        LLM clients cannot be sent to another process.
+        """
+        if not get_transform_executor().uses_processes:
+            return False
+        if set(kwargs) - {"file_extension"}:
+            return False
+        return self.SUPPORTED_EXTENSIONS[extension] in CPU_BOUND_CONVERTER_TYPES
+
     def is_supported(self, file_path: str) -> bool:
         """Check if the file extension is supported.
 
@@ -1,6 +1,5 @@
 """Service for managing temporary files."""
 
-import hashlib
 import os
 from typing import AsyncGenerator, AsyncIterator, Dict, Optional
 from uuid import uuid4
@@ -10,6 +9,7 @@ import httpx
 
 from airweave.core.logging import ContextualLogger
 from airweave.platform.entities._base import FileEntity
+from airweave.platform.file_handling.file_hasher import file_hasher
 from airweave.platform.storage import storage_manager
 
 
@@ -105,11 +105,11 @@ class FileManager:
                 )
                 entity.airweave_system_metadata.is_cached = True
 
-                # Calculate checksum from cached file
-                with open(cached_path, "rb") as f:
-                    content = f.read()
-                    entity.airweave_system_metadata.checksum = hashlib.sha256(content).hexdigest()
-                    entity.airweave_system_metadata.total_size = len(content)
+                # Calculate checksum from cached file (single worker call, no full read)
+                checksum = await file_hasher.hash_file(cached_path)
+                entity.airweave_system_metadata.checksum = checksum
+                entity.airweave_system_metadata.hash = checksum
+                entity.airweave_system_metadata.total_size = os.path.getsize(cached_path)
 
                 return entity
         return None
@@ -164,8 +164,13 @@ class FileManager:
         max_size: int,
         logger: ContextualLogger,
     ) -> int:
-        """Download file stream to temporary path."""
+        """Download file stream to temporary path, hashing the bytes as they are written.
+
+        The content checksum is stored on the entity so the file never has to be re-read
+        for hashing later in the pipeline.
+        """
         downloaded_size = 0
+        content_hash = file_hasher.streaming()
         # Truncate long URLs for logging
         url_display = (
             entity.download_url[:100] + "..."
@@ -192,6 +197,7 @@ class FileManager:
                     return downloaded_size
 
                 await f.write(chunk)
+                await content_hash.update(chunk)
 
                 # Log progress for large files
                 if (
@@ -205,6 +211,7 @@ class FileManager:
                         f"({downloaded_size}/{entity.airweave_system_metadata.total_size} bytes)"
                     )
 
+        entity.airweave_system_metadata.checksum = content_hash.hexdigest()
         return downloaded_size
 
     async def _handle_oversized_file(
@@ -248,13 +255,15 @@ class FileManager:
         downloaded_size: int,
         logger: ContextualLogger,
     ) -> None:
-        """Update entity with file metadata."""
-        with open(temp_path, "rb") as f:
-            content = f.read()
-            entity.airweave_system_metadata.checksum = hashlib.sha256(content).hexdigest()
-            entity.airweave_system_metadata.local_path = temp_path
-            entity.airweave_system_metadata.file_uuid = file_uuid
-            entity.airweave_system_metadata.total_size = downloaded_size
+        """Update entity with file metadata.
+
+        The checksum was computed while streaming the download, so it doubles as the
+        content hash used for change detection.
+        """
+        entity.airweave_system_metadata.hash = entity.airweave_system_metadata.checksum
+        entity.airweave_system_metadata.local_path = temp_path
+        entity.airweave_system_metadata.file_uuid = file_uuid
+        entity.airweave_system_metadata.total_size = downloaded_size
 
         logger.debug(
             f"File downloaded successfully (entity_id: {entity.entity_id}, "
@@ -8,7 +8,7 @@ from airweave.platform.auth_providers._base import BaseAuthProvider
 from airweave.platform.configs._base import BaseConfig
 from airweave.platform.destinations._base import BaseDestination
 from airweave.platform.embedding_models._base import BaseEmbeddingModel
-from airweave.platform.entities._base import BaseEntity
+from airweave.platform.entities._base import BaseEntity, ensure_module_file_entity_models
 from airweave.platform.sources._base import BaseSource
 
 PLATFORM_PATH = "airweave.platform"
@@ -134,6 +134,9 @@ class ResourceLocator:
         module = importlib.import_module(
             f"{PLATFORM_PATH}.entities.{entity_definition.module_name}"
         )
+        if not hasattr(module, entity_definition.class_name):
+            # Parent and chunk models of file entities are generated on first use
+            ensure_module_file_entity_models(module)
         return getattr(module, entity_definition.class_name)
 
     @staticmethod
@@ -0,0 +1,173 @@
+"""Registry manifest of platform components.
+
+Syncing platform components used to import every module under airweave/platform (and with
+it every source's SDK) and upsert all definitions on each boot. The manifest holds the
+result of that scan: the definitions of all entities, embedding models, sources,
+destinations, auth providers and transformers, plus two fingerprints:
+
+- ``source_fingerprint`` covers the files the manifest was built from: the platform
+  components and the schema and core modules their definitions are serialized with. A
+  manifest whose source fingerprint does not match the tree is stale and gets rebuilt by
+  scanning.
+- ``fingerprint`` covers the definitions themselves. It is stored in the database after a
+  sync, and a later boot with the same fingerprint skips the sync altogether.
+
+The manifest is generated into the package with ``python -m airweave.platform.registry``
+when the image is built (see the Dockerfile; it is git-ignored), so new containers start
+without scanning. A boot that has to scan anyway writes its result to a runtime copy in the
+temp directory, so running from a source checkout never touches the working tree. Component
+modules are imported on demand by the ResourceLocator.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+import pydantic
+from pydantic import BaseModel, Field
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from airweave import schemas
+from airweave.core.datetime_utils import utc_now_naive
+from airweave.core.logging import logger
+from airweave.models import PlatformSyncState
+
+PLATFORM_DIR = Path(__file__).parent
+MANIFEST_PATH = PLATFORM_DIR / "registry_manifest.json"
+# Written by boots that had to scan, read when the build-time manifest is missing or stale
+RUNTIME_MANIFEST_PATH = Path(tempfile.gettempdir()) / "airweave" / MANIFEST_PATH.name
+
+# Bump when the manifest layout or the way definitions are built changes
+MANIFEST_VERSION = 1
+
+# Name of the platform_sync_state row of the platform components
+SYNC_STATE_NAME = "platform_components"
+
+_FINGERPRINTED_SUFFIXES = (".py", ".yaml", ".yml")
+# Packages next to airweave/platform whose models shape the manifest's definitions
+_FINGERPRINTED_PACKAGES = ("schemas", "core")
+
+
+class TransformerDefinition(BaseModel):
+    """A transformer, with its entity types by name (IDs are assigned by the database)."""
+
+    definition: schemas.TransformerCreate
+    input_entity_names: List[str] = Field(default_factory=list)
+    output_entity_names: List[str] = Field(default_factory=list)
+
+
+class RegistryManifest(BaseModel):
+    """Definitions of all platform components."""
+
+    version: int = MANIFEST_VERSION
+    source_fingerprint: str = ""
+    fingerprint: str = ""
+    entity_definitions: List[schemas.EntityDefinitionCreate] = Field(default_factory=list)
+    embedding_models: List[schemas.EmbeddingModelCreate] = Field(default_factory=list)
+    # Output entity definition IDs are assigned on sync, from the source's entity module
+    sources: List[schemas.SourceCreate] = Field(default_factory=list)
+    destinations: List[schemas.DestinationCreate] = Field(default_factory=list)
+    auth_providers: List[schemas.AuthProviderCreate] = Field(default_factory=list)
+    transformers: List[TransformerDefinition] = Field(default_factory=list)
+
+    def compute_fingerprint(self) -> str:
+        """SHA-256 of the definitions, independent of the fingerprint fields."""
+        content = self.model_dump(mode="json", exclude={"fingerprint", "source_fingerprint"})
+        encoded = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def compute_source_fingerprint(platform_dir: Path = PLATFORM_DIR) -> str:
+    """SHA-256 over the source files the manifest depends on, without importing them.
+
+    Covers the platform directory and the schema and core packages next to it (names and
+    contents). The pydantic version is included since it shapes the generated entity schemas.
+    """
+    digest = hashlib.sha256(f"{MANIFEST_VERSION}:{pydantic.VERSION}".encode())
+    package_dir = platform_dir.parent
+    directories = [platform_dir] + [package_dir / name for name in _FINGERPRINTED_PACKAGES]
+    paths = []
+    for directory in directories:
+        for root, dirs, files in os.walk(directory):
+            dirs[:] = [d for d in dirs if d != "__pycache__"]
+            paths.extend(
+                Path(root, filename)
+                for filename in files
+                if filename.endswith(_FINGERPRINTED_SUFFIXES)
+            )
+
+    for path in sorted(paths):
+        digest.update(path.relative_to(package_dir).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load_manifest(
+    source_fingerprint: str, path: Path = MANIFEST_PATH
+) -> Optional[RegistryManifest]:
+    """Load the manifest, or None if it is missing, unreadable or stale."""
+    if not path.exists():
+        return None
+    try:
+        manifest = RegistryManifest.model_validate_json(path.read_bytes())
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable registry manifest {path}: {e}")
+        return None
+
+    if manifest.version != MANIFEST_VERSION or manifest.source_fingerprint != source_fingerprint:
+        logger.info("Registry manifest is stale, platform components will be scanned")
+        return None
+    return manifest
+
+
+def write_manifest(manifest: RegistryManifest, path: Path = MANIFEST_PATH) -> bool:
+    """Write the manifest. Returns False if the location is not writable."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(manifest.model_dump_json(indent=2))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.info(f"Could not write registry manifest {path}: {e}")
+        return False
+    return True
+
+
+async def get_synced_fingerprint(db: AsyncSession) -> Optional[str]:
+    """Fingerprint of the manifest last synced to the database."""
+    result = await db.execute(
+        select(PlatformSyncState.fingerprint).where(PlatformSyncState.name == SYNC_STATE_NAME)
+    )
+    return result.scalar_one_or_none()
+
+
+async def set_synced_fingerprint(db: AsyncSession, fingerprint: str) -> None:
+    """Record the fingerprint of a manifest that was synced to the database."""
+    stmt = insert(PlatformSyncState).values(name=SYNC_STATE_NAME, fingerprint=fingerprint)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["name"],
+        set_={"fingerprint": stmt.excluded.fingerprint, "modified_at": utc_now_naive()},
+    )
+    await db.execute(stmt)
+    await db.commit()
+
+
+def main() -> None:
+    """Scan the platform components and write the manifest."""
+    from airweave.platform.db_sync import build_registry_manifest
+
+    manifest = build_registry_manifest(str(PLATFORM_DIR))
+    if not write_manifest(manifest):
+        raise SystemExit(1)
+    print(f"Wrote {MANIFEST_PATH} (fingerprint {manifest.fingerprint})")
+
+
+if __name__ == "__main__":
+    main()
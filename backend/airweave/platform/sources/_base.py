@@ -10,6 +10,7 @@ from typing import (
     Any,
     AsyncGenerator,
     AsyncIterable,
+    Awaitable,
     Callable,
     ClassVar,
     Dict,
@@ -22,8 +23,9 @@ import httpx
 from pydantic import BaseModel
 
 from airweave.core.logging import logger
-from airweave.platform.entities._base import ChunkEntity, FileEntity
+from airweave.platform.entities._base import ChunkEntity, CodeFileEntity, FileEntity
 from airweave.platform.file_handling.file_manager import file_manager
+from airweave.platform.sync.async_helpers import compute_version_fingerprint
 from airweave.schemas.source_connection import AuthenticationMethod, OAuthType
 
 
@@ -44,6 +46,8 @@ class BaseSource:
         # Optional sync identifiers for multi-tenant scoped helpers
         self._organization_id: Optional[str] = None
         self._source_connection_id: Optional[str] = None
+        # Lookup of stored version fingerprints, used to skip downloading unchanged files
+        self._version_fingerprint_lookup: Optional[Callable[[str], Awaitable[Optional[str]]]] = None
 
     @property
     def logger(self):
@@ -135,6 +139,37 @@ class BaseSource:
         """Get the cursor for this source."""
         return getattr(self, "_cursor", None)
 
+    def set_version_fingerprint_lookup(
+        self, lookup: Optional[Callable[[str], Awaitable[Optional[str]]]]
+    ) -> None:
+        """Set the lookup of stored version fingerprints for this source.
+
+        Args:
+            lookup: Async callable mapping an entity_id to its stored version fingerprint
+        """
+        self._version_fingerprint_lookup = lookup
+
+    async def _is_unchanged_remote_file(
+        self, file_entity: Union[FileEntity, CodeFileEntity]
+    ) -> bool:
+        """Check whether a file's remote version matches the one stored by a previous sync.
+
+        Sources report the remote version in airweave_system_metadata.remote_version. An
+        unchanged file is marked fully processed so the entity processor keeps it without
+        it being downloaded, converted or embedded.
+        """
+        lookup = getattr(self, "_version_fingerprint_lookup", None)
+        if lookup is None:
+            return False
+
+        fingerprint = compute_version_fingerprint(file_entity)
+        if fingerprint is None or await lookup(file_entity.entity_id) != fingerprint:
+            return False
+
+        file_entity.airweave_system_metadata.is_fully_processed = True
+        self.logger.debug(f"Skipping download of unchanged file {file_entity.name}")
+        return True
+
     def get_default_cursor_field(self) -> Optional[str]:
         """Get the default cursor field for this source.
 
@@ -276,6 +311,9 @@ class BaseSource:
         Returns:
             The processed entity if it should be included, None if it should be skipped
         """
+        if await self._is_unchanged_remote_file(file_entity):
+            return file_entity
+
         # Use entity download_url if not explicitly provided
         url = download_url or file_entity.download_url
         if not url:
@@ -363,6 +401,9 @@ class BaseSource:
         """Process a file entity with content directly available as a stream."""
         self.logger.debug(f"Processing file entity with direct content: {file_entity.name}")
 
+        if await self._is_unchanged_remote_file(file_entity):
+            return file_entity
+
         try:
             # Process entity with the file manager directly
             processed_entity = await file_manager.handle_file_entity(
@@ -600,60 +641,73 @@ class BaseSource:
     ) -> AsyncGenerator[ChunkEntity, None]:
         """Generic bounded-concurrency driver.
 
-        Returns:
-            True if the source is healthy/authorized; False otherwise.
-
-        Notes:
-            OAuth2-based sources should generally implement this by calling
-            `await self._validate_oauth2(...)` with the appropriate endpoints/
-            credentials from their config.
-        - `items`: async iterator (or iterable) of units of work.
+        - `items`: async iterator (or iterable) of units of work. It is consumed lazily.
         - `worker(item)`: async generator yielding 0..N ChunkEntity objects for that item.
-        - `batch_size`: max concurrent workers.
+        - `batch_size`: max concurrent workers. At most this many worker tasks exist at
+          once; the next item is only pulled from `items` when a slot frees up.
         - `preserve_order`: if True, buffers per-item results and yields in input order.
+          A slot is held until its item has been yielded, so buffering stays bounded.
         - `stop_on_error`: if True, cancels remaining work on first error.
         """
-        results, tasks, total_workers, sentinel = await self._start_entity_workers(
+        import asyncio as _asyncio
+
+        results, tasks, slots, sentinel = await self._start_entity_workers(
             items=items,
             worker=worker,
             batch_size=batch_size,
             max_queue_size=max_queue_size,
+            preserve_order=preserve_order,
         )
 
         try:
             if preserve_order:
                 async for ent in self._drain_results_preserve_order(
-                    results, tasks, total_workers, stop_on_error, sentinel
+                    results, tasks, slots, stop_on_error, sentinel
                 ):
                     yield ent
             else:
                 async for ent in self._drain_results_unordered(
-                    results, tasks, total_workers, stop_on_error, sentinel
+                    results, tasks, stop_on_error, sentinel
                 ):
                     yield ent
         finally:
-            # Ensure all tasks are cleaned up even if consumer stops early
-            import asyncio as _asyncio
-
-            await _asyncio.gather(*tasks, return_exceptions=True)
-
-    async def _start_entity_workers(
+            # Ensure all tasks are cleaned up even if consumer stops early; pending
+            # workers may be blocked on the results queue, so cancel before waiting
+            pending = [t for t in tasks if not t.done()]
+            for t in pending:
+                t.cancel()
+            await _asyncio.gather(*pending, return_exceptions=True)
+
+    async def _start_entity_workers(  # noqa: C901
         self,
         items: Union[Iterable[Any], AsyncIterable[Any]],
         worker: Callable[[Any], AsyncIterable[ChunkEntity]],
         *,
         batch_size: int,
         max_queue_size: int,
+        preserve_order: bool = False,
     ):
-        """Spin up worker tasks and return (results_queue, tasks, total_workers, sentinel)."""
+        """Start the item producer and return (results_queue, tasks, slots, sentinel).
+
+        The producer pulls one item per free slot and spawns its worker task, so the
+        number of live tasks never exceeds `batch_size` + 1 (the producer itself).
+        Queue messages are (idx, entity, error) tuples. A worker ends with
+        (idx, sentinel, None); the producer ends with (_ProducerDone(total), sentinel, None),
+        or with (None, None, error) if iterating `items` fails.
+        """
         import asyncio as _asyncio
 
-        semaphore = _asyncio.Semaphore(batch_size)
+        slots = _asyncio.Semaphore(batch_size)
         results: _asyncio.Queue = _asyncio.Queue(maxsize=max_queue_size)
         sentinel = object()
+        tasks: set[_asyncio.Task] = set()
+
+        def _spawn(coro) -> None:
+            task = _asyncio.create_task(coro)
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
 
         async def run_worker(idx: int, item: Any) -> None:
-            await semaphore.acquire()
             try:
                 agen = worker(item)
                 if not hasattr(agen, "__aiter__"):
@@ -664,43 +718,70 @@ class BaseSource:
                 await results.put((idx, None, e))
             finally:
                 await results.put((idx, sentinel, None))  # signal completion for idx
-                semaphore.release()
+                # In ordered mode the drainer frees the slot once idx has been yielded
+                if not preserve_order:
+                    slots.release()
+
+        async def produce() -> None:
+            idx = 0
+            try:
+                async for item in self._iterate_items(items):
+                    await slots.acquire()  # backpressure: wait for a free worker slot
+                    _spawn(run_worker(idx, item))
+                    idx += 1
+            except Exception as e:
+                await results.put((None, None, e))
+            else:
+                await results.put((_ProducerDone(idx), sentinel, None))
 
-        tasks: list[_asyncio.Task] = []
-        idx = 0
+        _spawn(produce())
+        return results, tasks, slots, sentinel
 
+    @staticmethod
+    async def _iterate_items(
+        items: Union[Iterable[Any], AsyncIterable[Any]],
+    ) -> AsyncGenerator[Any, None]:
+        """Iterate an iterable or async iterable one item at a time."""
         if hasattr(items, "__aiter__"):
             async for item in items:  # type: ignore[truthy-bool]
-                tasks.append(_asyncio.create_task(run_worker(idx, item)))
-                idx += 1
+                yield item
         else:
             for item in items:  # type: ignore[arg-type]
-                tasks.append(_asyncio.create_task(run_worker(idx, item)))
-                idx += 1
-
-        return results, tasks, idx, sentinel
+                yield item
+
+    def _handle_worker_error(self, i: Any, err: BaseException, tasks, stop_on_error: bool):
+        """Log a worker error; cancel everything and re-raise if requested or unrecoverable."""
+        if i is None:
+            # Iterating `items` itself failed - there is nothing left to schedule
+            for t in list(tasks):
+                t.cancel()
+            raise err
+        self.logger.error(f"Worker {i} error: {err}", exc_info=True)
+        if stop_on_error:
+            for t in list(tasks):
+                t.cancel()
+            raise err
 
     async def _drain_results_unordered(
         self,
         results,
         tasks,
-        total_workers: int,
         stop_on_error: bool,
         sentinel: object,
     ) -> AsyncGenerator[ChunkEntity, None]:
         """Yield results as they arrive; stop early on error if requested."""
+        total_workers: Optional[int] = None
         done_workers = 0
-        while done_workers < total_workers:
+        while total_workers is None or done_workers < total_workers:
             i, payload, err = await results.get()
+            if isinstance(i, _ProducerDone):
+                total_workers = i.total
+                continue
             if payload is sentinel:
                 done_workers += 1
                 continue
             if err:
-                self.logger.error(f"Worker {i} error: {err}", exc_info=True)
-                if stop_on_error:
-                    for t in tasks:
-                        t.cancel()
-                    raise err
+                self._handle_worker_error(i, err, tasks, stop_on_error)
                 continue
             yield payload  # type: ignore[misc]
 
@@ -708,7 +789,7 @@ class BaseSource:
         self,
         results,
         tasks,
-        total_workers: int,
+        slots,
         stop_on_error: bool,
         sentinel: object,
     ) -> AsyncGenerator[ChunkEntity, None]:
@@ -716,27 +797,36 @@ class BaseSource:
         buffers: Dict[int, list[ChunkEntity]] = {}
         finished: set[int] = set()
         next_idx = 0
-        done_workers = 0
+        total_workers: Optional[int] = None
 
-        while done_workers < total_workers:
+        while total_workers is None or next_idx < total_workers:
             i, payload, err = await results.get()
-            if payload is sentinel:
+            if isinstance(i, _ProducerDone):
+                total_workers = i.total
+            elif payload is sentinel:
                 finished.add(i)
-                done_workers += 1
             elif err:
-                self.logger.error(f"Worker {i} error: {err}", exc_info=True)
-                if stop_on_error:
-                    for t in tasks:
-                        t.cancel()
-                    raise err
+                self._handle_worker_error(i, err, tasks, stop_on_error)
                 # We'll still wait for this worker's sentinel to preserve ordering.
             else:
                 buffers.setdefault(i, []).append(payload)  # type: ignore[arg-type]
 
             while next_idx in finished:
+                finished.discard(next_idx)
                 for ent in buffers.pop(next_idx, []):
                     yield ent
                 next_idx += 1
+                slots.release()
+
+
+class _ProducerDone:
+    """Queue marker sent by the item producer once all items have been scheduled."""
+
+    __slots__ = ("total",)
+
+    def __init__(self, total: int):
+        """Record how many worker tasks were spawned."""
+        self.total = total
 
 
 class Relation(BaseModel):
@@ -6,7 +6,7 @@ import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from airweave.platform.decorators import source
-from airweave.platform.entities._base import Breadcrumb, ChunkEntity
+from airweave.platform.entities._base import Breadcrumb, ChunkEntity, FileSystemMetadata
 from airweave.platform.entities.dropbox import (
     DropboxAccountEntity,
     DropboxFileEntity,
@@ -367,6 +367,10 @@ class DropboxSource(BaseSource):
             # Additional optional fields
             sharing_info=sharing_info,
             has_explicit_shared_members=entry.get("has_explicit_shared_members"),
+            # rev changes whenever the file is modified or moved
+            airweave_system_metadata=FileSystemMetadata(
+                remote_version=entry.get("rev") or entry.get("content_hash")
+            ),
         )
 
     async def _generate_file_entities(
@@ -1,10 +1,16 @@
 """GitHub source implementation for syncing repositories, directories, and code files."""
 
+import asyncio
 import base64
+import hashlib
 import mimetypes
+import os
+import tempfile
+import zipfile
 from datetime import datetime
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+from urllib.parse import quote
 
 import httpx
 import tenacity
@@ -12,7 +18,7 @@ from tenacity import retry_if_exception_type, stop_after_attempt, wait_exponenti
 
 from airweave.platform.configs.auth import GitHubAuthConfig
 from airweave.platform.decorators import source
-from airweave.platform.entities._base import Breadcrumb, ChunkEntity
+from airweave.platform.entities._base import Breadcrumb, ChunkEntity, FileSystemMetadata
 from airweave.platform.entities.github import (
     GitHubCodeFileEntity,
     GitHubDirectoryEntity,
@@ -20,13 +26,51 @@ from airweave.platform.entities.github import (
     GitHubRepositoryEntity,
 )
 from airweave.platform.sources._base import BaseSource
+from airweave.platform.sync.async_helpers import run_in_thread_pool
 from airweave.platform.utils.file_extensions import (
+    MAX_TEXT_DETECTION_SIZE,
     get_language_for_extension,
+    is_likely_binary_extension,
     is_text_file,
 )
 from airweave.schemas.source_connection import AuthenticationMethod
 
 
+def _git_blob_sha(data: bytes) -> str:
+    """The SHA git assigns to a blob with this content."""
+    header = f"blob {len(data)}\0".encode()
+    return hashlib.sha1(header + data, usedforsecurity=False).hexdigest()
+
+
+def _archive_member_names(archive: zipfile.ZipFile) -> Dict[str, str]:
+    """Map repository paths to member names of a zipball (which nests them in one folder)."""
+    names = {}
+    for name in archive.namelist():
+        _, _, path = name.partition("/")
+        if path and not name.endswith("/"):
+            names[path] = name
+    return names
+
+
+def _read_archive_blobs(
+    archive: zipfile.ZipFile, member_names: Dict[str, str], files: List[Dict[str, Any]]
+) -> Dict[str, bytes]:
+    """Read files from a zipball, keyed by blob SHA.
+
+    Files missing from the archive or whose content does not match their blob SHA (e.g.
+    export-subst or export-ignore attributes, or a push in between) are left out.
+    """
+    blobs = {}
+    for file in files:
+        name = member_names.get(file["path"])
+        if name is None or file["sha"] in blobs:
+            continue
+        data = archive.read(name)
+        if _git_blob_sha(data) == file["sha"]:
+            blobs[file["sha"]] = data
+    return blobs
+
+
 @source(
     name="GitHub",
     short_name="github",
@@ -48,6 +92,12 @@ class GitHubSource(BaseSource):
 
     BASE_URL = "https://api.github.com"
 
+    # File contents are fetched in batches of parallel blob requests; from this many files
+    # on, a full sync downloads the repository as one zipball instead (a single API call)
+    BLOB_BATCH_SIZE = 100
+    BLOB_FETCH_CONCURRENCY = 8
+    ARCHIVE_MIN_FILES = 200
+
     def get_default_cursor_field(self) -> Optional[str]:
         """Get the default cursor field for GitHub source.
 
@@ -340,6 +390,15 @@ class GitHubSource(BaseSource):
             entity_id=repo_entity.entity_id, name=repo_entity.name, type="repository"
         )
 
+        tree = await self._get_recursive_tree(client, repo_name, branch)
+        if tree is not None:
+            commit_sha, entries = tree
+            async for entity in self._traverse_tree(
+                client, repo_name, entries, commit_sha, repo_breadcrumb, owner, repo, branch
+            ):
+                yield entity
+            return
+
         # Track processed paths to avoid duplicates
         processed_paths = set()
 
@@ -381,8 +440,9 @@ class GitHubSource(BaseSource):
 
         # Track processed files to avoid duplicates
         processed_files = set()
+        changed_files_to_fetch: List[Dict[str, Any]] = []
 
-        # Process each commit and extract changed files
+        # Process each commit (newest first) and extract changed files
         for commit in commits:
             commit_sha = commit["sha"]
             commit_message = commit["commit"]["message"]
@@ -404,27 +464,24 @@ class GitHubSource(BaseSource):
                 # Handle deleted files
                 if file_info["status"] == "removed":
                     self.logger.info(f"Processing deleted file: {file_path}")
-                    # Create a special deletion entity
-                    deletion_entity = GitHubFileDeletionEntity(
-                        entity_id=f"{repo_name}/{file_path}",
-                        source_name="github",
-                        file_path=file_path,
-                        repo_name=repo,
-                        repo_owner=owner,
-                        deletion_status="removed",
-                        sync_metadata={"github_status": "removed"},
-                    )
-                    yield deletion_entity
+                    yield self._file_deletion_entity(repo_name, file_path, owner, repo)
                     continue
 
-                # Process the changed file
-                try:
-                    async for entity in self._process_changed_file(
-                        client, repo_name, file_path, owner, repo, branch
-                    ):
-                        yield entity
-                except Exception as e:
-                    self.logger.error(f"Error processing changed file {file_path}: {e}")
+                # A renamed file is gone from its previous path
+                previous_path = file_info.get("previous_filename")
+                if file_info["status"] == "renamed" and previous_path not in processed_files:
+                    processed_files.add(previous_path)
+                    yield self._file_deletion_entity(repo_name, previous_path, owner, repo)
+
+                if file_info.get("sha") and self._may_be_text_file(file_path, None):
+                    changed_files_to_fetch.append({"path": file_path, "sha": file_info["sha"]})
+
+        # Fetch the changed files by blob SHA, in parallel batches
+        repo_breadcrumb = Breadcrumb(entity_id=f"{owner}/{repo}", name=repo, type="repository")
+        async for entity in self._fetch_code_files(
+            client, repo_name, changed_files_to_fetch, repo_breadcrumb, owner, repo, branch
+        ):
+            yield entity
 
     async def _get_commits_since(
         self, client: httpx.AsyncClient, repo_name: str, since_timestamp: str, branch: str
@@ -475,117 +532,335 @@ class GitHubSource(BaseSource):
             self.logger.error(f"Error getting files for commit {commit_sha}: {e}")
             return []
 
-    async def _process_changed_file(
+    def _file_deletion_entity(
+        self, repo_name: str, file_path: str, owner: str, repo: str
+    ) -> GitHubFileDeletionEntity:
+        """Create the special entity that deletes a file removed from the repository."""
+        return GitHubFileDeletionEntity(
+            entity_id=f"{repo_name}/{file_path}",
+            source_name="github",
+            file_path=file_path,
+            repo_name=repo,
+            repo_owner=owner,
+            deletion_status="removed",
+            sync_metadata={"github_status": "removed"},
+        )
+
+    def _path_breadcrumbs(
+        self, repo_name: str, repo_breadcrumb: Breadcrumb, path: str
+    ) -> List[Breadcrumb]:
+        """Breadcrumbs of a path: the repository and each parent directory."""
+        breadcrumbs = [repo_breadcrumb]
+        parts = path.split("/")[:-1]
+        for i, part in enumerate(parts):
+            breadcrumbs.append(
+                Breadcrumb(
+                    entity_id=f"{repo_name}/{'/'.join(parts[: i + 1])}",
+                    name=part,
+                    type="directory",
+                )
+            )
+        return breadcrumbs
+
+    def _may_be_text_file(self, path: str, size: Optional[int]) -> bool:
+        """Whether a file is worth fetching, judged by its extension and size."""
+        if is_likely_binary_extension(Path(path).suffix.lower()):
+            return False
+        return size is None or size <= min(self.max_file_size, MAX_TEXT_DETECTION_SIZE)
+
+    async def _get_recursive_tree(
+        self, client: httpx.AsyncClient, repo_name: str, branch: str
+    ) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+        """Get the whole file tree of a branch with the recursive Git Trees API.
+
+        Args:
+            client: HTTP client
+            repo_name: Repository name
+            branch: Branch name
+
+        Returns:
+            The commit SHA the tree belongs to and the tree entries, or None if GitHub
+            truncated the tree (very large repositories)
+        """
+        branch_data = await self._get_with_auth(
+            client, f"{self.BASE_URL}/repos/{repo_name}/branches/{branch}"
+        )
+        commit = branch_data["commit"]
+        tree_sha = commit["commit"]["tree"]["sha"]
+
+        tree = await self._get_with_auth(
+            client,
+            f"{self.BASE_URL}/repos/{repo_name}/git/trees/{tree_sha}",
+            {"recursive": "1"},
+        )
+        if tree.get("truncated"):
+            self.logger.warning(
+                f"Tree of {repo_name} is too large for one request, "
+                "traversing it directory by directory"
+            )
+            return None
+        return commit["sha"], tree["tree"]
+
+    async def _traverse_tree(
         self,
         client: httpx.AsyncClient,
         repo_name: str,
-        file_path: str,
+        entries: List[Dict[str, Any]],
+        commit_sha: str,
+        repo_breadcrumb: Breadcrumb,
         owner: str,
         repo: str,
         branch: str,
     ) -> AsyncGenerator[ChunkEntity, None]:
-        """Process a single changed file.
+        """Create the directory and file entities of a recursive tree.
 
         Args:
             client: HTTP client
             repo_name: Repository name
-            file_path: Path to the file
+            entries: Entries of the recursive tree
+            commit_sha: Commit the tree belongs to
+            repo_breadcrumb: Breadcrumb of the repository
             owner: Repository owner
             repo: Repository name
             branch: Branch name
 
         Yields:
-            File entity if it's a text file
+            Directory and file entities
         """
-        # Create breadcrumbs for the file
-        path_parts = file_path.split("/")
-        breadcrumbs = []
+        files = []
+        unchanged = 0
+        for item in entries:
+            item_path = item["path"]
+            if item["type"] == "tree":
+                yield GitHubDirectoryEntity(
+                    entity_id=f"{repo_name}/{item_path}",
+                    source_name="github",
+                    path=item_path,
+                    repo_name=repo,
+                    repo_owner=owner,
+                    content=f"Directory: {item_path}",
+                    breadcrumbs=self._path_breadcrumbs(repo_name, repo_breadcrumb, item_path),
+                    url=f"https://github.com/{repo_name}/tree/{branch}/{quote(item_path)}",
+                )
+            # Skip submodules ("commit") and symlinks (mode 120000)
+            elif (
+                item["type"] == "blob"
+                and item.get("mode") != "120000"
+                and self._may_be_text_file(item_path, item.get("size"))
+            ):
+                # The tree already carries each blob's SHA and size, so files whose
+                # version is unchanged since the last sync are neither fetched nor read
+                entity = self._code_file_skeleton(
+                    repo_name, item, item["size"], repo_breadcrumb, owner, repo, branch
+                )
+                if await self._is_unchanged_remote_file(entity):
+                    unchanged += 1
+                    yield entity
+                else:
+                    files.append(item)
 
-        # Add repository breadcrumb
-        repo_breadcrumb = Breadcrumb(entity_id=f"{owner}/{repo}", name=repo, type="repository")
-        breadcrumbs.append(repo_breadcrumb)
-
-        # Add directory breadcrumbs
-        current_path = ""
-        for _i, part in enumerate(path_parts[:-1]):  # Exclude the filename
-            current_path = f"{current_path}/{part}" if current_path else part
-            dir_breadcrumb = Breadcrumb(
-                entity_id=f"{repo_name}/{current_path}", name=part, type="directory"
-            )
-            breadcrumbs.append(dir_breadcrumb)
+        self.logger.info(
+            f"Found {len(files)} changed and {unchanged} unchanged candidate text files "
+            f"in {repo_name}"
+        )
+        archive_path = None
+        if len(files) >= self.ARCHIVE_MIN_FILES:
+            try:
+                archive_path = await self._download_archive(client, repo_name, commit_sha)
+            except Exception as e:
+                self.logger.warning(
+                    f"Could not download archive of {repo_name}, fetching blobs instead: {e}"
+                )
 
-        # Get file content
         try:
-            file_url = f"{self.BASE_URL}/repos/{repo_name}/contents/{file_path}?ref={branch}"
-            file_data = await self._get_with_auth(client, file_url)
+            async for entity in self._fetch_code_files(
+                client, repo_name, files, repo_breadcrumb, owner, repo, branch, archive_path
+            ):
+                yield entity
+        finally:
+            if archive_path:
+                os.unlink(archive_path)
+
+    async def _download_archive(self, client: httpx.AsyncClient, repo_name: str, ref: str) -> str:
+        """Download the zipball of a commit to a temporary file and return its path."""
+        headers = {
+            "Authorization": f"token {self.personal_access_token}",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        url = f"{self.BASE_URL}/repos/{repo_name}/zipball/{ref}"
+        fd, archive_path = tempfile.mkstemp(prefix="github-", suffix=".zip")
+        try:
+            with os.fdopen(fd, "wb") as archive_file:
+                async with client.stream(
+                    "GET",
+                    url,
+                    headers=headers,
+                    follow_redirects=True,
+                    timeout=httpx.Timeout(180.0, read=540.0),
+                ) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes():
+                        archive_file.write(chunk)
+        except BaseException:
+            os.unlink(archive_path)
+            raise
+
+        size_mb = os.path.getsize(archive_path) / (1024 * 1024)
+        self.logger.info(f"Downloaded archive of {repo_name} ({size_mb:.1f} MB)")
+        return archive_path
 
-            # Check if this is a text file
-            file_size = file_data.get("size", 0)
-            if file_size > self.max_file_size:
-                self.logger.debug(f"Skipping large file: {file_path} ({file_size} bytes)")
-                return
-
-            # Get file content
-            content_url = file_data["download_url"]
-            content_response = await client.get(content_url)
-            content_response.raise_for_status()
-            content_text = content_response.text
-
-            # Check if this is a text file based on content
-            if not self._is_text_content(content_text):
-                self.logger.debug(f"Skipping binary file: {file_path}")
-                return
-
-            # Detect language
-            language = self._detect_language_from_extension(file_path)
-
-            # Count lines
-            line_count = content_text.count("\n") + 1
-
-            # Create file entity
-            file_entity = GitHubCodeFileEntity(
-                entity_id=f"{repo_name}/{file_path}",
-                source_name="github",
-                file_id=file_data["sha"],
-                name=path_parts[-1],  # Filename
-                mime_type=mimetypes.guess_type(file_path)[0] or "text/plain",
-                size=file_size,
-                path=file_path,
-                repo_name=repo,
-                repo_owner=owner,
-                sha=file_data["sha"],
-                breadcrumbs=breadcrumbs,
-                url=file_data["html_url"],
-                language=language,
-                line_count=line_count,
-                path_in_repo=file_path,
-                content=content_text,
-                last_modified=None,
-            )
+    @tenacity.retry(
+        retry=retry_if_exception_type(httpx.HTTPError),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        stop=stop_after_attempt(3),
+        reraise=True,
+    )
+    async def _get_blob(self, client: httpx.AsyncClient, repo_name: str, sha: str) -> bytes:
+        """Fetch the raw content of a blob."""
+        headers = {
+            "Authorization": f"token {self.personal_access_token}",
+            "Accept": "application/vnd.github.raw+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        response = await client.get(
+            f"{self.BASE_URL}/repos/{repo_name}/git/blobs/{sha}", headers=headers
+        )
+        response.raise_for_status()
+        return response.content
 
-            yield file_entity
+    async def _fetch_blobs(
+        self,
+        client: httpx.AsyncClient,
+        repo_name: str,
+        files: List[Dict[str, Any]],
+        archive: Optional[zipfile.ZipFile],
+        member_names: Dict[str, str],
+    ) -> Dict[str, bytes]:
+        """Get the contents of files, keyed by blob SHA.
+
+        Contents come from the archive if there is one; the rest is fetched with parallel
+        blob requests. Files whose blob could not be fetched are left out.
+        """
+        blobs: Dict[str, bytes] = {}
+        if archive is not None:
+            blobs = await run_in_thread_pool(_read_archive_blobs, archive, member_names, files)
 
-        except Exception as e:
-            self.logger.error(f"Error processing changed file {file_path}: {e}")
+        semaphore = asyncio.Semaphore(self.BLOB_FETCH_CONCURRENCY)
 
-    def _is_text_content(self, content: str) -> bool:
-        """Check if content appears to be text.
+        async def _fetch(sha: str) -> None:
+            async with semaphore:
+                try:
+                    blobs[sha] = await self._get_blob(client, repo_name, sha)
+                except Exception as e:
+                    self.logger.error(f"Error fetching blob {sha} of {repo_name}: {e}")
+
+        missing = dict.fromkeys(file["sha"] for file in files if file["sha"] not in blobs)
+        await asyncio.gather(*[_fetch(sha) for sha in missing])
+        return blobs
+
+    async def _fetch_code_files(
+        self,
+        client: httpx.AsyncClient,
+        repo_name: str,
+        files: List[Dict[str, Any]],
+        repo_breadcrumb: Breadcrumb,
+        owner: str,
+        repo: str,
+        branch: str,
+        archive_path: Optional[str] = None,
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Fetch files by blob SHA in batches and create their entities.
 
         Args:
-            content: File content
+            client: HTTP client
+            repo_name: Repository name
+            files: Files to fetch, as dicts with "path" and "sha"
+            repo_breadcrumb: Breadcrumb of the repository
+            owner: Repository owner
+            repo: Repository name
+            branch: Branch name
+            archive_path: Zipball to read contents from before falling back to blob requests
 
-        Returns:
-            True if content appears to be text
+        Yields:
+            File entities of the text files
         """
-        # Check for null bytes (common in binary files)
-        if "\x00" in content:
-            return False
+        archive = zipfile.ZipFile(archive_path) if archive_path else None
+        member_names = _archive_member_names(archive) if archive is not None else {}
+        try:
+            for start in range(0, len(files), self.BLOB_BATCH_SIZE):
+                batch = files[start : start + self.BLOB_BATCH_SIZE]
+                blobs = await self._fetch_blobs(client, repo_name, batch, archive, member_names)
+                for file in batch:
+                    content = blobs.get(file["sha"])
+                    if content is None:
+                        continue
+                    entity = self._code_file_entity(
+                        repo_name, file, content, repo_breadcrumb, owner, repo, branch
+                    )
+                    if entity is not None:
+                        yield entity
+        finally:
+            if archive is not None:
+                archive.close()
 
-        # Check if content is mostly printable characters
-        printable_ratio = sum(1 for c in content[:1000] if c.isprintable() or c.isspace()) / min(
-            len(content), 1000
+    def _code_file_entity(
+        self,
+        repo_name: str,
+        file: Dict[str, Any],
+        content: bytes,
+        repo_breadcrumb: Breadcrumb,
+        owner: str,
+        repo: str,
+        branch: str,
+    ) -> Optional[GitHubCodeFileEntity]:
+        """Create the entity of a fetched file, or None if it is not a text file."""
+        file_path = file["path"]
+        if len(content) > self.max_file_size or not is_text_file(file_path, len(content), content):
+            self.logger.debug(f"Skipping large or binary file: {file_path}")
+            return None
+
+        content_text = content.decode("utf-8", errors="replace")
+        entity = self._code_file_skeleton(
+            repo_name, file, len(content), repo_breadcrumb, owner, repo, branch
+        )
+        entity.line_count = content_text.count("\n") + 1
+        entity.content = content_text
+        return entity
+
+    def _code_file_skeleton(
+        self,
+        repo_name: str,
+        file: Dict[str, Any],
+        size: int,
+        repo_breadcrumb: Breadcrumb,
+        owner: str,
+        repo: str,
+        branch: str,
+    ) -> GitHubCodeFileEntity:
+        """Create the entity of a file without its content.
+
+        The blob SHA is reported as the remote version, so the file's version fingerprint
+        is known before its content is fetched.
+        """
+        file_path = file["path"]
+        return GitHubCodeFileEntity(
+            entity_id=f"{repo_name}/{file_path}",
+            source_name="github",
+            file_id=file["sha"],
+            name=Path(file_path).name,
+            mime_type=mimetypes.guess_type(file_path)[0] or "text/plain",
+            size=size,
+            path=file_path,
+            repo_name=repo,
+            repo_owner=owner,
+            sha=file["sha"],
+            breadcrumbs=self._path_breadcrumbs(repo_name, repo_breadcrumb, file_path),
+            url=f"https://github.com/{repo_name}/blob/{branch}/{quote(file_path)}",
+            language=self._detect_language_from_extension(file_path),
+            path_in_repo=file_path,
+            last_modified=None,
+            airweave_system_metadata=FileSystemMetadata(remote_version=file["sha"]),
         )
-        return printable_ratio > 0.7
 
     async def _traverse_directory(
         self,
@@ -763,6 +1038,7 @@ class GitHubSource(BaseSource):
                     path_in_repo=item_path,
                     content=content_text,  # Store the content directly in the entity
                     last_modified=None,  # GitHub API doesn't provide this directly
+                    airweave_system_metadata=FileSystemMetadata(remote_version=file_data["sha"]),
                 )
 
                 # Let the file handler manage actual file processing
@@ -21,7 +21,7 @@ from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_ex
 
 from airweave.core.exceptions import TokenRefreshError
 from airweave.platform.decorators import source
-from airweave.platform.entities._base import ChunkEntity
+from airweave.platform.entities._base import ChunkEntity, FileSystemMetadata
 from airweave.platform.entities.google_drive import (
     GoogleDriveDriveEntity,
     GoogleDriveFileEntity,
@@ -629,6 +629,10 @@ class GoogleDriveSource(BaseSource):
             modified_time=file_obj.get("modifiedTime"),
             size=int(file_obj["size"]) if file_obj.get("size") else None,
             md5_checksum=file_obj.get("md5Checksum"),
+            # Native Google files have no checksum; their export changes with modifiedTime
+            airweave_system_metadata=FileSystemMetadata(
+                remote_version=file_obj.get("md5Checksum") or file_obj.get("modifiedTime")
+            ),
         )
 
     # ------------------------------
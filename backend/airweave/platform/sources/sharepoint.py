@@ -532,6 +532,8 @@ class SharePointSource(BaseSource):
         # Add additional properties for file processing
         if entity.airweave_system_metadata:
             entity.airweave_system_metadata.total_size = item.get("size", 0)
+            # eTag changes on any content, name or location change of the item
+            entity.airweave_system_metadata.remote_version = item.get("eTag") or item.get("cTag")
 
         return entity
 
@@ -2,5 +2,6 @@
 
 from .storage_client import StorageClient
 from .storage_manager import storage_manager
+from .streaming_zip import StreamingZipWriter
 
-__all__ = ["StorageClient", "storage_manager"]
+__all__ = ["StorageClient", "StreamingZipWriter", "storage_manager"]
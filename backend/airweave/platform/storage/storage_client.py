@@ -11,6 +11,7 @@ from azure.storage.blob import BlobServiceClient
 
 from airweave.core.config import settings
 from airweave.core.logging import ContextualLogger, logger
+from airweave.platform.sync.async_helpers import run_in_thread_pool
 
 
 class StorageBackend(ABC):
@@ -30,7 +31,12 @@ class StorageBackend(ABC):
 
     @abstractmethod
     async def download_file(
-        self, logger: ContextualLogger, container_name: str, blob_name: str
+        self,
+        logger: ContextualLogger,
+        container_name: str,
+        blob_name: str,
+        *,
+        missing_ok: bool = False,
     ) -> Optional[bytes]:
         """Download a file from storage."""
         pass
@@ -98,7 +104,8 @@ class AzureStorageBackend(StorageBackend):
         try:
             container_client = self.client.get_container_client(container_name)
             blob_client = container_client.get_blob_client(blob_name)
-            blob_client.upload_blob(data, overwrite=True)
+            # The SDK client is synchronous, keep network I/O off the event loop
+            await run_in_thread_pool(blob_client.upload_blob, data, overwrite=True)
             logger.with_context(
                 container=container_name,
                 blob=blob_name,
@@ -112,7 +119,12 @@ class AzureStorageBackend(StorageBackend):
             raise
 
     async def download_file(
-        self, logger: ContextualLogger, container_name: str, blob_name: str
+        self,
+        logger: ContextualLogger,
+        container_name: str,
+        blob_name: str,
+        *,
+        missing_ok: bool = False,
     ) -> Optional[bytes]:
         """Download a file from Azure Blob Storage.
 
@@ -120,6 +132,7 @@ class AzureStorageBackend(StorageBackend):
             logger: The logger to use
             container_name: Name of the container
             blob_name: Name of the blob
+            missing_ok: Whether a missing blob is expected (logged at debug level)
 
         Returns:
             File content as bytes, or None if not found
@@ -130,7 +143,7 @@ class AzureStorageBackend(StorageBackend):
         try:
             container_client = self.client.get_container_client(container_name)
             blob_client = container_client.get_blob_client(blob_name)
-            data = blob_client.download_blob().readall()
+            data = await run_in_thread_pool(lambda: blob_client.download_blob().readall())
             logger.with_context(
                 container=container_name,
                 blob=blob_name,
@@ -138,7 +151,11 @@ class AzureStorageBackend(StorageBackend):
             ).info("Downloaded blob successfully")
             return data
         except ResourceNotFoundError:
-            logger.with_context(container=container_name, blob=blob_name).warning("Blob not found")
+            missing_logger = logger.with_context(container=container_name, blob=blob_name)
+            if missing_ok:
+                missing_logger.debug("Blob not found")
+            else:
+                missing_logger.warning("Blob not found")
             return None
         except Exception as e:
             logger.with_context(
@@ -277,7 +294,12 @@ class LocalStorageBackend(StorageBackend):
             raise
 
     async def download_file(
-        self, logger: ContextualLogger, container_name: str, blob_name: str
+        self,
+        logger: ContextualLogger,
+        container_name: str,
+        blob_name: str,
+        *,
+        missing_ok: bool = False,
     ) -> Optional[bytes]:
         """Read a file from local storage.
 
@@ -285,6 +307,8 @@ class LocalStorageBackend(StorageBackend):
             logger: The logger to use
             container_name: Name of the directory
             blob_name: Name of the file
+            missing_ok: Whether a missing file is expected (missing files are logged at debug
+                level either way)
 
         Returns:
             File content as bytes, or None if not found
@@ -548,10 +572,17 @@ class StorageClient:
         return await self.backend.upload_file(logger, container_name, blob_name, data)
 
     async def download_file(
-        self, logger: ContextualLogger, container_name: str, blob_name: str
+        self,
+        logger: ContextualLogger,
+        container_name: str,
+        blob_name: str,
+        *,
+        missing_ok: bool = False,
     ) -> Optional[bytes]:
         """Download a file from storage."""
-        return await self.backend.download_file(logger, container_name, blob_name)
+        return await self.backend.download_file(
+            logger, container_name, blob_name, missing_ok=missing_ok
+        )
 
     async def delete_file(
         self, logger: ContextualLogger, container_name: str, blob_name: str
@@ -1,10 +1,11 @@
 """Storage manager for file handling."""
 
+import asyncio
 import io
 import json
 import os
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, Optional, Set, Tuple
 from uuid import UUID
 
 from airweave.core.datetime_utils import utc_now_naive
@@ -658,6 +659,60 @@ class StorageManager:
 
         return results
 
+    async def iter_ctti_file_contents(
+        self, logger: ContextualLogger, entity_ids: List[str], max_concurrency: int
+    ) -> AsyncIterator[Tuple[str, Optional[str], Optional[str]]]:
+        """Retrieve CTTI files concurrently and yield them as they arrive.
+
+        At most max_concurrency downloads are in flight; closing the iterator early cancels
+        them. Unlike download_ctti_files_batch, results come in completion order and
+        nothing is written to disk.
+
+        Args:
+            logger: The logger to use
+            entity_ids: CTTI entity IDs to retrieve
+            max_concurrency: Max concurrent downloads
+
+        Yields:
+            (entity_id, content, error) tuples. content is None for files that could not
+            be retrieved, with error saying why: "invalid_entity_id", "not_found" or
+            "download_failed".
+        """
+
+        async def fetch(entity_id: str) -> Tuple[str, Optional[str], Optional[str]]:
+            if not entity_id or not entity_id.startswith("CTTI:"):
+                return entity_id, None, "invalid_entity_id"
+            try:
+                content = await self.get_ctti_file_content(logger, entity_id)
+            except Exception as e:
+                logger.error(
+                    "Failed to retrieve CTTI file",
+                    extra={"entity_id": entity_id, "error": str(e)},
+                )
+                return entity_id, None, "download_failed"
+            return entity_id, content, None if content is not None else "not_found"
+
+        remaining = iter(entity_ids)
+        in_flight: Set[asyncio.Task] = set()
+
+        def start_next() -> None:
+            entity_id = next(remaining, None)
+            if entity_id is not None:
+                in_flight.add(asyncio.create_task(fetch(entity_id)))
+
+        try:
+            for _ in range(max(1, max_concurrency)):
+                start_next()
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    in_flight.discard(task)
+                    start_next()
+                    yield task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
+
     def _determine_ctti_output_path(self, entity_id: str, output_path: str) -> str:
         """Determine the actual output file path for CTTI files.
 
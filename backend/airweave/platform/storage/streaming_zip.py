@@ -0,0 +1,69 @@
+"""ZIP archives assembled while their entries arrive.
+
+zipfile can write to an unseekable stream: sizes and CRC of each entry then follow its data
+in a data descriptor, and the central directory is written on close. StreamingZipWriter
+writes into such a stream and hands out the bytes produced by each entry, so a response can
+send an entry as soon as it is added and never holds more than the entry being written.
+"""
+
+import io
+import zipfile
+from typing import List, Union
+
+
+class _ChunkSink(io.RawIOBase):
+    """Unseekable, write-only stream collecting what is written until drained."""
+
+    def __init__(self):
+        """Initialize the sink."""
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        """The sink is writable."""
+        return True
+
+    def write(self, data) -> int:
+        """Collect a chunk."""
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        """Bytes written so far (zipfile records entry offsets with it)."""
+        return self._position
+
+    def drain(self) -> bytes:
+        """Return and forget the bytes written since the last drain."""
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class StreamingZipWriter:
+    """Writes a ZIP archive entry by entry, returning the archive's bytes as it goes.
+
+    Not thread-safe: entries must be added one at a time (possibly from a worker thread,
+    since compressing is CPU work).
+    """
+
+    def __init__(self, compression: int = zipfile.ZIP_DEFLATED):
+        """Initialize the writer.
+
+        Args:
+            compression: zipfile compression method of the entries
+        """
+        self._sink = _ChunkSink()
+        self._zip = zipfile.ZipFile(self._sink, "w", compression=compression)
+
+    def add(self, name: str, data: Union[str, bytes]) -> bytes:
+        """Add an entry (str data is UTF-8 encoded) and return the bytes it produced."""
+        self._zip.writestr(name, data)
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        """Finish the archive and return its remaining bytes (the central directory)."""
+        self._zip.close()
+        return self._sink.drain()
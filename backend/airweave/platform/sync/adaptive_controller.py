@@ -0,0 +1,282 @@
+"""Runtime tuning of micro-batch size and worker concurrency for a sync.
+
+Good values differ by orders of magnitude between sources: a database table yields huge
+numbers of tiny rows (large batches amortize embedding and upsert round-trips), while a
+document source yields few huge files (small batches keep every worker busy). Rather than
+one fixed setting, the controller observes each batch's embed, destination upsert and
+database persist time together with the depth of the source stream's queue, and adjusts
+batch size and worker count within the configured bounds:
+
+- Batch size: halved when batches take well over the target time, grown by half when full
+  batches finish well under it.
+- Workers: grown while the source queue backs up and throughput improves with more
+  workers; shrunk when a downstream stage (embedding, destinations, database) slows down
+  under load, or when the last increase did not pay off.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from airweave.core.logging import ContextualLogger
+
+# Seconds between tuning decisions, and batches needed before one is made
+CONTROL_INTERVAL_SECONDS = 5.0
+MIN_BATCHES_PER_DECISION = 3
+
+# Smoothing factor of the per-stage latency averages
+EWMA_ALPHA = 0.3
+
+# A stage this many times slower than its best observed latency counts as saturated
+SATURATION_FACTOR = 2.0
+
+# Source queue fill ratio above which processing is the bottleneck
+QUEUE_BACKLOG_RATIO = 0.5
+
+STAGES = ("embed", "upsert", "persist")
+
+
+class AdaptiveSyncController:
+    """Tunes batch size and worker concurrency of one sync from observed latencies."""
+
+    def __init__(
+        self,
+        logger: ContextualLogger,
+        batch_size: int,
+        workers: int,
+        min_batch_size: int,
+        max_batch_size: int,
+        min_workers: int,
+        max_workers: int,
+        target_batch_seconds: float,
+        enabled: bool = True,
+    ):
+        """Initialize the controller.
+
+        Args:
+            logger: The sync's contextual logger
+            batch_size: Initial micro-batch size
+            workers: Initial worker count
+            min_batch_size: Lower bound of the batch size
+            max_batch_size: Upper bound of the batch size
+            min_workers: Lower bound of the worker count
+            max_workers: Upper bound of the worker count (raised to ``workers`` if lower)
+            target_batch_seconds: Desired processing time of one batch
+            enabled: If False, latencies are still recorded but nothing is changed
+        """
+        self.logger = logger
+        self.enabled = enabled
+        self.min_batch_size = max(1, min(min_batch_size, batch_size))
+        self.max_batch_size = max(max_batch_size, batch_size)
+        self.min_workers = max(1, min(min_workers, workers))
+        self.max_workers = max(max_workers, workers)
+        self.target_batch_seconds = target_batch_seconds
+
+        self.batch_size = batch_size
+        self.workers = workers
+
+        # Smoothed per-entity latency of each stage, and the best one seen. Per entity so
+        # that a change of batch size is not mistaken for a slowdown.
+        self._stage_latency: Dict[str, Optional[float]] = dict.fromkeys(STAGES)
+        self._stage_best: Dict[str, Optional[float]] = dict.fromkeys(STAGES)
+        self._batch_latency: Optional[float] = None
+
+        # Batches completed since the last decision
+        self._window_start = time.monotonic()
+        self._window_batches = 0
+        self._window_items = 0
+        self._window_full_batches = 0
+
+        # Throughput before the last worker change, to judge whether it paid off
+        self._throughput_before_change: Optional[float] = None
+        self._last_worker_change = 0
+        # Lowest worker count that did not raise throughput; growth stays below it
+        self._no_gain_workers: Optional[int] = None
+
+        self.decisions: List[Dict[str, Any]] = []
+
+    # ------------------------------------------------------------------ observations
+    def record_stage(self, stage: str, seconds: float, size: int) -> None:
+        """Record how long a batch of ``size`` parents spent in a stage.
+
+        Args:
+            stage: "embed", "upsert" or "persist"
+            seconds: Time the batch spent in the stage
+            size: Number of parent entities in the batch
+        """
+        if size <= 0:
+            return
+        per_entity = seconds / size
+        self._stage_latency[stage] = self._smooth(self._stage_latency.get(stage), per_entity)
+        best = self._stage_best.get(stage)
+        if best is None or per_entity < best:
+            self._stage_best[stage] = per_entity
+
+    def record_batch(self, size: int, seconds: float) -> None:
+        """Record a processed batch of ``size`` parent entities."""
+        self._batch_latency = self._smooth(self._batch_latency, seconds)
+        self._window_batches += 1
+        self._window_items += size
+        if size >= self.batch_size:
+            self._window_full_batches += 1
+
+    @staticmethod
+    def _smooth(previous: Optional[float], value: float) -> float:
+        if previous is None:
+            return value
+        return EWMA_ALPHA * value + (1 - EWMA_ALPHA) * previous
+
+    # ------------------------------------------------------------------ decisions
+    def maybe_adjust(self, queue_depth: int, queue_capacity: int) -> Optional[Dict[str, Any]]:
+        """Make a tuning decision if one is due.
+
+        Args:
+            queue_depth: Entities waiting in the source stream's queue
+            queue_capacity: Capacity of that queue
+
+        Returns:
+            The decision if batch size or worker count changed, else None
+        """
+        if not self.enabled:
+            return None
+
+        elapsed = time.monotonic() - self._window_start
+        if elapsed < CONTROL_INTERVAL_SECONDS or self._window_batches < MIN_BATCHES_PER_DECISION:
+            return None
+
+        throughput = self._window_items / elapsed
+        queue_fill = queue_depth / queue_capacity if queue_capacity else 0.0
+        saturated = self._saturated_stages()
+
+        batch_size, batch_reason = self._next_batch_size(saturated)
+        workers, worker_reason = self._next_workers(throughput, queue_fill, saturated)
+
+        # Start a new observation window
+        self._window_start = time.monotonic()
+        self._window_batches = self._window_items = self._window_full_batches = 0
+
+        if batch_size == self.batch_size and workers == self.workers:
+            return None
+
+        if workers != self.workers:
+            self._throughput_before_change = throughput
+            self._last_worker_change = workers - self.workers
+
+        decision = {
+            "batch_size": batch_size,
+            "workers": workers,
+            "previous_batch_size": self.batch_size,
+            "previous_workers": self.workers,
+            "reason": "; ".join(r for r in (batch_reason, worker_reason) if r),
+            "throughput_per_second": round(throughput, 2),
+            "queue_fill": round(queue_fill, 2),
+            "latency": self._latency_summary(),
+        }
+        self.batch_size = batch_size
+        self.workers = workers
+        self.decisions.append(decision)
+
+        self.logger.info(
+            f"Adaptive tuning: batch_size {decision['previous_batch_size']} -> {batch_size}, "
+            f"workers {decision['previous_workers']} -> {workers} ({decision['reason']})"
+        )
+        return decision
+
+    def _next_batch_size(self, saturated: List[str]) -> tuple[int, Optional[str]]:
+        """Keep a batch's processing time near the target."""
+        latency = self._batch_latency
+        if latency is None:
+            return self.batch_size, None
+
+        if latency > 1.5 * self.target_batch_seconds and self.batch_size > self.min_batch_size:
+            return (
+                max(self.min_batch_size, self.batch_size // 2),
+                f"batches take {latency:.1f}s",
+            )
+
+        # Only grow if batches actually fill up; a slow source gains nothing from bigger ones
+        batches_fill_up = self._window_full_batches >= self._window_batches / 2
+        if (
+            latency < 0.5 * self.target_batch_seconds
+            and batches_fill_up
+            and not saturated
+            and self.batch_size < self.max_batch_size
+        ):
+            return (
+                min(self.max_batch_size, self.batch_size + max(1, self.batch_size // 2)),
+                f"full batches take only {latency:.1f}s",
+            )
+
+        return self.batch_size, None
+
+    def _next_workers(
+        self, throughput: float, queue_fill: float, saturated: List[str]
+    ) -> tuple[int, Optional[str]]:
+        """Add workers while they raise throughput, remove them when downstream saturates."""
+        step = max(1, self.workers // 4)
+
+        if saturated and self.workers > self.min_workers:
+            return (
+                max(self.min_workers, self.workers - step),
+                f"{', '.join(saturated)} saturated",
+            )
+
+        # Undo an increase that did not improve throughput
+        if (
+            self._last_worker_change > 0
+            and self._throughput_before_change is not None
+            and throughput < 1.05 * self._throughput_before_change
+        ):
+            self._last_worker_change = 0
+            self._no_gain_workers = self.workers
+            return (
+                max(self.min_workers, self.workers - step),
+                "more workers did not raise throughput",
+            )
+
+        ceiling = self.max_workers
+        if self._no_gain_workers is not None:
+            ceiling = min(ceiling, self._no_gain_workers - 1)
+        if queue_fill >= QUEUE_BACKLOG_RATIO and self.workers < ceiling:
+            return (
+                min(ceiling, self.workers + step),
+                f"source queue {queue_fill:.0%} full",
+            )
+
+        return self.workers, None
+
+    def _saturated_stages(self) -> List[str]:
+        """Stages whose current latency is far above the best one observed."""
+        saturated = []
+        for stage in STAGES:
+            latency, best = self._stage_latency.get(stage), self._stage_best.get(stage)
+            # Ignore stages too fast to matter relative to the batch target
+            if (
+                latency is None
+                or not best
+                or latency * self.batch_size < 0.1 * self.target_batch_seconds
+            ):
+                continue
+            if latency > SATURATION_FACTOR * best:
+                saturated.append(stage)
+        return saturated
+
+    def _latency_summary(self) -> Dict[str, Optional[float]]:
+        """Smoothed latencies in milliseconds: per entity for stages, per batch overall."""
+        summary = {
+            f"{stage}_ms_per_entity": round(latency * 1000, 2) if latency is not None else None
+            for stage, latency in self._stage_latency.items()
+        }
+        summary["batch_ms"] = (
+            round(self._batch_latency * 1000, 1) if self._batch_latency is not None else None
+        )
+        return summary
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current settings and latencies, as reported in the sync progress stream."""
+        return {
+            "batch_size": self.batch_size,
+            "workers": self.workers,
+            "adjustments": len(self.decisions),
+            "last_reason": self.decisions[-1]["reason"] if self.decisions else None,
+            "latency": self._latency_summary(),
+        }
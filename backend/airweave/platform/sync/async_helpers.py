@@ -2,11 +2,10 @@
 
 import asyncio
 import hashlib
+import json
 import os
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Callable, Dict, List, TypeVar
-
-import aiofiles
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 from airweave.core.config import settings
 from airweave.core.logging import logger
@@ -54,20 +53,14 @@ async def run_in_thread_pool(func: Callable[..., T], *args, **kwargs) -> T:
 
 
 async def compute_file_hash_async(file_path: str) -> str:
-    """Compute file hash asynchronously without blocking the event loop."""
-    hash_obj = hashlib.sha256()
+    """Compute file hash asynchronously without blocking the event loop.
 
-    async with aiofiles.open(file_path, "rb") as f:
-        # Read file in chunks to avoid memory issues
-        chunk_size = 8192
-        while True:
-            chunk = await f.read(chunk_size)
-            if not chunk:
-                break
-            # Hash update is CPU-bound, run in thread
-            await run_in_thread_pool(hash_obj.update, chunk)
+    The whole file is hashed inside a single worker call (see FileHasher).
+    """
+    # Import here to avoid circular imports
+    from airweave.platform.file_handling.file_hasher import file_hasher
 
-    return hash_obj.hexdigest()
+    return await file_hasher.hash_file(file_path)
 
 
 async def compute_content_hash_async(content: str) -> str:
@@ -91,6 +84,38 @@ def stable_serialize(obj: Any) -> Any:
         return str(obj)
 
 
+def _file_metadata_composite(entity: Any) -> Dict[str, Any]:
+    """Stable file metadata that, besides content, decides whether a file changed."""
+    return {
+        "file_id": getattr(entity, "file_id", None),
+        "name": getattr(entity, "name", None),
+        "mime_type": getattr(entity, "mime_type", None),
+        "size": getattr(entity, "size", None),
+        "md5_checksum": getattr(entity, "md5_checksum", None),
+        "modified_time": getattr(entity, "modified_time", None),
+        # Parent folder IDs capture moves between folders
+        "parents": getattr(entity, "parents", []) or [],
+    }
+
+
+def compute_version_fingerprint(entity: Any) -> Optional[str]:
+    """Compute a file's version fingerprint from its source-provided remote version.
+
+    Unlike the entity hash this needs no file content, so it can be compared with the
+    stored fingerprint before the file is downloaded. Returns None if the source did not
+    provide a remote version.
+    """
+    system_metadata = getattr(entity, "airweave_system_metadata", None)
+    remote_version = getattr(system_metadata, "remote_version", None)
+    if not remote_version:
+        return None
+
+    composite = {**_file_metadata_composite(entity), "remote_version": remote_version}
+    return hashlib.sha256(
+        json.dumps(stable_serialize(composite), sort_keys=True).encode()
+    ).hexdigest()
+
+
 async def compute_entity_hash_async(entity: Any) -> str:  # noqa: C901
     """Compute entity hash asynchronously.
 
@@ -152,17 +177,7 @@ async def compute_entity_hash_async(entity: Any) -> str:  # noqa: C901
 
             # Compose a final action hash from content hash PLUS selected stable metadata
             # This ensures renames/moves/metadata changes trigger UPDATE even if bytes are the same.
-            composite = {
-                "file_id": getattr(entity, "file_id", None),
-                "content_hash": content_hash,
-                "name": getattr(entity, "name", None),
-                "mime_type": getattr(entity, "mime_type", None),
-                "size": getattr(entity, "size", None),
-                "md5_checksum": getattr(entity, "md5_checksum", None),
-                "modified_time": getattr(entity, "modified_time", None),
-                # Parent folder IDs capture moves between folders
-                "parents": getattr(entity, "parents", []) or [],
-            }
+            composite = {**_file_metadata_composite(entity), "content_hash": content_hash}
 
             import json as _json
 
@@ -174,54 +189,9 @@ async def compute_entity_hash_async(entity: Any) -> str:  # noqa: C901
             logger.exception("HASH_FILE error; falling back to generic content hashing")
 
     # For regular entities, compute hash from content fields
-    def _compute_entity_hash(entity_obj) -> str:
-        # Define metadata fields to exclude (top-level and known noisy fields)
-        metadata_fields = {
-            "sync_job_id",
-            "vector",
-            "vectors",
-            "_hash",
-            "db_entity_id",
-            "source_name",
-            "sync_id",
-            "sync_metadata",
-            "created_at",
-            "updated_at",
-            "modified_at",
-            "_sa_instance_state",  # SQLAlchemy internal state
-            "organization_id",
-            "chunk_index",  # Exclude chunk_index from hash to ensure parent/chunk compatibility
-            "embeddable_text",  # Derived text can vary slightly; exclude from hash
-            "airweave_system_metadata",  # Exclude entire nested system metadata from hash
-        }
-
-        # Get content fields
-        if hasattr(entity_obj, "model_dump"):
-            # Pydantic model
-            all_fields = set(entity_obj.model_fields.keys())
-            data = entity_obj.model_dump()
-        else:
-            # Dict
-            all_fields = set(entity_obj.keys())
-            data = entity_obj
-
-        content_fields = all_fields - metadata_fields
-
-        # Extract only content fields
-        content_data = {k: v for k, v in data.items() if k in content_fields}
-
-        # Ensure nested system metadata doesn't leak volatile fields into the hash
-        # (we already excluded 'airweave_system_metadata' entirely above)
-
-        # Use stable serialization
-        stable_data = stable_serialize(content_data)
-        import json as _json2
-
-        json_str = _json2.dumps(stable_data, sort_keys=True, separators=(",", ":"))
-        digest = hashlib.sha256(json_str.encode()).hexdigest()
-        return digest
-
-    hash_value = await run_in_thread_pool(_compute_entity_hash, entity)
+    from airweave.platform.sync.entity_hashing import entity_hasher
+
+    hash_value = await run_in_thread_pool(entity_hasher.hash_entity, entity)
 
     # Cache the hash if entity is an object
     if hasattr(entity, "_hash"):
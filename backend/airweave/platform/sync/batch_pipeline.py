@@ -0,0 +1,145 @@
+"""Staged pipeline for micro-batches of entities.
+
+Each stage (e.g. DB lookup, transform, embed, DB write, vector write) has its own pool of
+worker coroutines and a bounded queue in front of it. A batch moves to the next stage as
+soon as it leaves the current one, so while one batch waits for embeddings another is
+written to the database and a third is upserted to the destinations. A full queue blocks
+the stage in front of it, which propagates backpressure up to the callers of run().
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generic, List, Optional, TypeVar
+
+from airweave.core.logging import ContextualLogger
+
+T = TypeVar("T")
+
+
+@dataclass
+class PipelineStage(Generic[T]):
+    """One stage of a StagedPipeline.
+
+    The handler returns True to pass the item on to the next stage, or False if the item
+    is finished (e.g. nothing left to do for the batch).
+    """
+
+    name: str
+    handler: Callable[[T], Awaitable[bool]]
+    concurrency: int
+
+
+@dataclass
+class _PipelineItem(Generic[T]):
+    payload: T
+    future: asyncio.Future
+
+
+class StagedPipeline(Generic[T]):
+    """Runs items through a sequence of stages with per-stage concurrency."""
+
+    def __init__(self, stages: List[PipelineStage[T]], queue_size: int, logger: ContextualLogger):
+        """Initialize the pipeline. Stage workers are started on first use.
+
+        Args:
+            stages: The stages, in order
+            queue_size: Capacity of the queue in front of each stage
+            logger: Contextual logger
+        """
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+        self.logger = logger
+        self._queues: List[asyncio.Queue] = []
+        self._workers: List[asyncio.Task] = []
+
+    async def run(self, payload: T) -> T:
+        """Run an item through all stages and return it once it is finished.
+
+        Raises the exception of the stage that failed, if any. Cancelling the caller stops
+        the item at its current stage.
+        """
+        self._ensure_started()
+        item = _PipelineItem(payload=payload, future=asyncio.get_running_loop().create_future())
+        await self._queues[0].put(item)
+        return await item.future
+
+    def _ensure_started(self) -> None:
+        if self._workers:
+            return
+        self._queues = [asyncio.Queue(maxsize=self.queue_size) for _ in self.stages]
+        for index, stage in enumerate(self.stages):
+            for _ in range(max(1, stage.concurrency)):
+                self._workers.append(asyncio.create_task(self._stage_worker(index)))
+        self.logger.debug(
+            "Started batch pipeline: "
+            + ", ".join(f"{stage.name} x{stage.concurrency}" for stage in self.stages)
+        )
+
+    async def _stage_worker(self, index: int) -> None:
+        """Take items from a stage's queue, run the handler and pass them on."""
+        stage = self.stages[index]
+        queue = self._queues[index]
+        is_last = index == len(self.stages) - 1
+
+        while True:
+            item: _PipelineItem = await queue.get()
+            try:
+                if item.future.done():
+                    # The caller was cancelled while the item was queued
+                    continue
+
+                proceed = await self._run_handler(stage, item)
+                if proceed is None or item.future.done():
+                    continue
+
+                if proceed and not is_last:
+                    await self._queues[index + 1].put(item)
+                else:
+                    item.future.set_result(item.payload)
+            except asyncio.CancelledError:
+                # Pipeline closed: don't leave the caller waiting
+                if not item.future.done():
+                    item.future.cancel()
+                raise
+            except Exception as e:
+                if not item.future.done():
+                    item.future.set_exception(e)
+            finally:
+                queue.task_done()
+
+    async def _run_handler(self, stage: PipelineStage[T], item: _PipelineItem) -> Optional[bool]:
+        """Run a stage handler, abandoning it if the item's caller is cancelled.
+
+        Returns:
+            The handler's result, or None if the item was cancelled
+        """
+        handler_task = asyncio.ensure_future(stage.handler(item.payload))
+
+        def _cancel_handler(future: asyncio.Future) -> None:
+            if future.cancelled():
+                handler_task.cancel()
+
+        item.future.add_done_callback(_cancel_handler)
+        try:
+            return await handler_task
+        except asyncio.CancelledError:
+            if item.future.cancelled():
+                return None
+            raise
+        finally:
+            item.future.remove_done_callback(_cancel_handler)
+
+    async def close(self) -> None:
+        """Stop all stage workers. Items still in the pipeline are cancelled."""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        for queue in self._queues:
+            while not queue.empty():
+                item: Any = queue.get_nowait()
+                if not item.future.done():
+                    item.future.cancel()
+        self._queues = []
@@ -0,0 +1,212 @@
+"""Canonical content hashing of entities for change detection.
+
+Every sync hashes every parent entity to decide between KEEP and UPDATE. The previous
+scheme dumped the whole model, rebuilt it through a recursive stable serializer, encoded
+it with ``json.dumps(sort_keys=True)`` and took the SHA-256. The v2 scheme hashes the same
+fields, but:
+
+- which fields count, and which of them can be read directly rather than through a
+  pydantic dump, is compiled once per entity class;
+- the canonical encoding is a single ``orjson.dumps`` call with sorted keys, deterministic
+  across processes and machines (no Python ``hash()`` involved);
+- the digest is configurable (ENTITY_HASH_ALGORITHM): sha256, blake2b, or xxh3/blake3 if
+  the ``fast-hash`` extra (``xxhash``/``blake3``) is installed.
+
+v2 hashes are stored as ``v2:<algorithm>:<hex digest>``. Rows hashed with the legacy
+scheme (bare hex) or with another algorithm are not treated as changed: when a stored hash
+differs from the current one only in format, the entity is re-hashed in the stored format
+(see stored_hash_matches), kept if that matches, and its row is upgraded to the current
+format. The legacy scheme is used as a whole if orjson is unavailable or
+ENTITY_HASH_ALGORITHM is "legacy".
+"""
+
+import hashlib
+import json
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.platform.entities._payload import split_fields
+from airweave.platform.sync.async_helpers import stable_serialize
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - legacy hashing is used instead
+    orjson = None
+
+HASH_VERSION_PREFIX = "v2:"
+
+# Top-level fields that never affect the content hash
+METADATA_FIELDS = frozenset(
+    {
+        "sync_job_id",
+        "vector",
+        "vectors",
+        "_hash",
+        "db_entity_id",
+        "source_name",
+        "sync_id",
+        "sync_metadata",
+        "created_at",
+        "updated_at",
+        "modified_at",
+        "_sa_instance_state",  # SQLAlchemy internal state
+        "organization_id",
+        "chunk_index",  # Exclude chunk_index from hash to ensure parent/chunk compatibility
+        "embeddable_text",  # Derived text can vary slightly; exclude from hash
+        "airweave_system_metadata",  # Exclude entire nested system metadata from hash
+    }
+)
+
+
+def _xxh3_hexdigest(data: bytes) -> str:
+    import xxhash
+
+    return xxhash.xxh3_128_hexdigest(data)
+
+
+def _blake3_hexdigest(data: bytes) -> str:
+    import blake3
+
+    return blake3.blake3(data).hexdigest()
+
+
+_DIGESTS: Dict[str, Callable[[bytes], str]] = {
+    "sha256": lambda data: hashlib.sha256(data).hexdigest(),
+    "blake2b": lambda data: hashlib.blake2b(data, digest_size=32).hexdigest(),
+    "xxh3": _xxh3_hexdigest,
+    "blake3": _blake3_hexdigest,
+}
+
+
+def _algorithm_available(algorithm: str) -> bool:
+    if algorithm not in _DIGESTS:
+        return False
+    try:
+        _DIGESTS[algorithm](b"")
+    except ImportError:
+        return False
+    return True
+
+
+def _resolve_algorithm(configured: str) -> Optional[str]:
+    """The digest algorithm of new hashes, or None for the legacy scheme."""
+    if configured == "legacy":
+        return None
+    if orjson is None:
+        logger.warning(
+            f"orjson is not installed, entity hashes fall back to the legacy scheme "
+            f"(ENTITY_HASH_ALGORITHM='{configured}' is ignored)"
+        )
+        return None
+    if _algorithm_available(configured):
+        return configured
+    logger.warning(f"Entity hash algorithm '{configured}' is not available, using sha256")
+    return "sha256"
+
+
+# ------------------------------------------------------------------------------------------
+# Legacy scheme
+# ------------------------------------------------------------------------------------------
+def legacy_entity_hash(entity: Any) -> str:
+    """Hash an entity (model or dict) with the legacy scheme (bare SHA-256 hex)."""
+    if hasattr(entity, "model_dump"):
+        content_fields = set(entity.model_fields.keys()) - METADATA_FIELDS
+        data = entity.model_dump()
+    else:
+        content_fields = set(entity.keys()) - METADATA_FIELDS
+        data = entity
+
+    content_data = {k: v for k, v in data.items() if k in content_fields}
+    json_str = json.dumps(stable_serialize(content_data), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(json_str.encode()).hexdigest()
+
+
+# ------------------------------------------------------------------------------------------
+# v2 scheme
+# ------------------------------------------------------------------------------------------
+_hash_plans: Dict[Type[BaseModel], Tuple[Tuple[str, ...], FrozenSet[str]]] = {}
+
+
+def _hash_plan(model_class: Type[BaseModel]) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    """Plain (read with getattr) and dynamic (dumped) content fields of an entity class."""
+    plan = _hash_plans.get(model_class)
+    if plan is None:
+        fields, dynamic = split_fields(model_class, METADATA_FIELDS, include_computed=False)
+        plan = (tuple(name for name, _ in fields if name not in dynamic), dynamic)
+        _hash_plans[model_class] = plan
+    return plan
+
+
+def _default(obj: Any) -> Any:
+    """Encode values orjson does not know, deterministically."""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=repr)
+    return str(obj)
+
+
+def canonical_entity_bytes(entity: Any) -> bytes:
+    """Canonical JSON encoding of an entity's content fields (model or dict)."""
+    if isinstance(entity, BaseModel):
+        plain, dynamic = _hash_plan(type(entity))
+        content = {name: getattr(entity, name) for name in plain}
+        if dynamic:
+            content.update(entity.model_dump(include=set(dynamic)))
+    else:
+        content = {k: v for k, v in entity.items() if k not in METADATA_FIELDS}
+
+    return orjson.dumps(
+        content,
+        default=_default,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
+
+
+def format_hash(algorithm: str, canonical: bytes) -> str:
+    """Stored form of a v2 hash."""
+    return f"{HASH_VERSION_PREFIX}{algorithm}:{_DIGESTS[algorithm](canonical)}"
+
+
+class EntityHasher:
+    """Computes content hashes in the configured scheme and checks stored ones."""
+
+    def __init__(self, algorithm: str):
+        """Initialize the hasher.
+
+        Args:
+            algorithm: "sha256", "blake2b", "xxh3", "blake3" or "legacy"
+        """
+        self.algorithm = _resolve_algorithm(algorithm)
+
+    def hash_entity(self, entity: Any) -> str:
+        """Content hash of an entity (model or dict) in the current scheme."""
+        if self.algorithm is None:
+            return legacy_entity_hash(entity)
+        return format_hash(self.algorithm, canonical_entity_bytes(entity))
+
+    def is_current_format(self, stored_hash: Optional[str]) -> bool:
+        """Whether a stored hash was produced by the current scheme."""
+        if not stored_hash:
+            return True
+        if self.algorithm is None:
+            return not stored_hash.startswith(HASH_VERSION_PREFIX)
+        return stored_hash.startswith(f"{HASH_VERSION_PREFIX}{self.algorithm}:")
+
+    def stored_hash_matches(self, stored_hash: str, entity: Any) -> bool:
+        """Whether a hash stored in another format still matches the entity's content.
+
+        Used when the stored and current hash differ: a True result means the entity is
+        unchanged and only its stored hash needs upgrading.
+        """
+        if stored_hash.startswith(HASH_VERSION_PREFIX):
+            algorithm = stored_hash[len(HASH_VERSION_PREFIX) :].split(":", 1)[0]
+            if orjson is None or not _algorithm_available(algorithm):
+                return False
+            return format_hash(algorithm, canonical_entity_bytes(entity)) == stored_hash
+        return legacy_entity_hash(entity) == stored_hash
+
+
+# Global instance
+entity_hasher = EntityHasher(settings.ENTITY_HASH_ALGORITHM)
@@ -1,20 +1,65 @@
 """Module for entity processing within the sync architecture (TRUE batching + legacy path)."""
 
 import asyncio
+import os
+import time
 from collections import defaultdict
-from typing import DefaultDict, Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from typing import DefaultDict, Dict, List, Optional, Set, Tuple, Union
 
+import numpy as np
 from fastembed import SparseTextEmbedding
+from sqlalchemy import Row
 from sqlalchemy.exc import DBAPIError
 
 from airweave import crud, models, schemas
+from airweave.core.config import settings
 from airweave.core.constants.reserved_ids import RESERVED_TABLE_ENTITY_ID
 from airweave.core.exceptions import NotFoundException
 from airweave.core.shared_models import ActionType
 from airweave.db.session import get_db_context
-from airweave.platform.entities._base import BaseEntity, DestinationAction, PolymorphicEntity
-from airweave.platform.sync.async_helpers import compute_entity_hash_async, run_in_thread_pool
+from airweave.platform.embedding_models._cache import embedding_cache
+from airweave.platform.entities._base import (
+    BaseEntity,
+    CodeFileEntity,
+    DestinationAction,
+    FileEntity,
+    PolymorphicEntity,
+)
+from airweave.platform.file_handling.file_hasher import file_hasher
+from airweave.platform.sync.adaptive_controller import AdaptiveSyncController
+from airweave.platform.sync.async_helpers import (
+    compute_entity_hash_async,
+    compute_version_fingerprint,
+    run_in_thread_pool,
+)
+from airweave.platform.sync.batch_pipeline import PipelineStage, StagedPipeline
 from airweave.platform.sync.context import SyncContext
+from airweave.platform.sync.entity_hashing import entity_hasher
+
+# Orphan cleanup: rows streamed per page, and orphans deleted per batch
+ORPHAN_SCAN_PAGE_SIZE = 5000
+ORPHAN_DELETE_BATCH_SIZE = 1000
+
+
+@dataclass
+class BatchWork:
+    """A micro-batch and the state it accumulates on its way through the pipeline stages."""
+
+    entities: List[BaseEntity]
+    source_node: schemas.DagNode
+    sync_context: SyncContext
+    inner_concurrency: int
+    partitions: Dict[str, List[BaseEntity]] = field(default_factory=dict)
+    existing_map: Dict[str, models.Entity] = field(default_factory=dict)
+    parent_hashes: Dict[str, str] = field(default_factory=dict)
+    children_by_parent: Dict[str, List[BaseEntity]] = field(default_factory=dict)
+    results: Dict[str, List[BaseEntity]] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        """Number of parents the batch inserts, updates or deletes."""
+        return sum(len(self.partitions.get(k, [])) for k in ("inserts", "updates", "deletes"))
 
 
 class EntityProcessor:
@@ -27,7 +72,23 @@ class EntityProcessor:
 
     def __init__(self):
         """Initialize the entity processor with empty tracking dictionary."""
-        self._entity_ids_encountered_by_type: Dict[str, Set[str]] = {}
+        # Encountered entity IDs -> entity type name (a set of names for the rare ID that is
+        # encountered with several types). One entry per ID serves both deduplication per
+        # type and the orphan check; per-type numbers are kept as counters.
+        self._encountered_entity_ids: Dict[str, Union[str, Set[str]]] = {}
+        self._encountered_counts_by_type: Dict[str, int] = {}
+        # Receives per-batch stage latencies (see AdaptiveSyncController), if set
+        self._tuning_controller: Optional[AdaptiveSyncController] = None
+        # Staged pipeline that process_batch runs batches through, created on first use
+        self._pipeline: Optional[StagedPipeline[BatchWork]] = None
+
+    def set_tuning_controller(self, controller: Optional[AdaptiveSyncController]) -> None:
+        """Report batch stage latencies (embed, upsert, persist) to a tuning controller."""
+        self._tuning_controller = controller
+
+    def _record_stage(self, stage: str, start: float, size: int) -> None:
+        if self._tuning_controller is not None:
+            self._tuning_controller.record_stage(stage, time.monotonic() - start, size)
 
     @staticmethod
     async def _retry_on_deadlock(coro_func, *args, max_retries: int = 3, **kwargs):
@@ -86,13 +147,32 @@ class EntityProcessor:
 
     def initialize_tracking(self, sync_context: SyncContext) -> None:
         """Initialize entity tracking with entity types from the DAG."""
-        self._entity_ids_encountered_by_type.clear()
+        self._encountered_entity_ids.clear()
+        self._encountered_counts_by_type.clear()
         entity_nodes = [
             node for node in sync_context.dag.nodes if node.type == schemas.dag.NodeType.entity
         ]
         for node in entity_nodes:
             if node.name.endswith("Entity"):
-                self._entity_ids_encountered_by_type[node.name] = set()
+                self._encountered_counts_by_type[node.name] = 0
+
+    def _track_encountered(self, entity: BaseEntity) -> bool:
+        """Record an encountered entity. Returns False if its ID was seen with its type."""
+        entity_type_name = entity.__class__.__name__
+        seen = self._encountered_entity_ids.get(entity.entity_id)
+        if seen is None:
+            self._encountered_entity_ids[entity.entity_id] = entity_type_name
+        elif seen == entity_type_name or (isinstance(seen, set) and entity_type_name in seen):
+            return False
+        elif isinstance(seen, set):
+            seen.add(entity_type_name)
+        else:
+            self._encountered_entity_ids[entity.entity_id] = {seen, entity_type_name}
+
+        self._encountered_counts_by_type[entity_type_name] = (
+            self._encountered_counts_by_type.get(entity_type_name, 0) + 1
+        )
+        return True
 
     # ------------------------------------------------------------------------------------
     # Public API — single entity (legacy path)
@@ -105,17 +185,12 @@ class EntityProcessor:
     ) -> List[BaseEntity]:
         """Process an entity through the complete pipeline (legacy per-entity)."""
         try:
-            entity_type_name = entity.__class__.__name__
-            if entity_type_name not in self._entity_ids_encountered_by_type:
-                self._entity_ids_encountered_by_type[entity_type_name] = set()
-
-            if entity.entity_id in self._entity_ids_encountered_by_type[entity_type_name]:
+            if not self._track_encountered(entity):
                 await sync_context.progress.increment("skipped", 1)
                 return []
 
-            self._entity_ids_encountered_by_type[entity_type_name].add(entity.entity_id)
             await sync_context.progress.update_entities_encountered_count(
-                self._entity_ids_encountered_by_type
+                self._encountered_counts_by_type
             )
 
             # Entities always have airweave_system_metadata with should_skip defaulting to False
@@ -173,52 +248,154 @@ class EntityProcessor:
         inner_concurrency: int = 8,
         max_embed_batch: int = 512,
     ) -> Dict[str, List[BaseEntity]]:
-        """Process a batch of parent entities with batching & limited inner concurrency."""
+        """Process a batch of parent entities with batching & limited inner concurrency.
+
+        The batch runs through the staged pipeline (lookup -> transform -> embed -> DB write
+        -> vector write), overlapping with the other batches in flight.
+        """
         if not entities:
             return {}
 
-        unique_entities = await self._filter_and_track_entities(entities, sync_context)
+        work = BatchWork(
+            entities=entities,
+            source_node=source_node,
+            sync_context=sync_context,
+            inner_concurrency=inner_concurrency,
+        )
+        await self._get_pipeline(sync_context).run(work)
+        return work.results
+
+    def _get_pipeline(self, sync_context: SyncContext) -> StagedPipeline[BatchWork]:
+        """Create the batch pipeline on first use."""
+        if self._pipeline is None:
+            self._pipeline = StagedPipeline(
+                stages=[
+                    PipelineStage(
+                        "lookup", self._stage_lookup, settings.SYNC_PIPELINE_LOOKUP_CONCURRENCY
+                    ),
+                    PipelineStage(
+                        "transform",
+                        self._stage_transform,
+                        settings.SYNC_PIPELINE_TRANSFORM_CONCURRENCY,
+                    ),
+                    PipelineStage(
+                        "embed", self._stage_embed, settings.SYNC_PIPELINE_EMBED_CONCURRENCY
+                    ),
+                    PipelineStage(
+                        "db_write",
+                        self._stage_db_write,
+                        settings.SYNC_PIPELINE_DB_WRITE_CONCURRENCY,
+                    ),
+                    PipelineStage(
+                        "vector_write",
+                        self._stage_vector_write,
+                        settings.SYNC_PIPELINE_VECTOR_WRITE_CONCURRENCY,
+                    ),
+                ],
+                queue_size=settings.SYNC_PIPELINE_QUEUE_SIZE,
+                logger=sync_context.logger,
+            )
+        return self._pipeline
+
+    async def close(self) -> None:
+        """Stop the batch pipeline's stage workers (call once no batches are in flight)."""
+        pipeline, self._pipeline = self._pipeline, None
+        if pipeline is not None:
+            await pipeline.close()
+
+    # ---------------- Batch pipeline stages ----------------
+    async def _stage_lookup(self, work: BatchWork) -> bool:
+        """Dedupe, enrich and hash the batch and decide each entity's action from the DB."""
+        sync_context = work.sync_context
+        unique_entities = await self._filter_and_track_entities(work.entities, sync_context)
         if not unique_entities:
-            return {e.entity_id: [] for e in entities}
+            work.results = {e.entity_id: [] for e in work.entities}
+            return False
 
         enriched = await self._batch_enrich(
-            unique_entities, sync_context, inner_concurrency=inner_concurrency
+            unique_entities, sync_context, inner_concurrency=work.inner_concurrency
         )
 
         partitions = await self._partition_by_action(
-            enriched, sync_context, inner_concurrency=inner_concurrency
+            enriched, sync_context, inner_concurrency=work.inner_concurrency
         )
+        work.existing_map = partitions.pop("existing_map")
+        work.parent_hashes = partitions.pop("parent_hashes")
+        work.partitions = partitions
+
+        if partitions["keeps"]:
+            await self._backfill_kept_rows(
+                partitions["keeps"], work.existing_map, work.parent_hashes, sync_context
+            )
 
         if not any(partitions[k] for k in ("inserts", "updates", "deletes")):
             if partitions["keeps"]:
                 await sync_context.progress.increment("kept", len(partitions["keeps"]))
-            return {k.entity_id: [] for k in partitions["keeps"]}
+            work.results = {k.entity_id: [] for k in partitions["keeps"]}
+            return False
+        return True
 
+    async def _stage_transform(self, work: BatchWork) -> bool:
+        """Transform (convert and chunk) the parents to insert or update."""
+        partitions = work.partitions
         to_transform = partitions["inserts"] + partitions["updates"]
-        children_by_parent = await self._transform_parents(
-            to_transform, source_node, sync_context, inner_concurrency
+        work.children_by_parent = await self._transform_parents(
+            to_transform, work.source_node, work.sync_context, work.inner_concurrency
         )
 
-        successful_pids = set(children_by_parent.keys())
+        successful_pids = set(work.children_by_parent.keys())
         partitions["inserts"] = [e for e in partitions["inserts"] if e.entity_id in successful_pids]
         partitions["updates"] = [e for e in partitions["updates"] if e.entity_id in successful_pids]
+        return True
 
-        all_children = [child for children in children_by_parent.values() for child in children]
+    async def _stage_embed(self, work: BatchWork) -> bool:
+        """Compute vectors for all children of the batch."""
+        all_children = [
+            child for children in work.children_by_parent.values() for child in children
+        ]
         if all_children:
-            await self._compute_vector(all_children, sync_context)
+            embed_start = time.monotonic()
+            await self._compute_vector(all_children, work.sync_context)
+            self._record_stage("embed", embed_start, len(work.children_by_parent))
+        return True
+
+    async def _stage_db_write(self, work: BatchWork) -> bool:
+        """Persist the batch's entity rows, retrying on database conflicts."""
+        await self._retry_on_deadlock(
+            self._persist_batch_db, work=work, sync_context=work.sync_context
+        )
+        return True
 
-        results = await self._persist_batch(
-            partitions=partitions,
-            existing_map=partitions.pop("existing_map"),
-            parent_hashes=partitions.pop("parent_hashes"),
-            children_by_parent=children_by_parent,
-            sync_context=sync_context,
+    async def _stage_vector_write(self, work: BatchWork) -> bool:
+        """Write the batch to the destinations and record progress."""
+        partitions = work.partitions
+        sync_context = work.sync_context
+
+        upsert_start = time.monotonic()
+        await self._batch_update_destinations(
+            partitions["inserts"],
+            partitions["updates"],
+            partitions["deletes"],
+            work.children_by_parent,
+            sync_context,
         )
+        self._record_stage("upsert", upsert_start, work.size)
+        await self._update_progress_and_guard_rails(partitions, sync_context)
 
         if partitions["keeps"]:
             await sync_context.progress.increment("kept", len(partitions["keeps"]))
 
-        return results
+        results_by_parent: Dict[str, List[BaseEntity]] = dict(work.children_by_parent)
+        for p_list in (
+            partitions["inserts"],
+            partitions["updates"],
+            partitions["keeps"],
+            partitions["deletes"],
+        ):
+            for p in p_list:
+                results_by_parent.setdefault(p.entity_id, [])
+        work.results = results_by_parent
+        return False
 
     # ------------------------------------------------------------------------------------
     # Shared helpers
@@ -231,13 +408,9 @@ class EntityProcessor:
         skipped_due_to_flag = 0
 
         for e in entities:
-            et = e.__class__.__name__
-            self._entity_ids_encountered_by_type.setdefault(et, set())
-
-            if e.entity_id in self._entity_ids_encountered_by_type[et]:
+            if not self._track_encountered(e):
                 skipped_due_to_dup += 1
                 continue
-            self._entity_ids_encountered_by_type[et].add(e.entity_id)
 
             # Entities always have airweave_system_metadata with should_skip defaulting to False
             if e.airweave_system_metadata.should_skip:
@@ -246,17 +419,17 @@ class EntityProcessor:
 
             unique_entities.append(e)
 
-        if skipped_due_to_dup:
-            await sync_context.progress.increment("skipped", skipped_due_to_dup)
-        if skipped_due_to_flag:
-            await sync_context.progress.increment("skipped", skipped_due_to_flag)
+        if skipped_due_to_dup or skipped_due_to_flag:
+            await sync_context.progress.increment(
+                "skipped", skipped_due_to_dup + skipped_due_to_flag
+            )
 
         await sync_context.progress.update_entities_encountered_count(
-            self._entity_ids_encountered_by_type
+            self._encountered_counts_by_type
         )
         return unique_entities
 
-    async def _partition_by_action(
+    async def _partition_by_action(  # noqa: C901
         self, entities: List[BaseEntity], sync_context: SyncContext, inner_concurrency: int
     ) -> Dict:
         deletes = [e for e in entities if getattr(e, "deletion_status", "") == "removed"]
@@ -277,28 +450,116 @@ class EntityProcessor:
             except Exception as e:
                 sync_context.logger.warning(f"💥 BATCH_DB_LOOKUP_ERROR: {e}")
 
+        # Files the source found unchanged by remote version were not downloaded: keep them
+        partitions = defaultdict(list)
+        to_hash: List[BaseEntity] = []
+        for e in non_deletes:
+            if self._is_unchanged_remote_file(e) and e.entity_id in existing_map:
+                partitions["keeps"].append(e)
+            else:
+                to_hash.append(e)
+
         hashes, failed_hashes = await self._compute_hashes_concurrently(
-            non_deletes, inner_concurrency=inner_concurrency, sync_context=sync_context
+            to_hash, inner_concurrency=inner_concurrency, sync_context=sync_context
         )
 
-        partitions = defaultdict(list)
-        for e in non_deletes:
+        changed: List[BaseEntity] = []
+        for e in to_hash:
             if e.entity_id in failed_hashes:
                 continue
             db_row = existing_map.get(e.entity_id)
             if db_row is None:
                 partitions["inserts"].append(e)
             elif db_row.hash != hashes.get(e.entity_id):
-                partitions["updates"].append(e)
+                changed.append(e)
             else:
                 partitions["keeps"].append(e)
 
+        unchanged_ids = await self._match_stored_hash_formats(changed, existing_map)
+        for e in changed:
+            partitions["keeps" if e.entity_id in unchanged_ids else "updates"].append(e)
+
         partitions["deletes"] = deletes
         partitions["existing_map"] = existing_map
         partitions["parent_hashes"] = hashes
 
         return partitions
 
+    async def _match_stored_hash_formats(
+        self, changed: List[BaseEntity], existing_map: Dict[str, models.Entity]
+    ) -> Set[str]:
+        """Find entities whose stored hash differs only because of its format.
+
+        Rows hashed with the legacy scheme or another algorithm are re-checked in their own
+        format (see entity_hashing), so a hashing upgrade does not turn every entity into
+        an UPDATE. File hashes are composites of content and metadata and never change
+        format, so files are not re-checked.
+
+        Returns:
+            IDs of the entities that are unchanged after all
+        """
+        candidates = [
+            (e, existing_map[e.entity_id].hash)
+            for e in changed
+            if not isinstance(e, FileEntity)
+            and not entity_hasher.is_current_format(existing_map[e.entity_id].hash)
+        ]
+        if not candidates:
+            return set()
+
+        def _match() -> Set[str]:
+            return {
+                e.entity_id
+                for e, stored in candidates
+                if entity_hasher.stored_hash_matches(stored, e)
+            }
+
+        return await run_in_thread_pool(_match)
+
+    async def _backfill_kept_rows(
+        self,
+        keeps: List[BaseEntity],
+        existing_map: Dict[str, models.Entity],
+        parent_hashes: Dict[str, str],
+        sync_context: SyncContext,
+    ) -> None:
+        """Bring the rows of kept entities up to date without re-processing them.
+
+        - Rows written before version fingerprints existed (or before the source reported
+          a remote version) get one, so the next sync can skip downloading them.
+        - Rows whose hash is in an older format (see _match_stored_hash_formats) get the
+          hash in the current format, so the next sync compares directly.
+        """
+        rows = []
+        for e in keeps:
+            db_row = existing_map.get(e.entity_id)
+            if db_row is None:
+                continue
+            fingerprint = compute_version_fingerprint(e) or db_row.version_fingerprint
+            new_hash = parent_hashes.get(e.entity_id) or db_row.hash
+            if fingerprint != db_row.version_fingerprint or new_hash != db_row.hash:
+                rows.append((db_row.id, new_hash, fingerprint))
+        if not rows:
+            return
+
+        try:
+            async with get_db_context() as db:
+                async with db.begin():
+                    await crud.entity.bulk_update_hash(db=db, rows=rows)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            sync_context.logger.warning(f"Failed to update hashes of kept entities: {e}")
+
+    @staticmethod
+    def _is_unchanged_remote_file(entity: BaseEntity) -> bool:
+        """Whether the source skipped downloading this file because its version is unchanged."""
+        return (
+            isinstance(entity, (FileEntity, CodeFileEntity))
+            and entity.airweave_system_metadata is not None
+            and entity.airweave_system_metadata.is_fully_processed
+        )
+
     async def _transform_parents(
         self,
         parents: List[BaseEntity],
@@ -310,7 +571,11 @@ class EntityProcessor:
         if not parents:
             return children_by_parent
 
+        chunked_code_files = await self._transform_code_files(parents, sync_context)
+
         async def _do_transform(p: BaseEntity):
+            if p.entity_id in chunked_code_files:
+                return p.entity_id, chunked_code_files[p.entity_id]
             try:
                 return p.entity_id, await self._transform(p, source_node, sync_context)
             except asyncio.CancelledError:
@@ -337,6 +602,35 @@ class EntityProcessor:
 
         return children_by_parent
 
+    async def _transform_code_files(
+        self, parents: List[BaseEntity], sync_context: SyncContext
+    ) -> Dict[str, List[BaseEntity]]:
+        """Chunk all code files of a batch on the transform executor, by parent entity ID.
+
+        Files that failed to chunk are left out and take the per-entity path; if the whole
+        batch fails, nothing is returned and every file does.
+        """
+        router = sync_context.router
+        code_files = [p for p in parents if router.is_code_file(p)]
+        if len(code_files) < 2:
+            return {}
+
+        try:
+            results = await router.process_code_files(code_files)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            sync_context.logger.warning(
+                f"Batch code chunking of {len(code_files)} files failed, "
+                f"chunking them one by one: {type(e).__name__}: {e}"
+            )
+            return {}
+        return {
+            p.entity_id: kids
+            for p, kids in zip(code_files, results, strict=True)
+            if kids is not None
+        }
+
     # ------------------------------------------------------------------------------------
     # Existing single-entity helpers
     # ------------------------------------------------------------------------------------
@@ -386,13 +680,25 @@ class EntityProcessor:
             except NotFoundException:
                 db_entity = None
 
+        if db_entity and self._is_unchanged_remote_file(entity):
+            return db_entity, DestinationAction.KEEP
+
         current_hash = await compute_entity_hash_async(entity)
 
         if db_entity:
-            if db_entity.hash != current_hash:
-                action = DestinationAction.UPDATE
-            else:
+            if db_entity.hash == current_hash:
+                action = DestinationAction.KEEP
+            elif await self._match_stored_hash_formats([entity], {entity.entity_id: db_entity}):
+                # Unchanged; only the stored hash is in an older format
+                await self._backfill_kept_rows(
+                    [entity],
+                    {entity.entity_id: db_entity},
+                    {entity.entity_id: current_hash},
+                    sync_context,
+                )
                 action = DestinationAction.KEEP
+            else:
+                action = DestinationAction.UPDATE
         else:
             action = DestinationAction.INSERT
 
@@ -440,6 +746,7 @@ class EntityProcessor:
                     entity_id=parent_entity.entity_id,
                     entity_definition_id=entity_definition_id,
                     hash=parent_hash,
+                    version_fingerprint=compute_version_fingerprint(parent_entity),
                 ),
                 ctx=sync_context.ctx,
             )
@@ -485,7 +792,10 @@ class EntityProcessor:
                 await crud.entity.update(
                     db=db,
                     db_obj=fresh_db_entity,
-                    obj_in=schemas.EntityUpdate(hash=parent_hash),
+                    obj_in=schemas.EntityUpdate(
+                        hash=parent_hash,
+                        version_fingerprint=compute_version_fingerprint(parent_entity),
+                    ),
                     ctx=sync_context.ctx,
                 )
             except NotFoundException:
@@ -560,17 +870,46 @@ class EntityProcessor:
             )
 
     async def cleanup_orphaned_entities(self, sync_context: SyncContext) -> None:
-        """Remove entities from the database that were not encountered during sync."""
-        try:
-            stored_entities = await self._get_stored_entities(sync_context)
-            if not stored_entities:
-                return
+        """Remove entities from the database that were not encountered during sync.
 
-            orphaned_entities = self._find_orphaned_entities(stored_entities)
-            if not orphaned_entities:
-                return
-
-            await self._remove_orphaned_entities(orphaned_entities, sync_context)
+        Stored keys are scanned page by page and orphans are deleted as soon as a batch
+        of them has accumulated, so neither the keys nor the orphans are held in full.
+        """
+        try:
+            encountered = self._encountered_entity_ids
+            pending: List[Row] = []
+            removed = 0
+            after_id = None
+            while True:
+                async with get_db_context() as db:
+                    page = await crud.entity.get_keys_page_by_sync_id(
+                        db=db,
+                        sync_id=sync_context.sync.id,
+                        after_id=after_id,
+                        limit=ORPHAN_SCAN_PAGE_SIZE,
+                    )
+                if not page:
+                    break
+                after_id = page[-1].id
+
+                pending.extend(row for row in page if row.entity_id not in encountered)
+                while len(pending) >= ORPHAN_DELETE_BATCH_SIZE:
+                    batch = pending[:ORPHAN_DELETE_BATCH_SIZE]
+                    del pending[:ORPHAN_DELETE_BATCH_SIZE]
+                    await self._remove_orphaned_entities(batch, sync_context)
+                    removed += len(batch)
+
+                if len(page) < ORPHAN_SCAN_PAGE_SIZE:
+                    break
+
+            if pending:
+                await self._remove_orphaned_entities(pending, sync_context)
+                removed += len(pending)
+            if removed:
+                sync_context.logger.info(
+                    f"🧹 Removed {removed} orphaned entities in batches of "
+                    f"{ORPHAN_DELETE_BATCH_SIZE}"
+                )
 
         except asyncio.CancelledError:
             # Respect cancellation during cleanup
@@ -579,25 +918,8 @@ class EntityProcessor:
             sync_context.logger.error(f"💥 Cleanup failed: {str(e)}", exc_info=True)
             raise e
 
-    async def _get_stored_entities(self, sync_context: SyncContext):
-        """Get all stored entities for the current sync."""
-        async with get_db_context() as db:
-            return await crud.entity.get_by_sync_id(db=db, sync_id=sync_context.sync.id)
-
-    def _find_orphaned_entities(self, stored_entities):
-        """Find entities that were not encountered during sync."""
-        orphaned_entities = []
-        for stored_entity in stored_entities:
-            entity_was_encountered = any(
-                stored_entity.entity_id in entity_set
-                for entity_set in self._entity_ids_encountered_by_type.values()
-            )
-            if not entity_was_encountered:
-                orphaned_entities.append(stored_entity)
-        return orphaned_entities
-
     async def _remove_orphaned_entities(self, orphaned_entities, sync_context: SyncContext):
-        """Remove orphaned entities from destinations and database."""
+        """Remove a batch of orphaned entities from destinations and database."""
         orphaned_entity_ids = [entity.entity_id for entity in orphaned_entities]
         orphaned_db_ids = [entity.id for entity in orphaned_entities]
 
@@ -657,6 +979,8 @@ class EntityProcessor:
     async def _compute_hashes_concurrently(
         self, parents: List[BaseEntity], *, inner_concurrency: int, sync_context: SyncContext
     ) -> Tuple[Dict[str, str], Set[str]]:
+        await self._prehash_local_files(parents, inner_concurrency=inner_concurrency)
+
         sem = asyncio.Semaphore(inner_concurrency)
         hashes: Dict[str, str] = {}
         failed_entities: Set[str] = set()
@@ -674,73 +998,61 @@ class EntityProcessor:
                         f"💥 HASH_ERROR [{e.entity_id}] {type(ex).__name__}: {ex}"
                     )
                     failed_entities.add(e.entity_id)
-                    await sync_context.progress.increment("skipped", 1)
 
         await asyncio.gather(*[_one(e) for e in parents])
+        if failed_entities:
+            await sync_context.progress.increment("skipped", len(failed_entities))
         return hashes, failed_entities
 
-    async def _persist_batch(
-        self,
-        *,
-        partitions: Dict[str, List[BaseEntity]],
-        existing_map: Dict[str, models.Entity],
-        parent_hashes: Dict[str, str],
-        children_by_parent: Dict[str, List[BaseEntity]],
-        sync_context: SyncContext,
-    ) -> Dict[str, List[BaseEntity]]:
-        """Persist a batch of entities with automatic retry on database conflicts."""
-        return await self._retry_on_deadlock(
-            self._persist_batch_impl,
-            partitions=partitions,
-            existing_map=existing_map,
-            parent_hashes=parent_hashes,
-            children_by_parent=children_by_parent,
-            sync_context=sync_context,
-        )
+    async def _prehash_local_files(
+        self, parents: List[BaseEntity], *, inner_concurrency: int
+    ) -> None:
+        """Hash file contents for the whole batch through the bounded batch hasher.
 
-    async def _persist_batch_impl(
-        self,
-        *,
-        partitions: Dict[str, List[BaseEntity]],
-        existing_map: Dict[str, models.Entity],
-        parent_hashes: Dict[str, str],
-        children_by_parent: Dict[str, List[BaseEntity]],
-        sync_context: SyncContext,
-    ) -> Dict[str, List[BaseEntity]]:
-        """Internal implementation of batch persistence with retry support."""
-        inserts, updates, deletes = (
-            partitions["inserts"],
-            partitions["updates"],
-            partitions["deletes"],
-        )
+        Files downloaded via the FileManager already carry a content hash computed while
+        streaming; this only covers files that still need to be read from disk.
+        """
+        pending: Dict[str, List[FileEntity]] = defaultdict(list)
+        for e in parents:
+            if not isinstance(e, FileEntity):
+                continue
+            meta = e.airweave_system_metadata
+            if meta is None or meta.hash or not meta.local_path:
+                continue
+            pending[meta.local_path].append(e)
+
+        if not pending:
+            return
+
+        existing_paths = [path for path in pending if os.path.exists(path)]
+        digests = await file_hasher.hash_files(existing_paths, max_concurrency=inner_concurrency)
+        for path, digest in digests.items():
+            for e in pending[path]:
+                e.airweave_system_metadata.hash = digest
 
-        # Persist to database in a transaction
+    async def _persist_batch_db(self, *, work: BatchWork, sync_context: SyncContext) -> None:
+        """Persist a batch's inserts, updates and deletes in one database transaction."""
+        partitions = work.partitions
+        persist_start = time.monotonic()
         async with get_db_context() as db:
             async with db.begin():
                 await self._batch_persist_db_inserts(
-                    db, inserts, parent_hashes, children_by_parent, sync_context
+                    db,
+                    partitions["inserts"],
+                    work.parent_hashes,
+                    work.children_by_parent,
+                    sync_context,
                 )
                 await self._batch_persist_db_updates(
-                    db, updates, parent_hashes, existing_map, children_by_parent, sync_context
+                    db,
+                    partitions["updates"],
+                    work.parent_hashes,
+                    work.existing_map,
+                    work.children_by_parent,
+                    sync_context,
                 )
-                await self._batch_persist_db_deletes(db, deletes, sync_context)
-
-        await self._batch_update_destinations(
-            inserts, updates, deletes, children_by_parent, sync_context
-        )
-        await self._update_progress_and_guard_rails(partitions, sync_context)
-
-        results_by_parent: dict[str, List[BaseEntity]] = dict(children_by_parent)
-        for p_list in (
-            partitions["inserts"],
-            partitions["updates"],
-            partitions["keeps"],
-            partitions["deletes"],
-        ):
-            for p in p_list:
-                results_by_parent.setdefault(p.entity_id, [])
-
-        return results_by_parent
+                await self._batch_persist_db_deletes(db, partitions["deletes"], sync_context)
+        self._record_stage("persist", persist_start, work.size)
 
     async def _batch_persist_db_inserts(
         self,
@@ -804,6 +1116,7 @@ class EntityProcessor:
                     entity_id=p.entity_id,
                     entity_definition_id=def_id,
                     hash=parent_hash,
+                    version_fingerprint=compute_version_fingerprint(p),
                 )
             )
             valid_parent_ids.add(p.entity_id)
@@ -928,7 +1241,7 @@ class EntityProcessor:
         if not updates:
             return
 
-        await self._update_entity_hashes(updates, parent_hashes, existing_map, db)
+        await self._update_entity_hashes(updates, parent_hashes, existing_map, db, sync_context)
         await self._assign_metadata_ids_for_updates(updates, existing_map, children_by_parent)
         await self._update_state_tracker_for_updates(updates, existing_map, sync_context)
 
@@ -938,14 +1251,21 @@ class EntityProcessor:
         parent_hashes: Dict[str, str],
         existing_map: Dict[str, models.Entity],
         db,
+        sync_context: SyncContext,
     ) -> None:
-        update_pairs = [
-            (existing_map[p.entity_id].id, parent_hashes[p.entity_id])
+        update_rows = [
+            (
+                existing_map[p.entity_id].id,
+                parent_hashes[p.entity_id],
+                compute_version_fingerprint(p),
+            )
             for p in updates
             if p.entity_id in existing_map and p.entity_id in parent_hashes
         ]
-        if update_pairs:
-            await crud.entity.bulk_update_hash(db=db, rows=update_pairs)
+        if update_rows:
+            await crud.entity.bulk_update_hash(
+                db=db, rows=update_rows, sync_job_id=sync_context.sync_job.id
+            )
 
     async def _assign_metadata_ids_for_updates(
         self,
@@ -1036,10 +1356,9 @@ class EntityProcessor:
         self, partitions: Dict[str, List[BaseEntity]], sync_context: SyncContext
     ) -> None:
         actions = {"inserted": "inserts", "updated": "updates", "deleted": "deletes"}
-        for key, partition_key in actions.items():
-            count = len(partitions[partition_key])
-            if count > 0:
-                await sync_context.progress.increment(key, count)
+        await sync_context.progress.increment_many(
+            {key: len(partitions[partition_key]) for key, partition_key in actions.items()}
+        )
         work_count = len(partitions["inserts"]) + len(partitions["updates"])
         for _ in range(work_count):
             await sync_context.guard_rail.increment(ActionType.ENTITIES)
@@ -1107,28 +1426,35 @@ class EntityProcessor:
 
     async def _get_embeddings(
         self, texts: List[str], sync_context: SyncContext, entity_context: str
-    ) -> Tuple[List[List[float]], List[SparseTextEmbedding] | None]:
-        import inspect
-
+    ) -> Tuple[List[np.ndarray], List[SparseTextEmbedding] | None]:
+        """Dense vectors (float32 rows, kept as arrays until the destination) and sparse ones."""
         embedding_model = sync_context.embedding_model
 
-        if hasattr(embedding_model, "embed_many"):
-            sig = inspect.signature(embedding_model.embed_many)
-            if "entity_context" in sig.parameters:
-                embeddings = await embedding_model.embed_many(texts, entity_context=entity_context)
-            else:
-                embeddings = await embedding_model.embed_many(texts)
-        else:
-            embeddings = await embedding_model.embed_many(texts)
+        async def _embed(batch: List[str]) -> np.ndarray:
+            return await embedding_model.embed_many_array(batch, entity_context=entity_context)
+
+        async def _dense() -> List[np.ndarray]:
+            # Unchanged chunks of re-synced files come from the cache instead of the model
+            model_name = getattr(embedding_model, "embedding_model", None)
+            if not isinstance(model_name, str):
+                model_name = getattr(embedding_model, "model_name", type(embedding_model).__name__)
+            return await embedding_cache.embed_many(
+                model_name, embedding_model.vector_dimensions, texts, _embed
+            )
 
         # Use precomputed destination capability from SyncContext instead of
         # hitting destinations per batch (avoids Qdrant 408s under load).
         calculate_sparse_embeddings = bool(getattr(sync_context, "has_keyword_index", False))
 
         if calculate_sparse_embeddings:
+            # BM25 encodes in its own worker processes, so it overlaps with the dense call
             sparse_embedder = sync_context.keyword_indexing_model
-            sparse_embeddings = list(await sparse_embedder.embed_many(texts))
+            embeddings, sparse_embeddings = await asyncio.gather(
+                _dense(), sparse_embedder.embed_many(texts)
+            )
+            sparse_embeddings = list(sparse_embeddings)
         else:
+            embeddings = await _dense()
             sparse_embeddings = None
 
         return embeddings, sparse_embeddings
@@ -1136,7 +1462,7 @@ class EntityProcessor:
     async def _assign_vectors_to_entities(
         self,
         processed_entities: List[BaseEntity],
-        embeddings: List[List[float]],
+        embeddings: List[np.ndarray],
         sparse_embeddings: List[SparseTextEmbedding] | None,
         sync_context: SyncContext,
     ) -> List[BaseEntity]:
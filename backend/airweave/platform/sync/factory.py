@@ -1,6 +1,5 @@
 """Module for sync factory that creates context and orchestrator instances."""
 
-import importlib
 import time
 from typing import Any, Dict, Optional
 from uuid import UUID
@@ -37,6 +36,7 @@ from airweave.platform.sync.pubsub import SyncEntityStateTracker, SyncProgress
 from airweave.platform.sync.router import SyncDAGRouter
 from airweave.platform.sync.stream import AsyncSourceStream
 from airweave.platform.sync.token_manager import TokenManager
+from airweave.platform.sync.version_index import VersionFingerprintIndex
 from airweave.platform.sync.worker_pool import AsyncWorkerPool
 
 
@@ -293,6 +293,9 @@ class SyncFactory:
         # Set cursor on source so it can access cursor data
         source.set_cursor(cursor)
 
+        # Let the source skip downloading files whose remote version is unchanged
+        source.set_version_fingerprint_lookup(VersionFingerprintIndex(sync.id, logger).get)
+
         return sync_context
 
     @classmethod
@@ -1043,9 +1046,7 @@ class SyncFactory:
         for entity_definition in entity_definitions:
             if entity_definition.id == RESERVED_TABLE_ENTITY_ID:
                 continue
-            full_module_name = f"airweave.platform.entities.{entity_definition.module_name}"
-            module = importlib.import_module(full_module_name)
-            entity_class = getattr(module, entity_definition.class_name)
+            entity_class = resource_locator.get_entity_definition(entity_definition)
             entity_definition_map[entity_class] = entity_definition.id
 
         return entity_definition_map
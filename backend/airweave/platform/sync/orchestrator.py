@@ -1,10 +1,12 @@
 """Module for data synchronization with TRUE batching + toggleable batching."""
 
 import asyncio
-from typing import Optional
+import time
+from typing import Any, Dict, Optional
 
 from airweave import schemas
 from airweave.analytics import business_events
+from airweave.core.config import settings
 from airweave.core.datetime_utils import utc_now_naive
 from airweave.core.exceptions import PaymentRequiredException, UsageLimitExceededException
 from airweave.core.guard_rail_service import ActionType
@@ -12,9 +14,13 @@ from airweave.core.shared_models import SyncJobStatus
 from airweave.core.sync_cursor_service import sync_cursor_service
 from airweave.core.sync_job_service import sync_job_service
 from airweave.db.session import get_db_context
+from airweave.platform.embedding_models._cache import embedding_cache
+from airweave.platform.file_handling.conversion.cache import conversion_cache
+from airweave.platform.sync.adaptive_controller import AdaptiveSyncController
 from airweave.platform.sync.context import SyncContext
 from airweave.platform.sync.entity_processor import EntityProcessor
 from airweave.platform.sync.stream import AsyncSourceStream
+from airweave.platform.sync.transform_executor import get_transform_executor
 from airweave.platform.sync.worker_pool import AsyncWorkerPool
 from airweave.platform.utils.error_utils import get_error_message
 
@@ -56,6 +62,26 @@ class SyncOrchestrator:
             else 200
         )
 
+        # Batch size and worker count start at the configured values and are then tuned
+        # from observed latencies (batched path only), workers up to their own ceiling
+        self.tuning_controller = AdaptiveSyncController(
+            logger=sync_context.logger,
+            batch_size=self.batch_size,
+            workers=worker_pool.max_workers,
+            min_batch_size=settings.SYNC_MIN_BATCH_SIZE,
+            max_batch_size=settings.SYNC_MAX_BATCH_SIZE,
+            min_workers=settings.SYNC_MIN_WORKERS,
+            max_workers=settings.SYNC_ADAPTIVE_MAX_WORKERS,
+            target_batch_seconds=settings.SYNC_TARGET_BATCH_SECONDS,
+            enabled=settings.SYNC_ADAPTIVE_TUNING and self.should_batch,
+        )
+        self.entity_processor.set_tuning_controller(self.tuning_controller)
+
+        # Transform executor counters at sync start, to report this sync's share
+        self._transform_metrics_start = get_transform_executor().metrics_snapshot()
+        self._conversion_cache_start = conversion_cache.metrics_snapshot()
+        self._embedding_cache_start = embedding_cache.metrics_snapshot()
+
     async def run(self) -> schemas.Sync:
         """Execute the synchronization process."""
         final_status = SyncJobStatus.FAILED  # Default to failed, will be updated based on outcome
@@ -230,18 +256,44 @@ class SyncOrchestrator:
             return pending_tasks
 
         task = await self.worker_pool.submit(
-            self.entity_processor.process_batch,
-            entities=list(batch),
+            self._process_batch_timed,
+            batch=list(batch),
             source_node=source_node,
-            sync_context=self.sync_context,
         )
         pending_tasks.add(task)
 
-        if len(pending_tasks) >= self.worker_pool.max_workers:
+        await self._retune()
+
+        # A loop, since the pool may have been shrunk below the number of pending tasks
+        while len(pending_tasks) >= self.worker_pool.max_workers:
             pending_tasks = await self._handle_completed_tasks(pending_tasks)
 
         return pending_tasks
 
+    async def _process_batch_timed(self, batch: list, source_node: schemas.DagNode):
+        """Process a micro-batch and report its latency to the tuning controller."""
+        start = time.monotonic()
+        result = await self.entity_processor.process_batch(
+            entities=batch,
+            source_node=source_node,
+            sync_context=self.sync_context,
+        )
+        self.tuning_controller.record_batch(len(batch), time.monotonic() - start)
+        return result
+
+    async def _retune(self) -> None:
+        """Apply a tuning decision, if one is due, and report it in the progress stream."""
+        decision = self.tuning_controller.maybe_adjust(
+            queue_depth=self.stream.queue.qsize(), queue_capacity=self.stream.queue.maxsize
+        )
+        if decision is None:
+            return
+
+        self.batch_size = decision["batch_size"]
+        await self.worker_pool.resize(decision["workers"])
+        await self.sync_context.progress.update_tuning(self.tuning_controller.snapshot())
+        await self.sync_context.progress.update_transform(self._transform_metrics())
+
     # ----------------------------- Unbatched path -----------------------------
     async def _process_entities_unbatched(self) -> None:  # noqa: C901
         """Process entities one-at-a-time (legacy path)."""
@@ -351,6 +403,9 @@ class SyncOrchestrator:
         # 3. Wait for all tasks to complete
         await self._wait_for_remaining_tasks(pending_tasks)
 
+        # 4. Stop the batch pipeline's stage workers
+        await self.entity_processor.close()
+
     async def _cleanup_orphaned_entities_if_needed(self) -> None:
         """Cleanup orphaned entities based on sync type."""
         has_cursor_data = bool(
@@ -393,6 +448,15 @@ class SyncOrchestrator:
         if getattr(self.sync_context, "entity_state_tracker", None):
             await self.sync_context.entity_state_tracker.finalize(status, error)
 
+    async def _invalidate_recency_cache(self) -> None:
+        """Drop cached oldest/newest timestamps used by recency-biased search."""
+        from airweave.search.recency_cache import recency_bounds_cache
+
+        try:
+            await recency_bounds_cache.invalidate(str(self.sync_context.collection.id))
+        except Exception as e:
+            self.sync_context.logger.warning(f"Failed to invalidate recency cache: {e}")
+
     async def _complete_sync(self) -> None:
         """Mark sync job as completed with final statistics."""
         stats = getattr(self.sync_context.progress, "stats", None)
@@ -408,6 +472,9 @@ class SyncOrchestrator:
             stats=stats,
         )
 
+        # New data invalidates the cached recency span of the collection
+        await self._invalidate_recency_cache()
+
         # Track sync completed
         from airweave.analytics import business_events
 
@@ -439,6 +506,53 @@ class SyncOrchestrator:
         self.sync_context.logger.info(
             f"Completed sync job {self.sync_context.sync_job.id} successfully. Stats: {stats}"
         )
+        await self._report_transform_metrics()
+
+    def _transform_metrics(self) -> Dict[str, Any]:
+        """Transform executor usage since the start of this sync."""
+        executor = get_transform_executor()
+        delta = executor.metrics_delta(self._transform_metrics_start, executor.metrics_snapshot())
+        delta["busy_seconds"] = round(delta["busy_seconds"], 3)
+        return delta
+
+    async def _report_transform_metrics(self) -> None:
+        """Report transform executor usage and log conversion and embedding cache hit rates.
+
+        Executor usage goes into the sync's progress stream. Counters are process-wide, so
+        concurrent syncs in the same process are included.
+        """
+        delta = self._transform_metrics()
+        await self.sync_context.progress.update_transform(delta)
+        self.sync_context.logger.info(
+            f"Transform executor ({delta['backend']}): {int(delta['tasks'])} tasks, "
+            f"{int(delta['failures'])} failed, {int(delta['fallbacks'])} fallbacks, "
+            f"{delta['busy_seconds']:.1f}s busy"
+        )
+
+        cache_end = conversion_cache.metrics_snapshot()
+        cache_delta = {
+            key: value - self._conversion_cache_start.get(key, 0)
+            for key, value in cache_end.items()
+        }
+        self.sync_context.logger.info(
+            f"Conversion cache: {cache_delta['memory_hits'] + cache_delta['storage_hits']} hits "
+            f"({cache_delta['memory_hits']} in memory), {cache_delta['misses']} misses, "
+            f"{cache_delta['stores']} stored, {cache_delta['evictions']} evicted"
+        )
+
+        embedding_end = embedding_cache.metrics_snapshot()
+        embedding_delta = {
+            key: value - self._embedding_cache_start.get(key, 0)
+            for key, value in embedding_end.items()
+        }
+        embedding_hits = embedding_delta["memory_hits"] + embedding_delta["backend_hits"]
+        embedding_lookups = embedding_hits + embedding_delta["misses"]
+        hit_rate = embedding_hits / embedding_lookups if embedding_lookups else 0.0
+        self.sync_context.logger.info(
+            f"Embedding cache: {embedding_hits} hits ({hit_rate:.0%}, "
+            f"{embedding_delta['memory_hits']} in memory), {embedding_delta['misses']} misses, "
+            f"{embedding_delta['stores']} stored, {embedding_delta['errors']} errors"
+        )
 
     async def _save_cursor_data(self) -> None:
         """Save cursor data to database if it exists."""
@@ -519,6 +633,7 @@ class SyncOrchestrator:
         # 1. Cancel all pending tasks IMMEDIATELY
         if self.worker_pool:
             await self.worker_pool.cancel_all()
+        await self.entity_processor.close()
 
         # 2. Cancel stream to stop producer
         await self.stream.cancel()
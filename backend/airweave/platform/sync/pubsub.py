@@ -2,7 +2,7 @@
 
 import asyncio
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from airweave.core.logging import ContextualLogger
@@ -12,10 +12,22 @@ from airweave.schemas.entity_count import EntityCountWithDefinition
 from airweave.schemas.sync_pubsub import EntityStateUpdate, SyncCompleteMessage, SyncProgressUpdate
 
 PUBLISH_THRESHOLD = 3
+# Max delay before pending progress is published, even below the threshold
+PUBLISH_INTERVAL_SECONDS = 0.5
+
+# Counters that make up the total number of processed operations
+OPERATION_COUNTERS = ("inserted", "updated", "deleted", "kept", "skipped")
 
 
 class SyncProgress:
-    """Tracks sync progress and automatically publishes updates."""
+    """Tracks sync progress and automatically publishes updates.
+
+    Counters are updated without a lock: an update is a handful of attribute writes with
+    no await in between, which is atomic on the event loop. Publishing to Redis and
+    status logging happen in a background task that emits snapshots when enough
+    operations accumulated or the publish interval elapsed, so workers never wait on I/O
+    when they record progress.
+    """
 
     def __init__(self, job_id: UUID, logger: ContextualLogger):
         """Initialize the SyncProgress instance.
@@ -26,10 +38,14 @@ class SyncProgress:
         """
         self.job_id = job_id
         self.stats = SyncProgressUpdate()
+        self._total_ops = 0
         self._last_published = 0
+        self._runtime_changed = False
         self._publish_threshold = PUBLISH_THRESHOLD
-        # CRITICAL FIX: Add async lock to prevent race conditions
-        self._lock = asyncio.Lock()
+        self._publish_interval = PUBLISH_INTERVAL_SECONDS
+        self._publish_wakeup: Optional[asyncio.Event] = None
+        self._publisher_task: Optional[asyncio.Task] = None
+        self._finalized = False
         self.logger = logger
         self._last_status_update = 0
         self._status_update_interval = 50  # Log status every 50 items
@@ -39,37 +55,92 @@ class SyncProgress:
         return getattr(self.stats, name)
 
     async def increment(self, stat_name: str, amount: int = 1) -> None:
-        """Increment a counter and trigger update if threshold reached.
-
-        Uses async lock to prevent race conditions from concurrent workers.
-        """
-        async with self._lock:  # CRITICAL FIX: Synchronize access
-            current_value = getattr(self.stats, stat_name, 0)
-            setattr(self.stats, stat_name, current_value + amount)
-
-            # Include ALL operations in threshold calculation (including skipped)
-            total_ops = sum(
-                [
-                    self.stats.inserted,
-                    self.stats.updated,
-                    self.stats.deleted,
-                    self.stats.kept,
-                    self.stats.skipped,
-                ]
-            )
+        """Increment a single counter (see increment_many)."""
+        self._apply({stat_name: amount})
 
-            # Check if we should publish
-            if total_ops - self._last_published >= self._publish_threshold:
-                self.logger.debug(
-                    f"Progress threshold reached: {total_ops} total ops, publishing update"
-                )
-                await self._publish()
-                self._last_published = total_ops
+    async def increment_many(self, amounts: Dict[str, int]) -> None:
+        """Increment several counters in one step.
 
-            # Check if we should log a status update (every 50 items)
-            if total_ops - self._last_status_update >= self._status_update_interval:
-                await self._log_status_update(total_ops)
-                self._last_status_update = total_ops
+        Args:
+            amounts: Mapping of stat name (e.g. "inserted", "skipped") to increment
+        """
+        self._apply(amounts)
+
+    def _apply(self, amounts: Dict[str, int]) -> None:
+        """Apply counter increments and wake the publisher if the threshold is reached."""
+        for stat_name, amount in amounts.items():
+            if not amount:
+                continue
+            setattr(self.stats, stat_name, getattr(self.stats, stat_name, 0) + amount)
+            if stat_name in OPERATION_COUNTERS:
+                self._total_ops += amount
+
+        wakeup = self._ensure_publisher()
+        if self._total_ops - self._last_published >= self._publish_threshold:
+            wakeup.set()
+
+    async def update_tuning(self, tuning: Dict[str, Any]) -> None:
+        """Report the sync's current runtime tuning state with the next progress update."""
+        self.stats.tuning = tuning
+        self._runtime_changed = True
+        self._ensure_publisher().set()
+
+    async def update_transform(self, transform: Dict[str, Any]) -> None:
+        """Report the sync's transform executor usage with the next progress update."""
+        self.stats.transform = transform
+        self._runtime_changed = True
+        self._ensure_publisher().set()
+
+    def _ensure_publisher(self) -> asyncio.Event:
+        """Start the background publisher on first use (never again after finalize)."""
+        if self._publish_wakeup is None:
+            self._publish_wakeup = asyncio.Event()
+        if self._finalized:
+            # Late updates only change the counters; finalize published the last snapshot
+            return self._publish_wakeup
+        if self._publisher_task is None:
+            self._publisher_task = asyncio.create_task(self._run_publisher())
+        return self._publish_wakeup
+
+    async def _run_publisher(self) -> None:
+        """Publish snapshots on threshold wake-ups or every publish interval."""
+        while True:
+            try:
+                await asyncio.wait_for(self._publish_wakeup.wait(), timeout=self._publish_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._publish_wakeup.clear()
+            await self._publish_pending()
+
+    async def _publish_pending(self) -> None:
+        """Publish a snapshot and log status if anything changed since the last one."""
+        total_ops = self._total_ops
+        if total_ops == self._last_published and not self._runtime_changed:
+            return
+
+        self._runtime_changed = False
+        self.logger.debug(f"Progress update: {total_ops} total ops, publishing snapshot")
+        self._last_published = total_ops
+        try:
+            await self._publish()
+        except Exception as e:
+            self.logger.warning(f"Failed to publish sync progress: {e}")
+
+        # Check if we should log a status update (every 50 items)
+        if total_ops - self._last_status_update >= self._status_update_interval:
+            await self._log_status_update(total_ops)
+            self._last_status_update = total_ops
+
+    async def _stop_publisher(self) -> None:
+        """Stop the background publisher."""
+        task, self._publisher_task = self._publisher_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
 
     async def _publish(self) -> None:
         """Publish current progress."""
@@ -81,61 +152,50 @@ class SyncProgress:
         Args:
             status: The final status of the sync job
         """
-        async with self._lock:  # Ensure finalize is also synchronized
-            # Set the final status
-            self.stats.status = status
-
-            # Map status to logging details
-            status_map = {
-                SyncJobStatus.COMPLETED: ("✅", "Sync completed successfully", "info"),
-                SyncJobStatus.CANCELLED: ("🚫", "Sync cancelled", "info"),
-                SyncJobStatus.FAILED: ("❌", "Sync failed", "error"),
-            }
+        self._finalized = True
+        await self._stop_publisher()
 
-            status_emoji, status_text, log_level = status_map.get(
-                status, ("❓", f"Sync ended with status: {status.value}", "warning")
-            )
+        # Set the final status
+        self.stats.status = status
 
-            # Log final status
-            total_ops = sum(
-                [
-                    self.stats.inserted,
-                    self.stats.updated,
-                    self.stats.deleted,
-                    self.stats.kept,
-                    self.stats.skipped,
-                ]
-            )
+        # Map status to logging details
+        status_map = {
+            SyncJobStatus.COMPLETED: ("✅", "Sync completed successfully", "info"),
+            SyncJobStatus.CANCELLED: ("🚫", "Sync cancelled", "info"),
+            SyncJobStatus.FAILED: ("❌", "Sync failed", "error"),
+        }
 
-            message = (
-                f"{status_emoji} {status_text} - Total: {total_ops} | "
-                f"Inserted: {self.stats.inserted} | Updated: {self.stats.updated} | "
-                f"Deleted: {self.stats.deleted} | Kept: {self.stats.kept} | "
-                f"Skipped: {self.stats.skipped}"
-            )
+        status_emoji, status_text, log_level = status_map.get(
+            status, ("❓", f"Sync ended with status: {status.value}", "warning")
+        )
 
-            if log_level == "error":
-                self.logger.error(message)
-            elif log_level == "warning":
-                self.logger.warning(message)
-            else:
-                self.logger.info(message)
+        # Log final status
+        total_ops = self._total_ops
 
-            await self._publish()
+        message = (
+            f"{status_emoji} {status_text} - Total: {total_ops} | "
+            f"Inserted: {self.stats.inserted} | Updated: {self.stats.updated} | "
+            f"Deleted: {self.stats.deleted} | Kept: {self.stats.kept} | "
+            f"Skipped: {self.stats.skipped}"
+        )
+
+        if log_level == "error":
+            self.logger.error(message)
+        elif log_level == "warning":
+            self.logger.warning(message)
+        else:
+            self.logger.info(message)
+
+        await self._publish()
+        self._last_published = total_ops
 
     def to_dict(self) -> dict:
         """Convert progress to a dictionary."""
         return self.stats.model_dump()
 
-    async def update_entities_encountered_count(
-        self, entities_encountered: dict[str, set[str]]
-    ) -> None:
-        """Update the entities encountered tracking."""
-        async with self._lock:  # Synchronize this as well
-            self.stats.entities_encountered = {
-                entity_type: len(entity_ids)
-                for entity_type, entity_ids in entities_encountered.items()
-            }
+    async def update_entities_encountered_count(self, entities_encountered: dict[str, int]) -> None:
+        """Update the entities encountered tracking with the count per entity type."""
+        self.stats.entities_encountered = dict(entities_encountered)
 
     async def _log_status_update(self, total_ops: int) -> None:
         """Log a periodic status update.
@@ -18,7 +18,10 @@ from airweave.platform.entities._base import (
     PolymorphicEntity,
 )
 from airweave.platform.locator import resource_locator
-from airweave.platform.transformers.code_file_chunker import code_file_chunker
+from airweave.platform.transformers.code_file_chunker import (
+    code_file_chunker,
+    code_file_chunker_batch,
+)
 from airweave.platform.transformers.code_file_summarizer import code_file_summarizer
 from airweave.platform.transformers.default_file_chunker import file_chunker
 from airweave.platform.transformers.entity_field_chunker import entity_chunker
@@ -172,6 +175,32 @@ class SyncDAGRouter:
             producer_id, entity, entity_context, entity_type, router_start
         )
 
+    def is_code_file(self, entity: BaseEntity) -> bool:
+        """Whether an entity is handled by the code file path (see process_code_files)."""
+        return self._is_code_file_entity(type(entity), entity)
+
+    async def process_code_files(
+        self, entities: list[BaseEntity]
+    ) -> list[Optional[list[BaseEntity]]]:
+        """Chunk (and optionally summarize) many CodeFileEntities on the transform executor.
+
+        Equivalent to process_entity on each of them, in input order. Files whose chunking
+        failed are None.
+        """
+        chunked = await code_file_chunker_batch(entities, self.logger)
+
+        if settings.CODE_SUMMARIZER_ENABLED:
+            chunked = [
+                await self._apply_code_summarization(
+                    transformed_entities, f"Entity({entity.entity_id})"
+                )
+                if transformed_entities is not None
+                else None
+                for entity, transformed_entities in zip(entities, chunked, strict=True)
+            ]
+
+        return chunked
+
     def _is_code_file_entity(self, entity_type: type, entity: BaseEntity) -> bool:
         """Check if entity is a CodeFileEntity."""
         return issubclass(entity_type, CodeFileEntity) or isinstance(entity, CodeFileEntity)
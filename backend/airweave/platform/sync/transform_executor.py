@@ -0,0 +1,162 @@
+"""Execution backend for CPU-heavy transform work (document conversion and chunking).
+
+By default transform work runs in the shared thread pool (see async_helpers), where pure
+Python converters and chunkers are GIL-bound and a sync worker uses roughly one core for
+convert+chunk. Setting ``TRANSFORM_BACKEND=process`` runs the same work in a pool of
+spawned worker processes instead. Each worker warms the tokenizer once on start-up and
+keeps its converters and chunkers cached for its lifetime.
+
+Functions submitted to the executor must be module-level (picklable) and should take file
+paths or plain data rather than entities. If the process pool cannot be started or breaks,
+the executor falls back to the thread pool for the rest of the process lifetime.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.platform.sync.async_helpers import run_in_thread_pool
+
+T = TypeVar("T")
+
+TRANSFORM_BACKEND_THREAD = "thread"
+TRANSFORM_BACKEND_PROCESS = "process"
+
+
+def _warm_worker() -> None:
+    """Process pool initializer: load the tokenizer before the first task arrives."""
+    from airweave.platform.transformers.utils import get_token_encoder
+
+    # A failing initializer breaks the whole pool; let the first task surface the error
+    try:
+        get_token_encoder()
+    except Exception:
+        pass
+
+
+class TransformExecutor:
+    """Runs transform functions in the thread pool or in a process pool."""
+
+    def __init__(self, backend: str, pool_size: int = 0):
+        """Initialize the executor. The process pool is started lazily on first use.
+
+        Args:
+            backend: "thread" or "process"
+            pool_size: Number of worker processes (0 uses one per CPU)
+        """
+        if backend not in (TRANSFORM_BACKEND_THREAD, TRANSFORM_BACKEND_PROCESS):
+            logger.warning(f"Unknown TRANSFORM_BACKEND '{backend}', using thread backend")
+            backend = TRANSFORM_BACKEND_THREAD
+
+        self.backend = backend
+        self.pool_size = pool_size if pool_size > 0 else (os.cpu_count() or 1)
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        # Process-wide counters; syncs report the delta over their lifetime
+        self._metrics: Dict[str, float] = {
+            "tasks": 0,
+            "failures": 0,
+            "fallbacks": 0,
+            "busy_seconds": 0.0,
+        }
+
+    @property
+    def uses_processes(self) -> bool:
+        """Whether work is currently dispatched to worker processes."""
+        return self.backend == TRANSFORM_BACKEND_PROCESS
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run ``func(*args)`` on the configured backend without blocking the event loop."""
+        start = time.monotonic()
+        try:
+            executor = self._get_executor()
+            if executor is None:
+                return await run_in_thread_pool(func, *args)
+
+            try:
+                return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+            except BrokenProcessPool:
+                logger.warning("Transform process pool broke; falling back to the thread pool")
+                self._metrics["fallbacks"] += 1
+                self._disable_process_pool()
+                return await run_in_thread_pool(func, *args)
+        except Exception:
+            self._metrics["failures"] += 1
+            raise
+        finally:
+            self._metrics["tasks"] += 1
+            self._metrics["busy_seconds"] += time.monotonic() - start
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """Lazily start the process pool (spawned, so no event loop state is forked)."""
+        if not self.uses_processes:
+            return None
+
+        with self._executor_lock:
+            if self._executor is None:
+                try:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.pool_size,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_warm_worker,
+                    )
+                    logger.info(f"Started transform process pool with {self.pool_size} workers")
+                except Exception as e:
+                    logger.warning(f"Could not start transform process pool, using threads: {e}")
+                    self._metrics["fallbacks"] += 1
+                    self.backend = TRANSFORM_BACKEND_THREAD
+                    return None
+        return self._executor
+
+    def _disable_process_pool(self) -> None:
+        """Stop using the process pool for the rest of this process' lifetime."""
+        with self._executor_lock:
+            self.backend = TRANSFORM_BACKEND_THREAD
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def metrics_snapshot(self) -> Dict[str, Any]:
+        """Return the current counters together with the active backend."""
+        return {"backend": self.backend, **self._metrics}
+
+    @staticmethod
+    def metrics_delta(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+        """Difference between two snapshots, e.g. over the lifetime of one sync."""
+        delta: Dict[str, Any] = {"backend": after["backend"]}
+        for key, value in after.items():
+            if key != "backend":
+                delta[key] = value - before.get(key, 0)
+        return delta
+
+    def shutdown(self) -> None:
+        """Shut down the worker processes."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# One executor for the whole process
+_transform_executor: Optional[TransformExecutor] = None
+
+
+def get_transform_executor() -> TransformExecutor:
+    """Get or create the process-wide transform executor."""
+    global _transform_executor
+
+    if _transform_executor is None:
+        _transform_executor = TransformExecutor(
+            backend=settings.TRANSFORM_BACKEND,
+            pool_size=settings.TRANSFORM_PROCESS_POOL_SIZE,
+        )
+    return _transform_executor
@@ -0,0 +1,50 @@
+"""Stored version fingerprints of a sync's entities, for skipping unchanged downloads."""
+
+import asyncio
+from typing import Dict, Optional
+from uuid import UUID
+
+from airweave import crud
+from airweave.core.logging import ContextualLogger
+from airweave.db.session import get_db_context
+
+
+class VersionFingerprintIndex:
+    """Lazily loaded entity_id -> version fingerprint map of one sync.
+
+    Loaded with a single streamed query the first time a source asks for a fingerprint,
+    so syncs whose sources never report remote versions do not pay for it.
+    """
+
+    def __init__(self, sync_id: UUID, logger: ContextualLogger):
+        """Initialize the index.
+
+        Args:
+            sync_id: The sync whose entities are looked up
+            logger: The sync's contextual logger
+        """
+        self.sync_id = sync_id
+        self.logger = logger
+        self._fingerprints: Optional[Dict[str, str]] = None
+        self._load_lock = asyncio.Lock()
+
+    async def get(self, entity_id: str) -> Optional[str]:
+        """Return the stored version fingerprint of an entity, or None if there is none."""
+        if self._fingerprints is None:
+            await self._load()
+        return self._fingerprints.get(entity_id)
+
+    async def _load(self) -> None:
+        async with self._load_lock:
+            if self._fingerprints is not None:
+                return
+            try:
+                async with get_db_context() as db:
+                    self._fingerprints = await crud.entity.get_version_fingerprints_by_sync_id(
+                        db, self.sync_id
+                    )
+                self.logger.debug(f"Loaded {len(self._fingerprints)} stored version fingerprints")
+            except Exception as e:
+                # Without fingerprints every file is simply downloaded and hashed as before
+                self.logger.warning(f"Failed to load version fingerprints: {e}")
+                self._fingerprints = {}
@@ -7,11 +7,45 @@ from typing import Any, Callable
 from airweave.core.logging import ContextualLogger
 
 
+class _ResizableLimiter:
+    """Semaphore-like limiter whose number of slots can change at runtime.
+
+    Shrinking never interrupts running tasks: new tasks wait until enough of them finished.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def available(self) -> int:
+        """Number of free slots."""
+        return max(0, self.limit - self.active)
+
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        async with self._condition:
+            self.active -= 1
+            self._condition.notify()
+        return False
+
+    async def set_limit(self, limit: int) -> None:
+        async with self._condition:
+            self.limit = limit
+            self._condition.notify_all()
+
+
 class AsyncWorkerPool:
     """Manages a pool of workers with controlled concurrency.
 
-    This class limits how many async tasks can run at once using a semaphore,
-    preventing system overload when processing many items in parallel.
+    This class limits how many async tasks can run at once using a resizable limiter,
+    preventing system overload when processing many items in parallel. The limit can be
+    changed while the pool is in use (see resize).
     """
 
     def __init__(self, logger: ContextualLogger, max_workers: int = 100):
@@ -21,7 +55,7 @@ class AsyncWorkerPool:
             max_workers: Maximum number of tasks allowed to run concurrently
             logger: Optional logger instance for contextual logging
         """
-        self.semaphore = asyncio.Semaphore(max_workers)
+        self.limiter = _ResizableLimiter(max_workers)
         self.pending_tasks = set()
         self.max_workers = max_workers
         self.logger = logger
@@ -33,7 +67,7 @@ class AsyncWorkerPool:
         """Submit a coroutine to be executed by the worker pool.
 
         Creates a task, adds it to our tracking set, and returns it.
-        Tasks run with controlled concurrency through the semaphore.
+        Tasks run with controlled concurrency through the limiter.
         """
         if self._cancelled:
             raise RuntimeError("Cannot submit tasks after worker pool has been cancelled")
@@ -52,19 +86,19 @@ class AsyncWorkerPool:
         return task
 
     async def _run_with_semaphore(self, coro: Callable, task_id: str, *args, **kwargs) -> Any:
-        """Run a coroutine with semaphore control.
+        """Run a coroutine with concurrency control.
 
-        Acquires a semaphore before running the coroutine, limiting concurrency.
-        Semaphore is automatically released when coroutine completes.
+        Acquires a slot before running the coroutine, limiting concurrency.
+        The slot is automatically released when the coroutine completes.
         """
         thread_id = threading.get_ident()
 
         self.logger.debug(
             f"⏳ WORKER_WAIT [{task_id}] Waiting for semaphore "
-            f"(thread: {thread_id}, available: {self.semaphore._value})"
+            f"(thread: {thread_id}, available: {self.limiter.available})"
         )
 
-        async with self.semaphore:
+        async with self.limiter:
             self.logger.debug(
                 f"🚀 WORKER_START [{task_id}] Acquired semaphore, starting execution "
                 f"(thread: {thread_id})"
@@ -96,6 +130,19 @@ class AsyncWorkerPool:
                 )
                 raise
 
+    async def resize(self, max_workers: int) -> None:
+        """Change the number of tasks allowed to run concurrently.
+
+        Args:
+            max_workers: New concurrency limit (at least 1)
+        """
+        max_workers = max(1, max_workers)
+        if max_workers == self.max_workers:
+            return
+        self.logger.debug(f"Resizing worker pool: {self.max_workers} -> {max_workers}")
+        self.max_workers = max_workers
+        await self.limiter.set_limit(max_workers)
+
     def _handle_task_completion(self, task: asyncio.Task) -> None:
         """Handle task completion and clean up."""
         task_id = getattr(task, "task_id", "unknown")
@@ -1,107 +1,172 @@
-"""Code file chunker."""
+"""Code file chunker.
 
+Chunking runs on the transform executor (a worker thread or process, see
+transform_executor), never on the event loop. Chunkers are built once per
+(kind, chunk size, language) and reused: tree-sitter parsers are not safe to share between
+threads, so code chunkers are cached per worker thread, while semantic chunkers are shared.
+"""
+
+import asyncio
+import math
 import os
+import threading
 from copy import deepcopy
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from chonkie import CodeChunker, SemanticChunker
 
 from airweave.core.logging import ContextualLogger
 from airweave.platform.decorators import transformer
 from airweave.platform.entities._base import CodeFileEntity
+from airweave.platform.sync.transform_executor import get_transform_executor
 from airweave.platform.transformers.utils import (
     MAX_CHUNK_SIZE,
     METADATA_SIZE,
     count_tokens,
 )
 
-# Module-level shared chunkers
-_shared_semantic_chunker = None
-_shared_code_chunker = None
-
-
-def get_shared_semantic_chunker(chunk_size_limit: int):
-    """Get or create a shared semantic chunker for text files."""
-    global _shared_semantic_chunker
-    if _shared_semantic_chunker is None or _shared_semantic_chunker.chunk_size != chunk_size_limit:
-        _shared_semantic_chunker = SemanticChunker(
-            tokenizer_or_token_counter=count_tokens,
-            chunk_size=chunk_size_limit,
-            min_sentences=1,
-            threshold=0.5,
-            mode="window",
-            similarity_window=2,
-        )
-    return _shared_semantic_chunker
+# Extensions chunked semantically instead of by syntax tree
+TEXT_FILE_EXTENSIONS = {"txt", "text", "csv"}
 
+# File extension -> tree-sitter language. Known languages skip per-file language detection
+# and get a parser that is built once; anything else uses chonkie's auto-detection.
+CODE_LANGUAGES_BY_EXTENSION = {
+    "py": "python",
+    "js": "javascript",
+    "jsx": "javascript",
+    "mjs": "javascript",
+    "ts": "typescript",
+    "tsx": "tsx",
+    "java": "java",
+    "go": "go",
+    "rs": "rust",
+    "c": "c",
+    "h": "c",
+    "cc": "cpp",
+    "cpp": "cpp",
+    "hpp": "cpp",
+    "cs": "csharp",
+    "rb": "ruby",
+    "php": "php",
+    "kt": "kotlin",
+    "swift": "swift",
+    "scala": "scala",
+    "sh": "bash",
+}
+AUTO_LANGUAGE = "auto"
 
-def get_shared_code_chunker(chunk_size_limit: int):
-    """Get or create a shared code chunker."""
-    global _shared_code_chunker
-    if _shared_code_chunker is None or _shared_code_chunker.chunk_size != chunk_size_limit:
-        _shared_code_chunker = CodeChunker(
-            tokenizer_or_token_counter=count_tokens,
-            chunk_size=chunk_size_limit,
-        )
-    return _shared_code_chunker
+# Semantic chunkers keyed by chunk size, shared by all threads of this process
+_shared_semantic_chunkers: Dict[int, SemanticChunker] = {}
+_semantic_chunker_lock = threading.Lock()
 
+# Code chunkers keyed by (chunk size, language), one set per worker thread
+_thread_local = threading.local()
+# Languages this process failed to build a parser for (they fall back to auto-detection)
+_unsupported_languages: set[str] = set()
 
-@transformer(name="Code File Chunker")
-async def code_file_chunker(file: CodeFileEntity, logger: ContextualLogger) -> List[CodeFileEntity]:
-    """Chunk a code file.
+# Chunk text, token count, start index, end index
+ChunkSpan = Tuple[str, int, int, int]
+# Chunk spans of one file (see _chunk_code_content), or the error message if chunking failed
+ChunkResult = Tuple[Optional[List[ChunkSpan]], Optional[str]]
 
-    This transformer:
-    1. Takes a CodeFileEntity as input
-    2. Uses Chonkie to chunk the code file if content size is greater than chunk limit
-    3. Yields each chunk as a CodeFileEntity
 
-    Args:
-        file: The CodeFileEntity to process
-        logger: The logger to use
+def get_shared_semantic_chunker(chunk_size_limit: int) -> SemanticChunker:
+    """Get or create the shared semantic chunker for text files of this chunk size."""
+    chunker = _shared_semantic_chunkers.get(chunk_size_limit)
+    if chunker is None:
+        with _semantic_chunker_lock:
+            chunker = _shared_semantic_chunkers.get(chunk_size_limit)
+            if chunker is None:
+                chunker = SemanticChunker(
+                    tokenizer_or_token_counter=count_tokens,
+                    chunk_size=chunk_size_limit,
+                    min_sentences=1,
+                    threshold=0.5,
+                    mode="window",
+                    similarity_window=2,
+                )
+                _shared_semantic_chunkers[chunk_size_limit] = chunker
+    return chunker
+
+
+def get_shared_code_chunker(chunk_size_limit: int, language: str = AUTO_LANGUAGE) -> CodeChunker:
+    """Get or create this thread's code chunker for a chunk size and language."""
+    chunkers: Optional[Dict[Tuple[int, str], CodeChunker]] = getattr(
+        _thread_local, "code_chunkers", None
+    )
+    if chunkers is None:
+        chunkers = _thread_local.code_chunkers = {}
+
+    if language in _unsupported_languages:
+        language = AUTO_LANGUAGE
+
+    key = (chunk_size_limit, language)
+    chunker = chunkers.get(key)
+    if chunker is None:
+        try:
+            chunker = CodeChunker(
+                tokenizer_or_token_counter=count_tokens,
+                chunk_size=chunk_size_limit,
+                language=language,
+            )
+        except Exception:
+            if language == AUTO_LANGUAGE:
+                raise
+            _unsupported_languages.add(language)
+            return get_shared_code_chunker(chunk_size_limit, AUTO_LANGUAGE)
+        chunkers[key] = chunker
+    return chunker
+
+
+def _chunk_code_content(
+    content: str, file_extension: str, chunk_size_limit: int
+) -> Optional[List[ChunkSpan]]:
+    """Chunk one file's content. Runs on the transform executor.
 
     Returns:
-        List[CodeFileEntity]: The processed chunks
+        None if the content fits in a single chunk, else the chunk spans (possibly empty
+        if chunking produced nothing)
     """
-    logger.debug(f"Starting code file chunker for file: {file.name} (file_id: {file.file_id})")
+    if count_tokens(content) <= chunk_size_limit:
+        return None
 
-    # If file.content is None, return empty list
-    if file.content is None:
-        logger.debug(f"File content is None for {file.name}, returning empty list")
-        return []
+    if file_extension in TEXT_FILE_EXTENSIONS:
+        chunks = get_shared_semantic_chunker(chunk_size_limit).chunk(content)
+    else:
+        language = CODE_LANGUAGES_BY_EXTENSION.get(file_extension, AUTO_LANGUAGE)
+        chunks = get_shared_code_chunker(chunk_size_limit, language).chunk(content)
 
-    # Count tokens in just the content (not the entire entity)
-    content_token_count = count_tokens(file.content)
-    chunk_size_limit = MAX_CHUNK_SIZE - METADATA_SIZE  # Leave room for metadata
-    logger.debug(
-        f"File {file.name} content has {content_token_count} tokens, "
-        f"chunk limit is {chunk_size_limit}"
-    )
+    return [(chunk.text, chunk.token_count, chunk.start_index, chunk.end_index) for chunk in chunks]
 
-    # If the content is small enough to fit in one chunk, return it as is
-    if content_token_count <= chunk_size_limit:
-        logger.debug(
-            f"File {file.name} content is small enough ({content_token_count} tokens), "
-            f"no chunking needed"
-        )
-        return [file]
 
-    # Check if this is a text file by extension
-    file_extension = os.path.splitext(file.name)[1].lower().lstrip(".")
-    is_text_file = file_extension in ["txt", "text", "csv"]
-    logger.debug(f"File {file.name} has extension {file_extension}, is_text_file={is_text_file}")
+def _chunk_code_contents(items: List[Tuple[str, str]], chunk_size_limit: int) -> List[ChunkResult]:
+    """Chunk many (content, file extension) pairs in one executor task.
 
-    if is_text_file:
-        logger.debug(f"Using semantic chunker for text file {file.name}")
-        semantic_chunker = get_shared_semantic_chunker(chunk_size_limit)  # Use shared
-        chunks = semantic_chunker.chunk(file.content)
-        logger.debug(f"Semantic chunker produced {len(chunks)} chunks")
-    else:
-        logger.debug(f"Using code chunker for code file {file.name}")
-        code_chunker = get_shared_code_chunker(chunk_size_limit)  # Use shared
-        chunks = code_chunker.chunk(file.content)
-        logger.debug(f"Code chunker produced {len(chunks)} chunks")
+    A file that fails to chunk gets its error message instead of spans, so it does not
+    fail the other files of the task.
+    """
+    results: List[ChunkResult] = []
+    for content, file_extension in items:
+        try:
+            results.append((_chunk_code_content(content, file_extension, chunk_size_limit), None))
+        except Exception as e:
+            results.append((None, f"{type(e).__name__}: {e}"))
+    return results
+
+
+def _file_extension(file: CodeFileEntity) -> str:
+    return os.path.splitext(file.name)[1].lower().lstrip(".")
+
+
+def _build_chunked_files(
+    file: CodeFileEntity, spans: Optional[List[ChunkSpan]], logger: ContextualLogger
+) -> List[CodeFileEntity]:
+    """Turn a file's chunk spans into chunked CodeFileEntity copies."""
+    if spans is None:
+        logger.debug(f"File {file.name} content is small enough, no chunking needed")
+        return [file]
 
-    if not chunks:  # If chunking failed or returned empty, return original
+    if not spans:  # If chunking failed or returned empty, return original
         logger.warning(
             f"Chunking failed or returned empty for {file.name}, returning original file"
         )
@@ -109,20 +174,19 @@ async def code_file_chunker(file: CodeFileEntity, logger: ContextualLogger) -> L
 
     # Create a new CodeFileEntity for each chunk
     chunked_files = []
-    total_chunks = len(chunks)
+    total_chunks = len(spans)
     logger.debug(f"Creating {total_chunks} chunked entities for {file.name}")
 
-    for idx, chunk in enumerate(chunks):
+    for idx, (text, token_count, start_index, end_index) in enumerate(spans):
         # Create a deep copy of the original file
         chunked_file = deepcopy(file)
 
         # Update the content with just this chunk
-        chunked_file.content = chunk.text
-        chunk_token_count = count_tokens(chunked_file.content)
+        chunked_file.content = text
 
         logger.debug(
-            f"Chunk {idx + 1}/{total_chunks} for {file.name}: {chunk_token_count} tokens, "
-            f"span: {chunk.start_index}-{chunk.end_index}"
+            f"Chunk {idx + 1}/{total_chunks} for {file.name}: {token_count} tokens, "
+            f"span: {start_index}-{end_index}"
         )
 
         # Add chunk metadata to entity metadata
@@ -134,8 +198,8 @@ async def code_file_chunker(file: CodeFileEntity, logger: ContextualLogger) -> L
                 "chunk_index": idx + 1,
                 "total_chunks": total_chunks,
                 "original_file_id": file.file_id,
-                "chunk_start_index": chunk.start_index,
-                "chunk_end_index": chunk.end_index,
+                "chunk_start_index": start_index,
+                "chunk_end_index": end_index,
             }
         )
 
@@ -146,3 +210,82 @@ async def code_file_chunker(file: CodeFileEntity, logger: ContextualLogger) -> L
 
     logger.debug(f"Completed chunking {file.name} into {len(chunked_files)} chunks")
     return chunked_files
+
+
+@transformer(name="Code File Chunker")
+async def code_file_chunker(file: CodeFileEntity, logger: ContextualLogger) -> List[CodeFileEntity]:
+    """Chunk a code file.
+
+    This transformer:
+    1. Takes a CodeFileEntity as input
+    2. Uses Chonkie to chunk the code file if content size is greater than chunk limit
+    3. Yields each chunk as a CodeFileEntity
+
+    Args:
+        file: The CodeFileEntity to process
+        logger: The logger to use
+
+    Returns:
+        List[CodeFileEntity]: The processed chunks
+    """
+    logger.debug(f"Starting code file chunker for file: {file.name} (file_id: {file.file_id})")
+
+    # If file.content is None, return empty list
+    if file.content is None:
+        logger.debug(f"File content is None for {file.name}, returning empty list")
+        return []
+
+    chunk_size_limit = MAX_CHUNK_SIZE - METADATA_SIZE  # Leave room for metadata
+    spans = await get_transform_executor().run(
+        _chunk_code_content, file.content, _file_extension(file), chunk_size_limit
+    )
+    return _build_chunked_files(file, spans, logger)
+
+
+async def code_file_chunker_batch(
+    files: List[CodeFileEntity], logger: ContextualLogger
+) -> List[Optional[List[CodeFileEntity]]]:
+    """Chunk many code files, split into one executor task per transform worker.
+
+    Args:
+        files: The CodeFileEntities to process
+        logger: The logger to use
+
+    Returns:
+        List[Optional[List[CodeFileEntity]]]: The processed chunks of each file, in input
+            order; None for files whose chunking failed
+    """
+    with_content = [file for file in files if file.content is not None]
+    chunk_size_limit = MAX_CHUNK_SIZE - METADATA_SIZE  # Leave room for metadata
+
+    results: List[ChunkResult] = []
+    task_count = 0
+    if with_content:
+        executor = get_transform_executor()
+        items = [(file.content, _file_extension(file)) for file in with_content]
+        sub_batch_size = math.ceil(len(items) / executor.pool_size)
+        sub_results = await asyncio.gather(
+            *[
+                executor.run(
+                    _chunk_code_contents, items[start : start + sub_batch_size], chunk_size_limit
+                )
+                for start in range(0, len(items), sub_batch_size)
+            ]
+        )
+        task_count = len(sub_results)
+        results = [result for sub_result in sub_results for result in sub_result]
+    results_iter = iter(results)
+
+    logger.debug(f"Chunked {len(with_content)} code files in {task_count} executor tasks")
+    chunked: List[Optional[List[CodeFileEntity]]] = []
+    for file in files:
+        if file.content is None:
+            chunked.append([])
+            continue
+        spans, error = next(results_iter)
+        if error is not None:
+            logger.warning(f"Chunking failed for {file.name}: {error}")
+            chunked.append(None)
+        else:
+            chunked.append(_build_chunked_files(file, spans, logger))
+    return chunked
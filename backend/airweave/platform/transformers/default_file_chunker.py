@@ -119,7 +119,10 @@ async def _process_file_content(
         return content
     else:
         logger.debug(f"🔄 CHUNKER_CONVERT [{entity_context}] Converting file to markdown")
-        result = await document_converter.convert(file.airweave_system_metadata.local_path)
+        result = await document_converter.convert(
+            file.airweave_system_metadata.local_path,
+            content_hash=file.airweave_system_metadata.checksum,
+        )
         if not result or not result.text_content:
             logger.warning(f"🚫 CHUNKER_CONVERT_EMPTY [{entity_context}] No content extracted")
             return ""
@@ -2,20 +2,15 @@
 
 from typing import Any, Dict, List, Optional
 
-from chonkie import RecursiveChunker, RecursiveLevel, RecursiveRules, TokenChunker
-
 from airweave.core.logging import ContextualLogger
 from airweave.platform.decorators import transformer
 from airweave.platform.entities._base import BaseEntity, ChunkEntity
-from airweave.platform.sync.async_helpers import run_in_thread_pool
+from airweave.platform.sync.transform_executor import get_transform_executor
+from airweave.platform.transformers.text_chunking import chunk_text_sync
 from airweave.platform.transformers.utils import (
     count_tokens,
 )
 
-# Cache for chunkers
-_token_chunker_cache = {}
-_recursive_chunker = None
-
 # Token limits for embeddable text
 # OpenAI's limit is 8191 tokens, but embeddable_text is already capped at 12000 chars
 # We use a conservative token limit to ensure we stay under API limits
@@ -23,55 +18,6 @@ SAFE_EMBEDDABLE_TOKEN_SIZE = 6000  # Conservative limit for embeddable text
 TARGET_CHUNK_TOKEN_SIZE = 3000  # Target size for each chunk when splitting
 
 
-def get_token_chunker(chunk_size: int) -> TokenChunker:
-    """Get or create a token chunker with the specified chunk size.
-
-    Args:
-        chunk_size: Target size for each chunk
-
-    Returns:
-        Configured TokenChunker
-    """
-    global _token_chunker_cache
-
-    if chunk_size not in _token_chunker_cache:
-        _token_chunker_cache[chunk_size] = TokenChunker(
-            tokenizer=count_tokens,  # Fixed: API changed from tokenizer_or_token_counter
-            chunk_size=chunk_size,
-            chunk_overlap=100,  # Small overlap for context
-        )
-
-    return _token_chunker_cache[chunk_size]
-
-
-def get_recursive_chunker(chunk_size: int) -> RecursiveChunker:
-    """Get or create a recursive chunker optimized for text fields.
-
-    Args:
-        chunk_size: Target size for each chunk
-
-    Returns:
-        Configured RecursiveChunker
-    """
-    # Simpler rules optimized for general text content
-    rules = RecursiveRules(
-        [
-            RecursiveLevel(delimiters=["\n\n\n"], include_delim="next"),
-            RecursiveLevel(delimiters=["\n\n"], include_delim="next"),
-            RecursiveLevel(delimiters=["\n"], include_delim="next"),
-            RecursiveLevel(delimiters=[". ", "! ", "? "], include_delim="prev"),
-            RecursiveLevel(delimiters=[", "], include_delim="prev"),
-        ]
-    )
-
-    return RecursiveChunker(
-        tokenizer_or_token_counter=count_tokens,
-        chunk_size=chunk_size,
-        rules=rules,
-        min_characters_per_chunk=50,
-    )
-
-
 def calculate_embeddable_text_size(entity: ChunkEntity) -> int:
     """Calculate the token size of the embeddable text.
 
@@ -174,33 +120,25 @@ def _clean_text_for_chunking(text: str, logger: ContextualLogger) -> str:
     return cleaned_text
 
 
-def _create_truncated_chunk(chunk, target_chunk_size: int):
-    """Create a truncated chunk when original is too large."""
-    max_chars = int(len(chunk.text) * target_chunk_size / count_tokens(chunk.text))
-    truncated_text = chunk.text[:max_chars]
+def _truncate_chunk(chunk: str, chunk_size: int, target_chunk_size: int) -> str:
+    """Truncate a chunk that is too large, proportionally to its token count."""
+    max_chars = int(len(chunk) * target_chunk_size / chunk_size)
+    return chunk[:max_chars]
 
-    # Create a simple chunk-like object with truncated text
-    class SimpleChunk:
-        def __init__(self, text):
-            self.text = text
-            self.start_index = 0
-            self.end_index = len(text)
 
-    return SimpleChunk(truncated_text)
-
-
-def _validate_chunks(chunk_result, target_chunk_size: int, logger: ContextualLogger) -> List[Any]:
+def _validate_chunks(
+    chunk_result: List[str], target_chunk_size: int, logger: ContextualLogger
+) -> List[str]:
     """Post-process chunks to ensure none are too large."""
     validated_chunks = []
     for chunk in chunk_result:
-        chunk_size = count_tokens(chunk.text)
+        chunk_size = count_tokens(chunk)
         if chunk_size > target_chunk_size * 1.2:  # Allow 20% margin
             logger.warning(
                 f"Chunk exceeded target size ({chunk_size} > {target_chunk_size * 1.2}). "
                 f"Will truncate to fit."
             )
-            truncated_chunk = _create_truncated_chunk(chunk, target_chunk_size)
-            validated_chunks.append(truncated_chunk)
+            validated_chunks.append(_truncate_chunk(chunk, chunk_size, target_chunk_size))
         else:
             validated_chunks.append(chunk)
     return validated_chunks
@@ -208,7 +146,7 @@ def _validate_chunks(chunk_result, target_chunk_size: int, logger: ContextualLog
 
 async def chunk_text_optimized(
     text: str, target_chunk_size: int, field_name: str, entity_id: str, logger: ContextualLogger
-) -> List[Any]:
+) -> List[str]:
     """Chunk text using optimized token-based approach without embeddings.
 
     Args:
@@ -230,33 +168,19 @@ async def chunk_text_optimized(
         f"(size: {text_size} tokens after cleaning, target chunk size: {target_chunk_size})"
     )
 
-    # First try recursive chunking which respects text structure
-    recursive_chunker = get_recursive_chunker(target_chunk_size)
-
-    def _chunk_recursive(text: str):
-        try:
-            chunks = recursive_chunker.chunk(text)
-            return chunks
-        except Exception as e:
-            logger.warning(
-                f"Recursive chunking failed for field '{field_name}' in entity {entity_id}: "
-                f"{str(e)}. Falling back to token chunking."
-            )
-            return None
-
-    chunk_result = await run_in_thread_pool(_chunk_recursive, cleaned_text)
-
-    if chunk_result is None:
-        # Fallback to simple token chunking
+    # Recursive chunking respects text structure; token chunking is the fallback
+    chunk_result, recursive_error = await get_transform_executor().run(
+        chunk_text_sync, cleaned_text, target_chunk_size, "field"
+    )
+    chunk_result = [chunk_text for chunk_text, _ in chunk_result]
+    if recursive_error:
+        logger.warning(
+            f"Recursive chunking failed for field '{field_name}' in entity {entity_id}: "
+            f"{recursive_error}. Falling back to token chunking."
+        )
         logger.debug(
             f"Using token chunker as fallback for field '{field_name}' in entity {entity_id}"
         )
-        token_chunker = get_token_chunker(target_chunk_size)
-
-        def _chunk_tokens(text: str):
-            return token_chunker.chunk(text)
-
-        chunk_result = await run_in_thread_pool(_chunk_tokens, cleaned_text)
 
     # Post-process chunks to ensure none are too large
     validated_chunks = _validate_chunks(chunk_result, target_chunk_size, logger)
@@ -334,7 +258,7 @@ async def entity_chunker(entity: BaseEntity, logger: ContextualLogger) -> List[B
         # Create a copy with the chunked field
         new_dict = {
             **entity_dict,
-            field_name: chunk.text,
+            field_name: chunk,
             "chunk_index": i,
             "entity_id": f"{entity.entity_id}_chunk_{i}",
         }
@@ -4,19 +4,14 @@ import asyncio
 import os
 from typing import List
 
-from chonkie import RecursiveChunker, TokenChunker
-
 from airweave.core.logging import ContextualLogger
 from airweave.platform.decorators import transformer
 from airweave.platform.entities._base import ChunkEntity, FileEntity
 from airweave.platform.file_handling.conversion.factory import document_converter
-from airweave.platform.sync.async_helpers import run_in_thread_pool
+from airweave.platform.sync.transform_executor import get_transform_executor
+from airweave.platform.transformers.text_chunking import chunk_text_sync
 from airweave.platform.transformers.utils import count_tokens
 
-# Create optimized chunkers at module level
-_token_chunker = None
-_recursive_chunker = None
-
 # OpenAI's actual limit
 OPENAI_TOKEN_LIMIT = 8191
 # Initial chunk size - we'll start large and re-chunk if needed
@@ -25,40 +20,6 @@ INITIAL_CHUNK_SIZE = 7500
 MIN_CHUNK_SIZE = 500
 
 
-def get_token_chunker(chunk_size: int):
-    """Get or create a token chunker with specified size."""
-    global _token_chunker
-    if _token_chunker is None or _token_chunker.chunk_size != chunk_size:
-        _token_chunker = TokenChunker(
-            tokenizer_or_token_counter=count_tokens,
-            chunk_size=chunk_size,
-            chunk_overlap=100,  # Small overlap for context
-        )
-    return _token_chunker
-
-
-def get_recursive_chunker(chunk_size: int):
-    """Get or create a recursive chunker with specified size."""
-    from chonkie import RecursiveLevel, RecursiveRules
-
-    # Simpler rules for faster processing
-    rules = RecursiveRules(
-        [
-            RecursiveLevel(delimiters=["\n\n\n"], include_delim="next"),
-            RecursiveLevel(delimiters=["\n\n"], include_delim="next"),
-            RecursiveLevel(delimiters=["\n"], include_delim="next"),
-            RecursiveLevel(delimiters=[". ", "! ", "? "], include_delim="prev"),
-        ]
-    )
-
-    return RecursiveChunker(
-        tokenizer_or_token_counter=count_tokens,
-        chunk_size=chunk_size,
-        rules=rules,
-        min_characters_per_chunk=100,
-    )
-
-
 def calculate_entity_token_size(entity: ChunkEntity) -> int:
     """Calculate the actual token size when entity is serialized for embedding.
 
@@ -96,7 +57,10 @@ async def _process_file_content(
         return content
     else:
         logger.debug(f"🔄 CHUNKER_CONVERT [{entity_context}] Converting file to markdown")
-        result = await document_converter.convert(file.airweave_system_metadata.local_path)
+        result = await document_converter.convert(
+            file.airweave_system_metadata.local_path,
+            content_hash=file.airweave_system_metadata.checksum,
+        )
         if not result or not result.text_content:
             logger.warning(f"🚫 CHUNKER_CONVERT_EMPTY [{entity_context}] No content extracted")
             return ""
@@ -122,31 +86,15 @@ async def _chunk_text_adaptive(
     # Clean problematic content first
     text_content = _clean_problematic_content(text_content, entity_context, logger)
 
-    # Try recursive chunking first
-    recursive_chunker = get_recursive_chunker(chunk_size)
-
-    def _chunk_recursive(text: str):
-        try:
-            chunks = recursive_chunker.chunk(text)
-            return [(chunk.text, chunk.token_count) for chunk in chunks]
-        except Exception as e:
-            logger.warning(
-                f"⚠️  CHUNKER_RECURSIVE_FAIL [{entity_context}] Recursive chunking failed: {str(e)}"
-            )
-            return None
-
-    chunk_result = await run_in_thread_pool(_chunk_recursive, text_content)
-
-    if chunk_result is None:
-        # Fallback to simple token chunking
-        logger.debug(f"🔄 CHUNKER_FALLBACK [{entity_context}] Using token chunker as fallback")
-        token_chunker = get_token_chunker(chunk_size)
-
-        def _chunk_tokens(text: str):
-            chunks = token_chunker.chunk(text)
-            return [(chunk.text, chunk.token_count) for chunk in chunks]
-
-        chunk_result = await run_in_thread_pool(_chunk_tokens, text_content)
+    chunk_result, recursive_error = await get_transform_executor().run(
+        chunk_text_sync, text_content, chunk_size, "file"
+    )
+    if recursive_error:
+        logger.warning(
+            f"⚠️  CHUNKER_RECURSIVE_FAIL [{entity_context}] Recursive chunking failed: "
+            f"{recursive_error}"
+        )
+        logger.debug(f"🔄 CHUNKER_FALLBACK [{entity_context}] Used token chunker as fallback")
 
     # Extract just the text
     final_chunks = [text for text, _ in chunk_result]
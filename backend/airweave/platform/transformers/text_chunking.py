@@ -0,0 +1,104 @@
+"""Text chunking shared by the transformers that split text on the transform executor."""
+
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from chonkie import RecursiveChunker, RecursiveLevel, RecursiveRules, TokenChunker
+
+from airweave.platform.transformers.utils import count_tokens
+
+# Chunker instances are not thread-safe, so every executor thread builds its own
+_local = threading.local()
+
+TOKEN_CHUNK_OVERLAP = 100  # Small overlap for context
+
+# Recursive splitting rules per kind of text, as (delimiters, include_delim) levels
+# plus the minimum number of characters per chunk
+_RECURSIVE_PROFILES: Dict[str, Tuple[List[Tuple[List[str], str]], int]] = {
+    # File contents converted to markdown
+    "file": (
+        [
+            (["\n\n\n"], "next"),
+            (["\n\n"], "next"),
+            (["\n"], "next"),
+            ([". ", "! ", "? "], "prev"),
+        ],
+        100,
+    ),
+    # Embeddable text of entity fields
+    "field": (
+        [
+            (["\n\n\n"], "next"),
+            (["\n\n"], "next"),
+            (["\n"], "next"),
+            ([". ", "! ", "? "], "prev"),
+            ([", "], "prev"),
+        ],
+        50,
+    ),
+}
+
+
+def _thread_cache(name: str) -> dict:
+    cache = getattr(_local, name, None)
+    if cache is None:
+        cache = {}
+        setattr(_local, name, cache)
+    return cache
+
+
+def get_token_chunker(chunk_size: int) -> TokenChunker:
+    """Get this thread's token chunker for a chunk size."""
+    cache = _thread_cache("token_chunkers")
+    if chunk_size not in cache:
+        cache[chunk_size] = TokenChunker(
+            tokenizer=count_tokens,
+            chunk_size=chunk_size,
+            chunk_overlap=TOKEN_CHUNK_OVERLAP,
+        )
+    return cache[chunk_size]
+
+
+def get_recursive_chunker(chunk_size: int, profile: str) -> RecursiveChunker:
+    """Get this thread's recursive chunker for a chunk size and splitting profile."""
+    cache = _thread_cache("recursive_chunkers")
+    key = (profile, chunk_size)
+    if key not in cache:
+        levels, min_characters_per_chunk = _RECURSIVE_PROFILES[profile]
+        rules = RecursiveRules(
+            [
+                RecursiveLevel(delimiters=delimiters, include_delim=include_delim)
+                for delimiters, include_delim in levels
+            ]
+        )
+        cache[key] = RecursiveChunker(
+            tokenizer_or_token_counter=count_tokens,
+            chunk_size=chunk_size,
+            rules=rules,
+            min_characters_per_chunk=min_characters_per_chunk,
+        )
+    return cache[key]
+
+
+def chunk_text_sync(
+    text: str, chunk_size: int, profile: str
+) -> Tuple[List[Tuple[str, int]], Optional[str]]:
+    """Chunk text recursively, falling back to token chunking.
+
+    Runs on the transform executor (a worker thread or process), so it only takes and
+    returns plain data.
+
+    Args:
+        text: Text to chunk
+        chunk_size: Target size of each chunk in tokens
+        profile: Recursive splitting profile, "file" or "field"
+
+    Returns:
+        (list of (chunk text, token count), recursive chunking error message or None)
+    """
+    try:
+        chunks = get_recursive_chunker(chunk_size, profile).chunk(text)
+        return [(chunk.text, chunk.token_count) for chunk in chunks], None
+    except Exception as e:
+        chunks = get_token_chunker(chunk_size).chunk(text)
+        return [(chunk.text, chunk.token_count) for chunk in chunks], str(e)
@@ -1,7 +1,12 @@
 """Utils for transformers."""
 
+import threading
+from typing import List, Optional
+
 import tiktoken
 
+from airweave.platform.sync.async_helpers import run_in_thread_pool
+
 # Max chunk size for embedding models (e.g. OpenAI's text-embedding-ada-002)
 # While OpenAI allows up to 8191 tokens per text, we use a safer limit
 # to avoid batch processing errors and account for overhead
@@ -9,8 +14,46 @@ MAX_CHUNK_SIZE = 7500  # Reduced from 8191 for safer batch processing
 MARGIN_OF_ERROR = 250
 METADATA_SIZE = 1200
 
+# Tokenizer used by OpenAI's text-embedding models
+TOKEN_ENCODING_NAME = "cl100k_base"
+
+# Shared encoder, loaded once per process
+_token_encoder: Optional[tiktoken.Encoding] = None
+_token_encoder_lock = threading.Lock()
+
+
+def get_token_encoder() -> tiktoken.Encoding:
+    """Get the shared cl100k_base encoder."""
+    global _token_encoder
+
+    if _token_encoder is None:
+        with _token_encoder_lock:
+            if _token_encoder is None:
+                _token_encoder = tiktoken.get_encoding(TOKEN_ENCODING_NAME)
+    return _token_encoder
+
 
 def count_tokens(text: str) -> int:
-    """Count tokens using the cl100k_base tokenizer (used by OpenAI's text-embedding models)."""
-    encoding = tiktoken.get_encoding("cl100k_base")
-    return len(encoding.encode(text))
+    """Count tokens using the cl100k_base tokenizer (used by OpenAI's text-embedding models).
+
+    Special-token strings are counted as ordinary text, so arbitrary content never raises.
+    """
+    return len(get_token_encoder().encode_ordinary(text))
+
+
+def count_tokens_batch(texts: List[str]) -> List[int]:
+    """Count tokens for many texts; tiktoken encodes the batch across its native threads."""
+    if not texts:
+        return []
+    return [len(tokens) for tokens in get_token_encoder().encode_ordinary_batch(texts)]
+
+
+async def count_tokens_batch_async(texts: List[str]) -> List[int]:
+    """Count tokens for many texts in the shared thread pool, off the event loop.
+
+    Returns:
+        One token count per input text, in input order
+    """
+    if not texts:
+        return []
+    return await run_in_thread_pool(count_tokens_batch, texts)
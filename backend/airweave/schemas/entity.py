@@ -15,6 +15,7 @@ class EntityBase(BaseModel):
     entity_id: str
     entity_definition_id: Optional[UUID] = None
     hash: str
+    version_fingerprint: Optional[str] = None
 
     class Config:
         """Pydantic config for EntityBase."""
@@ -36,6 +37,7 @@ class EntityUpdate(BaseModel):
     entity_id: Optional[str] = None
     entity_definition_id: Optional[UUID] = None
     hash: Optional[str] = None
+    version_fingerprint: Optional[str] = None
 
 
 class EntityInDBBase(EntityBase):
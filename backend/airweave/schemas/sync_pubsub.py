@@ -5,7 +5,7 @@ for real-time sync progress and entity state updates.
 """
 
 from datetime import datetime
-from typing import Dict, Literal, Optional
+from typing import Any, Dict, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -27,6 +27,14 @@ class SyncProgressUpdate(BaseModel):
     entities_encountered: Dict[str, int] = Field(
         default_factory=dict, description="Count of entities by type name"
     )
+    # Current batch size, worker count and stage latencies of the adaptive sync tuning
+    tuning: Optional[Dict[str, Any]] = Field(
+        default=None, description="Runtime tuning state of the sync (batch size, workers)"
+    )
+    # Transform executor usage (backend, tasks, failures, fallbacks, busy seconds)
+    transform: Optional[Dict[str, Any]] = Field(
+        default=None, description="Transform executor usage of the sync"
+    )
     # Status field to track the final state - None means still in progress
     status: Optional[SyncJobStatus] = None
 
@@ -4,11 +4,10 @@ The executor is responsible for running the operations in the correct
 order based on their dependencies, handling errors, and managing timeouts.
 """
 
-# import asyncio  # Will be used for parallel execution
 import asyncio
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,6 +17,7 @@ from airweave.core.config import settings
 from airweave.core.pubsub import core_pubsub
 from airweave.schemas.search import SearchConfig
 from airweave.search.operations.base import SearchOperation
+from airweave.search.utils import merge_filter_dicts
 
 
 class SearchExecutor:
@@ -26,7 +26,7 @@ class SearchExecutor:
     The executor takes a list of operations and executes them in the
     correct order based on their dependencies. It handles:
     - Dependency resolution and execution ordering
-    - Parallel execution where possible
+    - Concurrent execution of every operation whose dependencies are met
     - Error handling for optional operations
     - Timeout management
     - Context passing between operations
@@ -141,82 +141,12 @@ class SearchExecutor:
         )
 
         # Track execution state
-        executed = set()
+        executed: Set[str] = set()
         start_time = time.time()
 
         try:
-            # Execute operations in dependency order
-            while len(executed) < len(operations):
-                # Find operations ready to execute
-                ready = self._find_ready_operations(operations, executed)
-
-                if not ready:
-                    # No more operations can execute
-                    if len(executed) < len(operations):
-                        remaining = [op.name for op in operations if op.name not in executed]
-                        ctx.logger.warning(
-                            "[SearchExecutor] Cannot execute remaining operations: %s",
-                            remaining,
-                        )
-                    break
-
-                # Execute ready operations (could be parallelized in future)
-                for op in ready:
-                    try:
-                        # Emit operator_start
-                        await emit("operator_start", {"name": op.name}, op_name=op.name)
-                        # Execute with timing
-                        op_start = time.time()
-                        await op.execute(context)
-                        op_time = (time.time() - op_start) * 1000
-
-                        context["timings"][op.name] = op_time
-                        executed.add(op.name)
-
-                        ctx.logger.debug(
-                            f"[SearchExecutor] Operation {op.name} completed in {op_time:.2f}ms"
-                        )
-
-                        # Emit operator_end
-                        await emit(
-                            "operator_end", {"name": op.name, "ms": op_time}, op_name=op.name
-                        )
-
-                        # Log intermediate state snapshot for key artifacts
-                        try:
-                            snapshot = {
-                                "expanded_queries": len(context.get("expanded_queries", []))
-                                if isinstance(context.get("expanded_queries"), list)
-                                else (1 if context.get("expanded_queries") else 0),
-                                "embeddings": len(context.get("embeddings", []))
-                                if isinstance(context.get("embeddings"), list)
-                                else 0,
-                                "has_filter": bool(context.get("filter")),
-                                "raw_results": len(context.get("raw_results", []))
-                                if isinstance(context.get("raw_results"), list)
-                                else 0,
-                                "final_results": len(context.get("final_results", []))
-                                if isinstance(context.get("final_results"), list)
-                                else 0,
-                                "has_completion": bool(context.get("completion")),
-                            }
-                            ctx.logger.debug(f"[SearchExecutor] State after {op.name}: {snapshot}")
-                        except Exception:
-                            pass
-
-                    except Exception as e:
-                        # Log the error and always fail the search
-                        ctx.logger.error(
-                            f"[SearchExecutor] Operation {op.name} failed: {e}", exc_info=True
-                        )
-                        context["errors"].append({"operation": op.name, "error": str(e)})
-
-                        # Emit error event if streaming emitter is present
-                        await emit(
-                            "error", {"operation": op.name, "message": str(e)}, op_name=op.name
-                        )
-                        # Propagate failure (both streaming and non-streaming)
-                        raise
+            # Execute operations as soon as their dependencies are satisfied
+            await self._run_operations(operations, context, executed, emit, ctx, start_time)
 
             # Ensure we have final results
             self._finalize_context(context)
@@ -269,6 +199,201 @@ class SearchExecutor:
 
         return context
 
+    async def _run_operations(
+        self,
+        operations: List[SearchOperation],
+        context: Dict[str, Any],
+        executed: Set[str],
+        emit: Callable[..., Awaitable[None]],
+        ctx: ApiContext,
+        search_start: float,
+    ) -> None:
+        """Run the operation DAG, starting each operation as soon as it is ready.
+
+        Every running operation works on its own shallow copy of the context. When it
+        finishes, its writes are merged back into the shared context, so concurrent
+        operations never observe each other's partial state. If a required operation
+        fails, all in-flight siblings are cancelled and the error is propagated.
+
+        Args:
+            operations: All operations in plan order
+            context: Shared context, updated in place
+            executed: Set of finished operation names, updated in place
+            emit: Streaming emitter
+            ctx: API context with logger
+            search_start: Start time of the search (for timing offsets)
+        """
+        in_flight: Dict[asyncio.Task, Tuple[SearchOperation, Dict[str, Any], Dict[str, Any]]] = {}
+
+        try:
+            while True:
+                running = {op.name for op, _, _ in in_flight.values()}
+                for op in self._find_ready_operations(operations, executed, running):
+                    snapshot = dict(context)
+                    op_context = dict(context)
+                    task = asyncio.create_task(
+                        self._run_operation(op, op_context, emit, ctx, search_start),
+                        name=f"search-op-{op.name}",
+                    )
+                    in_flight[task] = (op, op_context, snapshot)
+
+                if not in_flight:
+                    if len(executed) < len(operations):
+                        remaining = [op.name for op in operations if op.name not in executed]
+                        ctx.logger.warning(
+                            "[SearchExecutor] Cannot execute remaining operations: %s",
+                            remaining,
+                        )
+                    return
+
+                done, _ = await asyncio.wait(in_flight.keys(), return_when=asyncio.FIRST_COMPLETED)
+
+                # Merge in plan order so concurrent writes resolve deterministically
+                finished = sorted(done, key=lambda t: operations.index(in_flight[t][0]))
+                for task in finished:
+                    op, op_context, snapshot = in_flight.pop(task)
+                    # Re-raises the failure of a required operation
+                    task.result()
+                    self._merge_operation_context(op, op_context, snapshot, context, ctx)
+                    executed.add(op.name)
+                    self._log_state_snapshot(op.name, context, ctx)
+        finally:
+            await self._cancel_operations(list(in_flight.keys()))
+
+    async def _run_operation(
+        self,
+        op: SearchOperation,
+        op_context: Dict[str, Any],
+        emit: Callable[..., Awaitable[None]],
+        ctx: ApiContext,
+        search_start: float,
+    ) -> None:
+        """Run a single operation with timeout, timing and lifecycle events.
+
+        Failures of optional operations are recorded and swallowed (unless streaming
+        requires every operator to succeed); failures of required operations are raised.
+        """
+        op_start = time.time()
+        await emit(
+            "operator_start",
+            {"name": op.name, "offset_ms": (op_start - search_start) * 1000},
+            op_name=op.name,
+        )
+
+        try:
+            if op.timeout:
+                try:
+                    await asyncio.wait_for(op.execute(op_context), timeout=op.timeout)
+                except asyncio.TimeoutError:
+                    raise TimeoutError(
+                        f"Operation {op.name} timed out after {op.timeout:.0f}s"
+                    ) from None
+            else:
+                await op.execute(op_context)
+        except Exception as e:
+            ctx.logger.error(f"[SearchExecutor] Operation {op.name} failed: {e}", exc_info=True)
+            op_context["errors"].append({"operation": op.name, "error": str(e)})
+
+            # Emit error event if streaming emitter is present
+            await emit("error", {"operation": op.name, "message": str(e)}, op_name=op.name)
+
+            if op.optional and not op_context.get("streaming_required"):
+                ctx.logger.warning(
+                    f"[SearchExecutor] Optional operation {op.name} failed; continuing"
+                )
+                return
+            # Propagate failure (both streaming and non-streaming)
+            raise
+
+        op_end = time.time()
+        op_time = (op_end - op_start) * 1000
+        op_context["timings"][op.name] = op_time
+
+        ctx.logger.debug(f"[SearchExecutor] Operation {op.name} completed in {op_time:.2f}ms")
+
+        await emit(
+            "operator_end",
+            {
+                "name": op.name,
+                "ms": op_time,
+                "offset_ms": (op_end - search_start) * 1000,
+            },
+            op_name=op.name,
+        )
+
+    async def _cancel_operations(self, tasks: List[asyncio.Task]) -> None:
+        """Cancel in-flight operations and wait for them to unwind."""
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        if tasks:
+            # Also retrieves exceptions of finished siblings so none go unobserved
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _merge_operation_context(
+        self,
+        op: SearchOperation,
+        op_context: Dict[str, Any],
+        snapshot: Dict[str, Any],
+        context: Dict[str, Any],
+        ctx: ApiContext,
+    ) -> None:
+        """Merge the writes of a finished operation back into the shared context.
+
+        A key counts as written when the operation bound a new object to it. If another
+        operation already changed the same key since this one started, the two values are
+        combined via ``_merge_context_value``.
+        """
+        for key, value in op_context.items():
+            if key in snapshot and snapshot[key] is value:
+                continue
+
+            changed_meanwhile = context.get(key) is not snapshot.get(key)
+            if changed_meanwhile and context.get(key) is not None:
+                ctx.logger.debug(
+                    f"[SearchExecutor] Merging concurrent writes to '{key}' from {op.name}"
+                )
+                context[key] = self._merge_context_value(key, context[key], value)
+            else:
+                context[key] = value
+
+        for key in snapshot.keys() - op_context.keys():
+            context.pop(key, None)
+
+    def _merge_context_value(self, key: str, current: Any, incoming: Any) -> Any:
+        """Combine two concurrent writes to the same context key.
+
+        Filters are AND-combined so an LLM-derived filter and a user filter both apply,
+        exactly as when the operations ran one after another. Any other key keeps the
+        latest write.
+        """
+        if key == "filter":
+            return merge_filter_dicts(current, incoming)
+        return incoming
+
+    def _log_state_snapshot(self, op_name: str, context: Dict[str, Any], ctx: ApiContext) -> None:
+        """Log an intermediate state snapshot for key artifacts."""
+        try:
+            snapshot = {
+                "expanded_queries": len(context.get("expanded_queries", []))
+                if isinstance(context.get("expanded_queries"), list)
+                else (1 if context.get("expanded_queries") else 0),
+                "embeddings": len(context.get("embeddings", []))
+                if isinstance(context.get("embeddings"), list)
+                else 0,
+                "has_filter": bool(context.get("filter")),
+                "raw_results": len(context.get("raw_results", []))
+                if isinstance(context.get("raw_results"), list)
+                else 0,
+                "final_results": len(context.get("final_results", []))
+                if isinstance(context.get("final_results"), list)
+                else 0,
+                "has_completion": bool(context.get("completion")),
+            }
+            ctx.logger.debug(f"[SearchExecutor] State after {op_name}: {snapshot}")
+        except Exception:
+            pass
+
     def _initialize_context(
         self, config: SearchConfig, db: AsyncSession, ctx: ApiContext
     ) -> Dict[str, Any]:
@@ -309,25 +434,30 @@ class SearchExecutor:
         }
 
     def _find_ready_operations(
-        self, operations: List[SearchOperation], executed: Set[str]
+        self,
+        operations: List[SearchOperation],
+        executed: Set[str],
+        running: Optional[Set[str]] = None,
     ) -> List[SearchOperation]:
         """Find operations that are ready to execute.
 
         An operation is ready if:
-        - It hasn't been executed yet
+        - It hasn't been executed yet and is not currently running
         - All its dependencies have been executed
 
         Args:
             operations: All operations
             executed: Set of already executed operation names
+            running: Set of operation names currently in flight
 
         Returns:
             List of operations ready to execute
         """
         ready = []
+        running = running or set()
 
         for op in operations:
-            if op.name in executed:
+            if op.name in executed or op.name in running:
                 continue
 
             # Check if all dependencies are satisfied
@@ -6,7 +6,9 @@ consistency while avoiding over-engineering.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+from airweave.core.config import settings
 
 
 class SearchOperation(ABC):
@@ -97,6 +99,19 @@ class SearchOperation(ABC):
         """
         return False
 
+    @property
+    def timeout(self) -> Optional[float]:
+        """Maximum number of seconds the executor waits for this operation.
+
+        Operations run concurrently with their siblings; a timeout is treated
+        like any other failure. Return None to disable the limit. Defaults to
+        SEARCH_OPERATION_TIMEOUT_SECONDS; operations override it as needed.
+
+        Returns:
+            Optional[float]: Timeout in seconds
+        """
+        return settings.SEARCH_OPERATION_TIMEOUT_SECONDS or None
+
     def __repr__(self) -> str:
         """String representation for debugging."""
         return f"{self.__class__.__name__}(name='{self.name}', optional={self.optional})"
@@ -99,7 +99,12 @@ class CompletionGeneration(SearchOperation):
     def depends_on(self) -> List[str]:
         """Depends on search results (either raw or reranked)."""
         # We check at runtime which results are available
-        return ["vector_search", "reranking"]
+        return ["vector_search", "llm_reranking"]
+
+    @property
+    def timeout(self) -> Optional[float]:
+        """Completions (and streamed answers) get their own, longer limit."""
+        return settings.SEARCH_COMPLETION_TIMEOUT_SECONDS or None
 
     async def execute(self, context: Dict[str, Any]) -> None:  # noqa: C901 - controlled complexity
         """Generate AI completion from results.
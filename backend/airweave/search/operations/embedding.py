@@ -42,9 +42,12 @@ class Embedding(SearchOperation):
 
     @property
     def depends_on(self) -> List[str]:
-        """This depends on query expansion if it exists."""
-        # We check at runtime if query_expansion actually ran
-        return ["query_expansion"]
+        """This depends on query expansion and interpretation if they exist.
+
+        Interpretation may rewrite the query, which is what gets embedded
+        when no expansion ran.
+        """
+        return ["query_expansion", "query_interpretation"]
 
     async def execute(self, context: Dict[str, Any]) -> None:  # noqa: C901
         """Generate embeddings for queries.
@@ -805,7 +805,11 @@ class QueryInterpretation(SearchOperation):
 
             from pydantic import BaseModel as PydanticBaseModel
 
+            from airweave.platform.entities._base import ensure_module_file_entity_models
+
             module = importlib.import_module(f"airweave.platform.entities.{source.short_name}")
+            # Parent and chunk models of file entities are generated on first use, not import
+            ensure_module_file_entity_models(module)
             for _, obj in inspect.getmembers(module, inspect.isclass):
                 if issubclass(obj, PydanticBaseModel) and hasattr(obj, "model_fields"):
                     for field_name, field_info in obj.model_fields.items():
@@ -7,7 +7,8 @@ collection, not only the returned page, and respects user/LLM filters.
 
 Approach:
 - Determine the datetime field to use (prefer system harmonized timestamps)
-- Fetch oldest and newest timestamps via two lightweight scrolls with order_by
+- Fetch oldest and newest timestamps via two concurrent lightweight scrolls with
+  order_by, cached per collection/field/filter until the next completed sync
 - Compute scale_seconds as a fraction of the observed time span
 - Create DecayConfig with weight = recency_bias and put it in context
 - VectorSearch will pick it up and Qdrant will apply formula scoring
@@ -15,12 +16,14 @@ Approach:
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from qdrant_client.http import models as rest
 
 from airweave.search.operations.base import SearchOperation
+from airweave.search.recency_cache import recency_bounds_cache
 
 
 class RecencyBias(SearchOperation):
@@ -46,7 +49,7 @@ class RecencyBias(SearchOperation):
     @property
     def depends_on(self) -> List[str]:
         """Run after filter extraction and before vector search."""
-        return ["qdrant_filter"]
+        return ["qdrant_filter", "query_interpretation"]
 
     def _get_filter(self, context: Dict[str, Any]) -> Optional[rest.Filter]:
         """Build Qdrant filter from context if present."""
@@ -65,30 +68,24 @@ class RecencyBias(SearchOperation):
         qdrant_filter: Optional[rest.Filter],
         logger,
     ) -> tuple[Optional[datetime], Optional[datetime]]:
-        """Fetch oldest/newest timestamps using ordered scrolls."""
+        """Fetch oldest/newest timestamps using two concurrent ordered scrolls."""
         logger.debug(
             f"[RecencyBias._get_min_max] Fetching min/max for field={field}, "
             f"collection={collection_id}"
         )
 
-        # Oldest
-        oldest_points = await destination.client.scroll(  # type: ignore
-            collection_name=str(collection_id),
-            limit=1,
-            with_payload=[field],
-            order_by=rest.OrderBy(key=field, direction="asc"),
-            scroll_filter=qdrant_filter,
-        )
-        logger.debug(f"[RecencyBias._get_min_max] Oldest scroll result: {oldest_points}")
+        def scroll(direction: str):
+            return destination.client.scroll(  # type: ignore
+                collection_name=str(collection_id),
+                limit=1,
+                with_payload=[field],
+                order_by=rest.OrderBy(key=field, direction=direction),
+                scroll_filter=qdrant_filter,
+            )
 
-        # Newest
-        newest_points = await destination.client.scroll(  # type: ignore
-            collection_name=str(collection_id),
-            limit=1,
-            with_payload=[field],
-            order_by=rest.OrderBy(key=field, direction="desc"),
-            scroll_filter=qdrant_filter,
-        )
+        # Oldest and newest in parallel
+        oldest_points, newest_points = await asyncio.gather(scroll("asc"), scroll("desc"))
+        logger.debug(f"[RecencyBias._get_min_max] Oldest scroll result: {oldest_points}")
         logger.debug(f"[RecencyBias._get_min_max] Newest scroll result: {newest_points}")
 
         def extract_dt(point) -> Optional[datetime]:
@@ -122,6 +119,47 @@ class RecencyBias(SearchOperation):
         newest = extract_dt(newest_points[0][0] if newest_points and newest_points[0] else None)
         return oldest, newest
 
+    async def _get_cached_min_max(
+        self,
+        config: Any,
+        field: str,
+        qdrant_filter: Optional[rest.Filter],
+        context: Dict[str, Any],
+        logger,
+    ) -> Optional[tuple[Optional[datetime], Optional[datetime]]]:
+        """Return (oldest, newest) from the cache, or fetch and cache them.
+
+        Returns None if the Qdrant destination cannot be created.
+        """
+        from uuid import UUID
+
+        from airweave.platform.destinations.qdrant import QdrantDestination
+
+        collection_id = str(config.collection_id)
+        filter_hash = recency_bounds_cache.filter_hash(context.get("filter"))
+        generation = await recency_bounds_cache.get_generation(collection_id)
+
+        cached = recency_bounds_cache.get(collection_id, field, filter_hash, generation)
+        if cached is not None:
+            logger.debug(f"[RecencyBias] Using cached min/max for collection={collection_id}")
+            return cached
+
+        try:
+            destination = await QdrantDestination.create(
+                collection_id=UUID(collection_id),
+                vector_size=config.vector_size,
+                logger=logger,
+            )
+        except Exception as e:
+            logger.debug(f"[RecencyBias] Skipping recency due to destination error: {e}")
+            return None
+
+        oldest, newest = await self._get_min_max(
+            destination, collection_id, field, qdrant_filter, logger
+        )
+        recency_bounds_cache.set(collection_id, field, filter_hash, generation, oldest, newest)
+        return oldest, newest
+
     def _build_decay_config(
         self,
         chosen_field: str,
@@ -183,30 +221,6 @@ class RecencyBias(SearchOperation):
         # produced via AirweaveField annotations (created/updated_at).
         field = self.datetime_field or "airweave_system_metadata.airweave_updated_at"
 
-        # Prepare Qdrant client
-        from uuid import UUID
-
-        from airweave.platform.destinations.qdrant import QdrantDestination
-
-        # Recency is non-critical; if destination cannot be created, skip gracefully
-        try:
-            destination = await QdrantDestination.create(
-                collection_id=UUID(config.collection_id),
-                vector_size=config.vector_size,
-                logger=logger,
-            )
-        except Exception as e:
-            logger.debug(f"[RecencyBias] Skipping recency due to destination error: {e}")
-            context["decay_config"] = None
-            if callable(emitter):
-                try:
-                    await emitter(
-                        "recency_skipped", {"reason": "destination_error"}, op_name=self.name
-                    )
-                except Exception:
-                    pass
-            return
-
         # Query oldest/newest using the chosen field
         chosen_field: Optional[str] = None
         t_min: Optional[datetime] = None
@@ -216,9 +230,19 @@ class RecencyBias(SearchOperation):
 
         try:
             logger.debug(f"[RecencyBias] Attempting to fetch min/max for field: {field}")
-            oldest, newest = await self._get_min_max(
-                destination, config.collection_id, field, qdrant_filter, logger
-            )
+            bounds = await self._get_cached_min_max(config, field, qdrant_filter, context, logger)
+            if bounds is None:
+                # Recency is non-critical; destination could not be created
+                context["decay_config"] = None
+                if callable(emitter):
+                    try:
+                        await emitter(
+                            "recency_skipped", {"reason": "destination_error"}, op_name=self.name
+                        )
+                    except Exception:
+                        pass
+                return
+            oldest, newest = bounds
             # Emit span details regardless of validity so UI can show what was observed
             if callable(emitter):
                 try:
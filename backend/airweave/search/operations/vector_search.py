@@ -45,8 +45,8 @@ class VectorSearch(SearchOperation):
 
     @property
     def depends_on(self) -> List[str]:
-        """Dependencies - needs embeddings and optionally filters."""
-        return ["embedding", "query_interpretation", "qdrant_filter"]
+        """Dependencies - needs embeddings and optionally filters and recency decay."""
+        return ["embedding", "query_interpretation", "qdrant_filter", "recency"]
 
     async def execute(self, context: Dict[str, Any]) -> None:
         """Execute vector search against Qdrant.
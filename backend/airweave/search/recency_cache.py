@@ -0,0 +1,134 @@
+"""Cache of oldest/newest timestamps for the recency bias operation.
+
+RecencyBias needs the time span of the (optionally filtered) collection for every search.
+That span only changes when a sync writes to the collection, so the bounds are cached per
+(collection, field, filter) and invalidated when a sync job completes.
+
+Syncs may run in a different process than search (e.g. Temporal workers), so invalidation
+bumps a per-collection generation counter in Redis that every process checks on lookup.
+If Redis is unreachable, entries simply expire after the TTL.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from airweave.core.logging import logger
+from airweave.core.redis_client import redis_client
+
+# Upper bound on staleness when a generation bump is missed
+RECENCY_CACHE_TTL_SECONDS = 300
+RECENCY_CACHE_MAX_ENTRIES = 1024
+
+
+@dataclass
+class _Entry:
+    generation: Optional[int]
+    expires_at: float
+    oldest: Optional[datetime]
+    newest: Optional[datetime]
+
+
+class RecencyBoundsCache:
+    """In-process cache of (oldest, newest) timestamps with cross-process invalidation."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = RECENCY_CACHE_TTL_SECONDS,
+        max_entries: int = RECENCY_CACHE_MAX_ENTRIES,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Max age of an entry, regardless of invalidation
+            max_entries: Max number of cached (collection, field, filter) combinations
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple[str, str, str], _Entry] = {}
+
+    @staticmethod
+    def filter_hash(filter_dict: Optional[Dict[str, Any]]) -> str:
+        """Stable hash of a Qdrant filter dict (empty string when unfiltered)."""
+        if not filter_dict:
+            return ""
+        encoded = json.dumps(filter_dict, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    @staticmethod
+    def _generation_key(collection_id: str) -> str:
+        return f"recency_bounds:generation:{collection_id}"
+
+    async def get_generation(self, collection_id: str) -> Optional[int]:
+        """Read the collection's invalidation generation, or None if Redis is unavailable."""
+        try:
+            value = await redis_client.client.get(self._generation_key(collection_id))
+        except Exception as e:
+            logger.debug(f"[RecencyBoundsCache] Generation lookup failed, using TTL only: {e}")
+            return None
+        return int(value) if value else 0
+
+    def get(
+        self, collection_id: str, field: str, filter_hash: str, generation: Optional[int]
+    ) -> Optional[Tuple[Optional[datetime], Optional[datetime]]]:
+        """Return cached (oldest, newest) if fresh for the given generation."""
+        key = (collection_id, field, filter_hash)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stale = entry.expires_at <= time.monotonic() or (
+            generation is not None and entry.generation != generation
+        )
+        if stale:
+            self._entries.pop(key, None)
+            return None
+        return entry.oldest, entry.newest
+
+    def set(
+        self,
+        collection_id: str,
+        field: str,
+        filter_hash: str,
+        generation: Optional[int],
+        oldest: Optional[datetime],
+        newest: Optional[datetime],
+    ) -> None:
+        """Store (oldest, newest) observed at the given generation."""
+        if len(self._entries) >= self.max_entries:
+            self._evict()
+        self._entries[(collection_id, field, filter_hash)] = _Entry(
+            generation=generation,
+            expires_at=time.monotonic() + self.ttl_seconds,
+            oldest=oldest,
+            newest=newest,
+        )
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the oldest inserted ones if still full."""
+        now = time.monotonic()
+        for key in [k for k, e in self._entries.items() if e.expires_at <= now]:
+            del self._entries[key]
+        while len(self._entries) >= self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    async def invalidate(self, collection_id: str) -> None:
+        """Invalidate all cached bounds of a collection in every process."""
+        collection_id = str(collection_id)
+        for key in [k for k in self._entries if k[0] == collection_id]:
+            del self._entries[key]
+        try:
+            await redis_client.client.incr(self._generation_key(collection_id))
+        except Exception as e:
+            logger.warning(
+                f"[RecencyBoundsCache] Could not bump generation for {collection_id}; "
+                f"other processes will refresh after {self.ttl_seconds}s: {e}"
+            )
+
+
+# Global instance
+recency_bounds_cache = RecencyBoundsCache()
@@ -36,3 +36,50 @@ def validate_filter_keys(filter: QdrantFilter, allowed_keys: set[str]) -> bool:
     # TODO: Implement recursive validation of field keys in filter conditions
     # For now, return True to allow all filters
     return True
+
+
+def merge_filter_dicts(a: Dict[str, Any] | None, b: Dict[str, Any] | None) -> Dict[str, Any]:
+    """Merge two Qdrant filter dicts using AND semantics.
+
+    Semantics:
+    - "must" and "must_not" are concatenated (logical AND across both filters)
+    - "should" is combined with a raised minimum_should_match to preserve intent that
+      each original should-group contributes at least one satisfied clause if both have shoulds.
+    - Empty groups are omitted.
+    - Handles None inputs gracefully.
+    """
+
+    def list_or_empty(d: Dict[str, Any] | None, k: str) -> list:
+        if isinstance(d, dict):
+            v = d.get(k)
+            return v if isinstance(v, list) else []
+        return []
+
+    if not a and not b:
+        return {}
+    if not a:
+        return b or {}
+    if not b:
+        return a or {}
+
+    a_should = list_or_empty(a, "should")
+    b_should = list_or_empty(b, "should")
+
+    merged: Dict[str, Any] = {
+        "must": list_or_empty(a, "must") + list_or_empty(b, "must"),
+        "must_not": list_or_empty(a, "must_not") + list_or_empty(b, "must_not"),
+    }
+
+    combined_should = a_should + b_should
+    if combined_should:
+        merged["should"] = combined_should
+        # Preserve AND-like behavior across should groups: if both sides provide shoulds,
+        # require at least one from each side to match. We express this by setting
+        # minimum_should_match to 2 when both non-empty, else 1.
+        if a_should and b_should:
+            merged["minimum_should_match"] = 2
+        else:
+            merged["minimum_should_match"] = 1
+
+    # Remove empty arrays
+    return {k: v for k, v in merged.items() if v not in ([], None)}
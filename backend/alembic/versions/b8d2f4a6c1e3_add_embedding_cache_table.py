@@ -0,0 +1,43 @@
+"""Add embedding_cache table
+
+Revision ID: b8d2f4a6c1e3
+Revises: e5a7c3d9f2b1
+Create Date: 2026-10-16 21:04:17.552930
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b8d2f4a6c1e3"
+down_revision = "e5a7c3d9f2b1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "embedding_cache",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "cache_key",
+            sa.String(),
+            nullable=False,
+            comment="Model, dimensions and SHA-256 of the embedded text",
+        ),
+        sa.Column(
+            "vector",
+            sa.LargeBinary(),
+            nullable=False,
+            comment="Little-endian float32 or float16 vector",
+        ),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("modified_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("cache_key"),
+    )
+
+
+def downgrade():
+    op.drop_table("embedding_cache")
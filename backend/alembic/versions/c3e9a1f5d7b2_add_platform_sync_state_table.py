@@ -0,0 +1,43 @@
+"""Add platform_sync_state table
+
+Revision ID: c3e9a1f5d7b2
+Revises: b8d2f4a6c1e3
+Create Date: 2026-10-16 23:12:40.118305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c3e9a1f5d7b2"
+down_revision = "b8d2f4a6c1e3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "platform_sync_state",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "name",
+            sa.String(),
+            nullable=False,
+            comment="What was synced, e.g. platform_components",
+        ),
+        sa.Column(
+            "fingerprint",
+            sa.String(),
+            nullable=False,
+            comment="Content fingerprint of the synced registry manifest",
+        ),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("modified_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+
+
+def downgrade():
+    op.drop_table("platform_sync_state")
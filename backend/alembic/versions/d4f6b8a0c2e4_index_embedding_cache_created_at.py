@@ -0,0 +1,24 @@
+"""Index embedding_cache by created_at
+
+Revision ID: d4f6b8a0c2e4
+Revises: c3e9a1f5d7b2
+Create Date: 2026-10-16 23:41:08.402917
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "d4f6b8a0c2e4"
+down_revision = "c3e9a1f5d7b2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Expired rows are looked up and deleted by age
+    op.create_index("idx_embedding_cache_created_at", "embedding_cache", ["created_at"])
+
+
+def downgrade():
+    op.drop_index("idx_embedding_cache_created_at", table_name="embedding_cache")
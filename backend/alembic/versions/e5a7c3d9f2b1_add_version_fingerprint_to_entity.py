@@ -0,0 +1,33 @@
+"""Add version_fingerprint to entity table
+
+Revision ID: e5a7c3d9f2b1
+Revises: c60291fb2129
+Create Date: 2026-10-16 09:12:41.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e5a7c3d9f2b1"
+down_revision = "c60291fb2129"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Nullable: existing rows and sources without a remote version signal have none
+    op.add_column(
+        "entity",
+        sa.Column(
+            "version_fingerprint",
+            sa.String(),
+            nullable=True,
+            comment="Source-provided version fingerprint used to skip unchanged downloads",
+        ),
+    )
+
+
+def downgrade():
+    op.drop_column("entity", "version_fingerprint")